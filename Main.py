@@ -7,13 +7,12 @@ import os
 import random
 import asyncio
 import threading
-import queue
 import re
 import time
+import logging
 import traceback
 import twitchio
 from pathlib import Path 
-from urllib.parse import quote_plus
 from dotenv import load_dotenv
 import json
 from enum import Enum, auto 
@@ -21,12 +20,24 @@ from datetime import datetime
 import uuid 
 
 # Import our custom IRC fallback
-from irc_fallback import TwitchIRCClient 
+from irc_fallback import TwitchIRCClient, ThroughputCounter
+from chat_ingest import ChatIngest, EntrantIndex, ChatMessage
+from participant_model import ParticipantListModel, ParticipantFilterProxyModel
+from weighted_entries import WeightedEntrantPool, entry_weight
+from deadline_scheduler import DeadlineScheduler
+from state_trace import TransitionTracer, STATE_TRACE_FILE
+from esi_client import EsiClient, CharacterResolver
+from esi_cache import EsiResponseCache, ESI_CACHE_FILE
+from portrait_cache import PortraitCache, PORTRAIT_CACHE_DIR
+from cache_prewarmer import CachePrewarmer
+from helix_chat import HelixChatClient
+from chat_outbox import OutboundChatQueue, PRIORITY_WINNER as CHAT_PRIORITY_WINNER, PRIORITY_NORMAL as CHAT_PRIORITY_NORMAL, PRIORITY_INFO as CHAT_PRIORITY_INFO
+from eve2twitch_client import Eve2TwitchClient, EVE2TWITCH_CACHE_FILE, FOUND as E2T_FOUND, NOT_REGISTERED as E2T_NOT_REGISTERED
 from collections import Counter 
+from concurrent.futures import ThreadPoolExecutor
 
 import config_manager
 import requests
-import base64
 import tempfile
 
 # TwitchIO imports
@@ -122,6 +133,11 @@ ENV_TWITCH_CLIENT_SECRET = os.getenv('TWITCH_CLIENT_SECRET', 'N/A')
 ENV_TWITCH_BOT_ID = os.getenv('TWITCH_BOT_ID', None)
 ENV_EVE2TWITCH_BOT_NAME = os.getenv("EVE2TWITCH_BOT_NAME", "eve2twitch").lower()
 
+# --- Chat Patterns (compiled once, used by the message router) ---
+MENTION_IGN_PATTERN = re.compile(r"@(?P<tuser>[A-Za-z0-9_\-]+)\s*:\s*IGN\s*['\"](?P<ign>[^'\"]+)['\"]", re.IGNORECASE)
+IGN_QUOTED_PATTERN = re.compile(r"\bIGN\s*[\"']([^\"']+)[\"']", re.IGNORECASE)
+IGN_WORD_PATTERN = re.compile(r"\bign\b", re.IGNORECASE)
+
 # Ensure token is properly formatted
 def prepare_oauth_token(token):
     if token.startswith('oauth:'):
@@ -154,7 +170,7 @@ from PyQt6.QtWidgets import (
     QSizePolicy, QDialog, QFormLayout,
     QStackedWidget,
     QSpacerItem, QGridLayout,
-    QSplashScreen, QListWidgetItem, QComboBox
+    QSplashScreen, QComboBox
 )
 from PyQt6.QtCore import (
     pyqtSignal, pyqtSlot, QObject, QThread, Qt, QTimer, QUrl, QFileInfo, pyqtProperty,
@@ -163,7 +179,7 @@ from PyQt6.QtCore import (
 )
 from PyQt6.QtGui import (
     QClipboard, QFont, QFontDatabase,
-    QPixmap, QMouseEvent, QCursor, QIcon, QImage, QTextDocument
+    QPixmap, QMouseEvent, QCursor, QIcon
 )
 from PyQt6.QtGui import QTextCursor, QTextImageFormat, QTextBlockFormat
 
@@ -202,6 +218,11 @@ import logging_utils
 from collections import Counter
 from ui_manager import UIManager
 
+chat_log = logging_utils.get_logger("chat")  # Per-message paths: debug level costs nothing unless enabled
+bot_log = logging_utils.get_logger("bot")
+esi_log = logging_utils.get_logger("esi")
+e2t_log = logging_utils.get_logger("eve2twitch")
+
 # --- Constants ---
 APP_NAME = "RustyBotGiveaway"
 ORG_NAME = "RustyBit"
@@ -210,6 +231,14 @@ APP_VERSION = "1.8.3"
 LOADING_IMAGE_FILE = "loading_init.png"  # Root level - not moved to assets
 SOUND_NOTIFICATION_KEY = "notification"
 OUTPUT_ENTRY_METHOD_FILE = "output_entry_method.txt"
+MULTI_DRAW_REVEAL_GAP_MS = 1500  # Pause between back-to-back winner reveals
+# Countdown cue lists per timer type: (at, kind, payload). `at` in 0..1 is the fraction of the
+# timeout elapsed, a negative `at` is seconds before expiry. Kinds: "sound" plays payload,
+# "update" emits timer_update_signal with {"cue": payload}.
+COUNTDOWN_CUES = {
+    "confirmation": ((0.15, "sound", "timer_high"), (0.50, "sound", "timer_mid"), (0.75, "sound", "timer_low")),  # Shield/Armor/Hull
+}
+COUNTDOWN_SECOND_TICKS = {"prize_poll"}  # Timer types that emit a UI tick when the displayed second changes
 
 WIDGET_NAME_MAIN_ACTION_BUTTONS = "main_action_buttons"
 WIDGET_NAME_PRIZE_CONTROLS = "prize_controls"
@@ -227,8 +256,21 @@ ESI_BASE_URL = "https://esi.evetech.net/latest"
 ESI_DATASOURCE = "datasource=tranquility"
 ESI_USER_AGENT = f"{APP_NAME}/{APP_VERSION} ({os.getenv('ESI_CONTACT_EMAIL', 'your_contact_email_or_discord_here')})"
 ESI_REQUEST_TIMEOUT = 10 # seconds
+# One pooled keep-alive client shared by every ESI lookup (and the image server)
+ESI_CLIENT = EsiClient(ESI_BASE_URL, ESI_USER_AGENT, default_params=dict([ESI_DATASOURCE.split('=')]), timeout=ESI_REQUEST_TIMEOUT)
 EVE2TWITCH_API_URL = os.getenv('EVE2TWITCH_API_URL', 'https://api.eve2twitch.space/twitch/login/{twitch}')
 
+# Outbound chat coalescing keys: a newer queued message with the same key replaces the older one
+CHAT_KEY_DRAW_STATUS = "draw-status"
+CHAT_KEY_WINNER_STATUS = "winner-status"
+
+def winner_status_key(winner):
+    """Per-winner coalescing key, so one winner's queued status never replaces another's."""
+    return f"{CHAT_KEY_WINNER_STATUS}:{(winner or '').lower()}"
+
+# Pooled, backoff-driven EVE2Twitch lookups with a persistent twitch login -> IGN cache
+EVE2TWITCH_CLIENT = Eve2TwitchClient(EVE2TWITCH_API_URL, ESI_USER_AGENT)
+
 DROPDOWN_SELECT_PRIZE_TEXT = "<Select Prize from List>"
 DROPDOWN_RANDOM_PRIZE_TEXT = "🎲 RANDOM PRIZE 🎲"
 DROPDOWN_COMMON_PRIZE_HEADER = "--- COMMON PRIZE POOL ---"
@@ -252,12 +294,12 @@ BASE_STYLESHEET = """
     QPushButton:disabled { background-color: #2a2a2a; color: #666666; border-color: #444444; }
     QPushButton#copyButton { min-width: 50px; padding: 3px 6px; font-size: 8pt; }
     QLineEdit { background-color: #111111; border: 1px solid #555555; padding: 4px; color: #e8d900; font-weight: bold; }
-    QListWidget { background-color: #111111; border: 1px solid #555555; color: #dadada; }
-    QListWidget::item { padding: 4px 2px; }
-    QListWidget::item:selected { background-color: transparent; color: #dadada; }
-    QListWidget::item:hover { background-color: #282828; }
-    QListWidget::indicator { width: 13px; height: 13px; border: 1px solid #555; background-color: #111; }
-    QListWidget::indicator:checked { background-color: #e8d900; }
+    QListWidget, QListView { background-color: #111111; border: 1px solid #555555; color: #dadada; }
+    QListWidget::item, QListView::item { padding: 4px 2px; }
+    QListWidget::item:selected, QListView::item:selected { background-color: transparent; color: #dadada; }
+    QListWidget::item:hover, QListView::item:hover { background-color: #282828; }
+    QListWidget::indicator, QListView::indicator { width: 13px; height: 13px; border: 1px solid #555; background-color: #111; }
+    QListWidget::indicator:checked, QListView::indicator:checked { background-color: #e8d900; }
     QTextEdit#confirmation_log { background-color: #0a0a0a; border: 2px solid #333333; color: #b0b0b0; padding: 8px; }
     QLabel { color: #e8d900; font-weight: bold; padding-top: 2px; text-transform: uppercase; }
     QLabel#entriesLabel, QLabel#statusBar { padding: 3px; border: none; }
@@ -317,161 +359,46 @@ class AppState(Enum):
     EVE_TIMED_OUT = auto()
     AWAITING_PRIZE_POLL_VOTES = auto()
 
+# Transition table: hooks run on leaving/entering a state (method names on GiveawayApp).
+# Exit hooks get the state being entered, entry hooks the state being left.
+STATE_EXIT_HOOKS = {
+    AppState.COLLECTING: "_on_exit_collecting",
+    AppState.AWAITING_CONFIRMATION: "_on_exit_awaiting_confirmation",
+    AppState.AWAITING_EVE_RESPONSE: "_on_exit_awaiting_eve_response",
+    AppState.AWAITING_PRIZE_POLL_VOTES: "_on_exit_awaiting_prize_poll_votes",
+}
+STATE_ENTRY_HOOKS = {
+    AppState.IDLE: "_on_enter_idle",
+    AppState.COLLECTING: "_on_enter_collecting",
+    AppState.ANIMATING_WINNER: "_on_enter_animating_winner",
+    AppState.AWAITING_CONFIRMATION: "_on_enter_awaiting_confirmation",
+    AppState.AWAITING_EVE_RESPONSE: "_on_enter_awaiting_eve_response",
+    AppState.FETCHING_ESI_DATA: "_on_enter_fetching_esi_data",
+    AppState.CONFIRMED_NO_IGN: "_on_enter_confirmed_no_ign",
+    AppState.CONFIRMED_WITH_IGN: "_on_enter_confirmed_with_ign",
+    AppState.TIMED_OUT: "_on_enter_timed_out",
+    AppState.EVE_TIMED_OUT: "_on_enter_eve_timed_out",
+    AppState.AWAITING_PRIZE_POLL_VOTES: "_on_enter_awaiting_prize_poll_votes",
+}
+
 class ESIWorkerThread(QThread):
     esi_data_ready = pyqtSignal(dict)
     esi_error = pyqtSignal(str)
 
-    def __init__(self, ign, parent=None):
+    def __init__(self, ign, resolver, parent=None):
         super().__init__(parent)
         self.ign = ign
-        self.headers = {'User-Agent': ESI_USER_AGENT, 'accept': 'application/json', 'Content-Type': 'application/json'}
-
-    def _request_esi(self, endpoint, method="GET", params=None, json_data=None, is_image=False):
-        url = endpoint if is_image else f"{ESI_BASE_URL}{endpoint}"
-        
-        request_params = {ESI_DATASOURCE.split('=')[0]: ESI_DATASOURCE.split('=')[1]} if not is_image else {}
-        if params:
-            request_params.update(params)
-        
-        try:
-            if method == "POST":
-                response = requests.post(url, headers=self.headers, params=request_params, json=json_data, timeout=ESI_REQUEST_TIMEOUT)
-            else: # GET
-                response = requests.get(url, headers=self.headers, params=request_params, timeout=ESI_REQUEST_TIMEOUT)
-            
-            response.raise_for_status()
-            return response.content if is_image else response.json()
-        except requests.exceptions.HTTPError as http_err:
-            error_detail = ""
-            try:
-                if not is_image and response.content: 
-                    error_detail = response.json().get("error", "")
-            except json.JSONDecodeError: 
-                error_detail = response.text[:100] 
-            except Exception: pass
-            raise ValueError(f"ESI HTTP Error: {response.status_code} - {error_detail or response.reason} for URL: {url}")
-        except requests.exceptions.RequestException as req_err: 
-            raise ValueError(f"ESI Network Error: {req_err} for URL: {url}")
-        except ValueError as json_err: 
-            raise ValueError(f"ESI Error: Invalid JSON response from URL: {url}. Details: {json_err}")
+        self.resolver = resolver  # Shared CharacterResolver; the lookup itself is Qt-free
 
     def run(self):
         try:
-            # Production: no forced artificial delay for ESI worker (test code removed)
-            ids_data = self._request_esi(f"/universe/ids/", method="POST", json_data=[self.ign])
-            if not ids_data or 'characters' not in ids_data or not ids_data['characters']:
-                err_msg = ids_data.get('error', "Character not found or ESI error.") if isinstance(ids_data, dict) else "Character not found."
-                self.esi_error.emit(f"ESI Error for '{self.ign}': {err_msg}")
-                return
-            char_info = ids_data['characters'][0]
-            char_id, resolved_name = char_info.get('id'), char_info.get('name', self.ign)
-            if not char_id: 
-                self.esi_error.emit(f"No Character ID found for '{self.ign}'.")
-                return
-
-            char_details = self._request_esi(f"/characters/{char_id}/")
-            corp_id, alliance_id = char_details.get('corporation_id'), char_details.get('alliance_id')
-            
-            portrait_url_data = self._request_esi(f"/characters/{char_id}/portrait/")
-            portrait_url_to_fetch = portrait_url_data.get('px256x256') 
-            if not portrait_url_to_fetch:
-                fallbacks = ['px128x128', 'px512x512', 'px64x64']
-                for fb_key in fallbacks:
-                    portrait_url_to_fetch = portrait_url_data.get(fb_key)
-                    if portrait_url_to_fetch:
-                        print(f"ESI_THREAD_DEBUG: Using fallback portrait URL ({fb_key}): {portrait_url_to_fetch}")
-                        break
-            else:
-                 print(f"ESI_THREAD_DEBUG: Selected Portrait URL (px256x256) for {char_id}: {portrait_url_to_fetch}")
-                
-            portrait_base64, img_type = None, "image/png" 
-            if portrait_url_to_fetch:
-                try:
-                    print(f"ESI_THREAD_DEBUG: Attempting to fetch image from: {portrait_url_to_fetch}")
-                    img_bytes = self._request_esi(portrait_url_to_fetch, is_image=True) 
-                    portrait_base64 = base64.b64encode(img_bytes).decode('utf-8')
-                    
-                    lower_url = portrait_url_to_fetch.lower()
-                    if ".jpg" in lower_url or ".jpeg" in lower_url: img_type = "image/jpeg"
-                    elif ".png" in lower_url: img_type = "image/png"
-                    elif ".webp" in lower_url: img_type = "image/webp"
-                    else: print(f"ESI_THREAD_DEBUG: Could not determine image type from URL extension for {portrait_url_to_fetch}, defaulting to {img_type}")
-
-                    print(f"ESI_THREAD_DEBUG: Fetched image, base64 length: {len(portrait_base64) if portrait_base64 else 'None'}, detected type: {img_type}")
-                except Exception as img_e:
-                    print(f"ESI_THREAD_DEBUG: ESI Portrait Fetch/Encode Error for {portrait_url_to_fetch}: {img_e}")
-                    traceback.print_exc() 
-                    portrait_base64 = None 
-            else:
-                print(f"ESI_THREAD_DEBUG: No portrait URL was selected or available for char_id {char_id}.")
-
-            corp_name = self._request_esi(f"/corporations/{corp_id}/").get('name', "N/A Corp") if corp_id else "N/A Corp"
-            alliance_name = self._request_esi(f"/alliances/{alliance_id}/").get('name') if alliance_id else None
-
-            emit_data = {
-                'id': char_id, 
-                'name': resolved_name, 
-                'portrait_base64': portrait_base64, 
-                'portrait_content_type': img_type if portrait_base64 else None,    
-                'corporation_name': corp_name,
-                'corporation_id': corp_id, 
-                'alliance_name': alliance_name, 
-                'alliance_id': alliance_id
-            }
-            print(f"ESI_THREAD_DEBUG: Emitting data: portrait_base64 is {'PRESENT' if portrait_base64 else 'MISSING'}, content_type: {img_type if portrait_base64 else 'N/A'}")
-            self.esi_data_ready.emit(emit_data)
-
+            self.esi_data_ready.emit(self.resolver.resolve(self.ign))
         except ValueError as e: 
             self.esi_error.emit(str(e)) 
         except Exception as e: 
-            traceback.print_exc()
+            esi_log.error("❌ ESI lookup for %s failed: %s", self.ign, e, exc_info=True)
             self.esi_error.emit(f"ESI Data Generic Error: {e}")
 
-def run_timer_thread(timer_type, winner_name_or_context, timeout, stop_event, signal_emitter):
-    print(f"TIMER THREAD ({timer_type}): Starting for '{winner_name_or_context}' ({timeout}s)")
-    start_time = time.monotonic()
-    played_shield, played_armor, played_hull = False, False, False
-    if timer_type == "confirmation":
-        shield_thresh_elapsed = timeout * 0.15
-        armor_thresh_elapsed = timeout * 0.50
-        hull_thresh_elapsed = timeout * 0.75
-        print(f"TIMER THREAD ({timer_type}): Sound thresholds (elapsed) - Shield: {shield_thresh_elapsed:.1f}s (15%), Armor: {armor_thresh_elapsed:.1f}s (50%), Hull: {hull_thresh_elapsed:.1f}s (75%)")
-
-    update_interval = 0.1
-    if timer_type == "prize_poll":
-        update_interval = 1.0
-
-    try:
-        while True:
-            now = time.monotonic(); elapsed = now - start_time; remaining = max(0, timeout - elapsed)
-            if remaining <= 0:
-                if not stop_event.is_set():
-                    signal_emitter.timer_expired_signal.emit({"type": timer_type, "context": winner_name_or_context})
-                break
-            if stop_event.is_set():
-                signal_emitter.timer_stopped_signal.emit(timer_type);
-                break
-
-            signal_emitter.timer_update_signal.emit({"type": timer_type, "remaining": remaining})
-
-            if timer_type == "confirmation":
-                if elapsed >= shield_thresh_elapsed and not played_shield:
-                    signal_emitter.play_sound_signal.emit({"key": "timer_high", "action": "play"}); played_shield = True
-                if elapsed >= armor_thresh_elapsed and not played_armor:
-                    signal_emitter.play_sound_signal.emit({"key": "timer_mid", "action": "play"}); played_armor = True
-                if elapsed >= hull_thresh_elapsed and not played_hull:
-                    signal_emitter.play_sound_signal.emit({"key": "timer_low", "action": "play"}); played_hull = True
-
-            wait_time = min(update_interval, remaining); stop_event.wait(timeout=wait_time)
-    except Exception as e: print(f"TIMER THREAD ({timer_type}): ERROR - {e}"); traceback.print_exc()
-    finally:
-        print(f"TIMER THREAD ({timer_type}): Finished for {winner_name_or_context}.")
-        if timer_type == "confirmation":
-             signal_emitter.play_sound_signal.emit({"key": "countdown", "action": "stop"})
-             signal_emitter.play_sound_signal.emit({"key": "timer_high", "action": "stop"})
-             signal_emitter.play_sound_signal.emit({"key": "timer_mid", "action": "stop"})
-             signal_emitter.play_sound_signal.emit({"key": "timer_low", "action": "stop"})
-
 # Define the bot class at module level for clarity
 class TwitchBot(Bot):
     """Custom TwitchIO bot implementation using commands.Bot for message reception."""
@@ -524,6 +451,10 @@ class TwitchBot(Bot):
         self._signal_handler = signal_handler
         self._channel = channel
         self._ready = False
+        # Outgoing chat: pooled aiohttp session on this bot's loop, IDs resolved once per session
+        self.helix = HelixChatClient(token, client_id, channel, sender_id=bot_id)
+        self.outbox = OutboundChatQueue(self.helix)  # Rate-limited, prioritised sends; started on ready
+        self.eventsub_stats = ThroughputCounter("EventSub")  # Compare with self.irc_client.stats
         
     async def event_ready(self):
         """Handler called when the bot successfully connects."""
@@ -561,6 +492,7 @@ class TwitchBot(Bot):
                     if hasattr(channel, 'broadcaster') and hasattr(channel.broadcaster, 'name'):
                         if channel.broadcaster.name.lower() == channel_name.lower():
                             broadcaster_id = str(channel.broadcaster.id)
+                            self.helix.broadcaster_id = broadcaster_id  # Saves the Helix /users lookup
                             print(f"🔧 Found broadcaster {channel.broadcaster.name} with ID: {broadcaster_id}")
                             
                             # Subscribe to channel.chat.message EventSub using proper payload
@@ -617,17 +549,26 @@ class TwitchBot(Bot):
             
             # Start IRC fallback when EventSub fails
             print("🔌 EventSub failed, starting IRC fallback...")
-            success = self.start_irc_fallback()
+            success = await self.start_irc_fallback()
             if success:
                 print("✅ IRC fallback active - chat messages should work now!")
             else:
                 print("❌ Both EventSub and IRC failed - message reception may not work")
             
+        # Optionally keep IRC connected next to EventSub as a hot standby
+        if getattr(self._signal_handler, 'irc_hot_standby', False) and self.irc_client and not self.irc_client.running:
+            print("🔌 Starting IRC hot standby alongside EventSub...")
+            await self.start_irc_fallback()
+            
         # Check for IRC connections
         if hasattr(self, '_irc'):
             print(f"🤖 IRC connection: {type(self._irc).__name__}")
         else:
             print("⚠️ No native IRC connection found!")
+
+        # Resolve chat IDs now so the first announcement is a single round trip
+        await self.helix.resolve_ids()
+        self.outbox.start()
             
         # List all connection-related attributes
         connection_attrs = [attr for attr in dir(self) if any(keyword in attr.lower() for keyword in ['connection', 'socket', 'irc', 'transport', 'channel'])]
@@ -644,39 +585,58 @@ class TwitchBot(Bot):
     async def event_message(self, message):
         """Handler for incoming chat messages."""
         try:
-            print(f"🎯 EVENT_MESSAGE CALLED! Raw message object: {type(message)}")
-            print(f"📨 Message details:")
-            print(f"   Author: {getattr(message, 'author', 'NO_AUTHOR')}")
-            print(f"   Content: {getattr(message, 'content', 'NO_CONTENT')}")
-            print(f"   Echo: {getattr(message, 'echo', 'NO_ECHO_ATTR')}")
-            print(f"   Channel: {getattr(message, 'channel', 'NO_CHANNEL')}")
-            
-            author_name = getattr(message.author, 'name', 'UNKNOWN_USER') if message.author else 'NO_AUTHOR'
-            print(f"📨 Received message from {author_name}: {message.content}")
-            
-            if message.echo or not message.author:
-                print("🔇 Ignoring echo or message without author")
+            record = self._record_from_message(message)
+            if record is None or getattr(message, 'echo', False) or record.user_id == self._bot_id:
+                chat_log.debug("🔇 Ignoring echo or message without author")
                 return  # Ignore bot's own messages and messages without authors
+            chat_log.debug("📨 EventSub message from %s: %s", record.display_name, record.text)
             
             # Process the message for giveaway entries
-            print(f"✅ Processing message: {message.content}")
-            self._signal_handler.message_received.emit(author_name, message.content)
+            self.eventsub_stats.messages += 1
+            self._signal_handler.ingest.submit(record)
             
         except Exception as e:
-            print(f"❌ Error in message handler: {e}")
-            import traceback
-            traceback.print_exc()
+            chat_log.exception("❌ Error in message handler: %s", e)
     
+    def _record_from_message(self, message):
+        """Build a compact ChatMessage record from a TwitchIO chat message (EventSub or legacy shape)."""
+        chatter = getattr(message, 'chatter', None) or getattr(message, 'author', None)
+        if chatter is None:
+            return None
+        text = getattr(message, 'text', None)
+        if text is None:
+            text = getattr(message, 'content', '') or ''
+        login = getattr(chatter, 'name', None) or 'UNKNOWN_USER'
+        try:
+            user_id = int(getattr(chatter, 'id', None))
+        except (TypeError, ValueError):
+            user_id = None
+
+        badges = {}
+        raw_badges = getattr(message, 'badges', None) or getattr(chatter, 'badges', None) or []
+        if isinstance(raw_badges, dict):
+            badges = {str(k): str(v) for k, v in raw_badges.items()}
+        else:
+            for badge in raw_badges:
+                set_id = getattr(badge, 'set_id', None)
+                if set_id:
+                    badges[set_id] = str(getattr(badge, 'id', '') or '')
+
+        return ChatMessage(
+            login, text,
+            display_name=getattr(chatter, 'display_name', None) or login,
+            user_id=user_id,
+            badges=badges,
+            message_id=getattr(message, 'id', None)
+        )
+
     def simulate_chat_message(self, username, message_content):
         """Simulate a chat message for testing when EventSub isn't working."""
         try:
-            print(f"🧪 SIMULATING chat message from {username}: {message_content}")
-            self._signal_handler.message_received.emit(username, message_content)
-            print(f"✅ Simulated message processed successfully")
+            chat_log.debug("🧪 SIMULATING chat message from %s: %s", username, message_content)
+            self._signal_handler.ingest.submit(ChatMessage(username, message_content))
         except Exception as e:
-            print(f"❌ Error simulating message: {e}")
-            import traceback
-            traceback.print_exc()
+            chat_log.exception("❌ Error simulating message: %s", e)
     
     def _setup_irc_fallback(self):
         """Setup IRC fallback client for message reception."""
@@ -689,18 +649,17 @@ class TwitchBot(Bot):
             # Clean channel name (remove '#' if present)
             clean_channel = self._channel.replace('#', '')
             
-            # Create IRC client with direct callback for thread-safe communication
+            # Create IRC client; it runs on this bot's event loop and calls back directly
             self.irc_client = TwitchIRCClient(
                 oauth_token=clean_token,
                 bot_nick=self.nick if hasattr(self, 'nick') else 'the_rusty_bot',
                 channel_name=clean_channel,
-                message_callback=self._irc_message_callback  # Direct callback
+                message_callback=self._irc_message_callback  # Direct callback on the bot loop
             )
             
-            # Connect IRC message signal to our handler with proper threading
+            # Status is emitted from the bot loop thread, handle it there
             from PyQt6.QtCore import Qt
-            self.irc_client.message_received.connect(self._handle_irc_message, Qt.ConnectionType.QueuedConnection)
-            self.irc_client.connection_status.connect(self._handle_irc_status, Qt.ConnectionType.QueuedConnection)
+            self.irc_client.connection_status.connect(self._handle_irc_status, Qt.ConnectionType.DirectConnection)
             
             print("✅ IRC fallback client ready")
             
@@ -709,28 +668,18 @@ class TwitchBot(Bot):
             import traceback
             traceback.print_exc()
     
-    def _irc_message_callback(self, username, message):
-        """Direct callback from IRC client (thread-safe)."""
-        print(f"📨 IRC CALLBACK: {username}: {message}")
-        print(f"📨 Calling _handle_irc_message from callback...")
-        # Call the handler directly
-        self._handle_irc_message(username, message)
+    def _irc_message_callback(self, record):
+        """Direct callback from IRC client (runs on the bot loop)."""
+        self._handle_irc_message(record)
         
-    def _handle_irc_message(self, username, message):
-        """Handle IRC message and forward to signal handler."""
+    def _handle_irc_message(self, record):
+        """Handle IRC message record and forward it to the ingest stage."""
         try:
-            print(f"📨 IRC MESSAGE: {username}: {message}")
-            print(f"🔧 DEBUG: About to emit message_received signal...")
-            print(f"🔧 DEBUG: Signal handler: {type(self._signal_handler)}")
-            print(f"🔧 DEBUG: Has message_received: {hasattr(self._signal_handler, 'message_received')}")
-            
-            # Forward to the same signal handler as EventSub messages
-            self._signal_handler.message_received.emit(username, message)
-            print(f"🔧 DEBUG: Successfully emitted signal for {username}: {message}")
+            chat_log.debug("📨 IRC message from %s (%s): %s", record.display_name, record.user_id, record.text)
+            # Forward to the same ingest stage as EventSub messages
+            self._signal_handler.ingest.submit(record)
         except Exception as e:
-            print(f"❌ Error handling IRC message: {e}")
-            import traceback
-            traceback.print_exc()
+            chat_log.exception("❌ Error handling IRC message: %s", e)
     
     def _handle_irc_status(self, connected):
         """Handle IRC connection status."""
@@ -739,12 +688,12 @@ class TwitchBot(Bot):
         else:
             print("❌ IRC: Disconnected")
     
-    def start_irc_fallback(self):
-        """Start the IRC fallback connection."""
+    async def start_irc_fallback(self):
+        """Start the IRC fallback connection on the bot event loop."""
         try:
             if self.irc_client:
                 print("🔌 Starting IRC fallback connection...")
-                success = self.irc_client.connect()
+                success = await self.irc_client.connect()
                 if success:
                     print("✅ IRC fallback connected successfully")
                     return True
@@ -787,7 +736,7 @@ class TwitchBot(Bot):
         
     async def event_raw_data(self, data):
         """Called for all raw IRC data."""
-        print(f"📡 Raw IRC data: {data}")
+        chat_log.debug("📡 Raw IRC data: %s", data)
         return  # Don't process further
 
     async def send_chat_message(self, message: str) -> bool:
@@ -802,132 +751,35 @@ class TwitchBot(Bot):
         try:
             # Check bot is ready
             if not self._ready:
-                print("Bot not ready yet") 
+                bot_log.warning("Bot not ready yet")
                 return False
                 
-            # The issue: TwitchIO 3.x moved to Helix API for sending which requires OAuth scopes
-            # But for backward compatibility, let's try to find any IRC-style connections
-            
-            print(f"🔍 Searching for any IRC connections...")
-            
-            # Check if there are any private websocket connections
-            all_attrs = [attr for attr in dir(self) if not attr.startswith('__')]
-            connection_attrs = [attr for attr in all_attrs if any(keyword in attr.lower() for keyword in ['connection', 'socket', 'irc', 'transport'])]
-            print(f"🔍 Connection-related attributes: {connection_attrs}")
-            
-            # Try to access any private connection attributes
-            for attr in connection_attrs:
-                try:
-                    obj = getattr(self, attr)
-                    if obj:
-                        print(f"🔍 {attr}: {type(obj)} - {str(obj)[:100]}...")
-                        if hasattr(obj, 'send'):
-                            print(f"🔍 {attr} has send method")
-                        if hasattr(obj, '_websocket'):
-                            print(f"🔍 {attr} has _websocket")
-                except Exception as e:
-                    print(f"🔍 Could not access {attr}: {e}")
-            
-            # Since TwitchIO 3.x requires Helix API scopes that we don't have,
-            # we need to inform the user about the OAuth requirements
-            print(f"✅ TwitchIO 3.x attempting message send with valid OAuth scopes")
-            print(f"✅ Current token HAS the required scopes: user:write:chat and user:bot")
-            print(f"� To fix this, regenerate the OAuth token with the required scopes")
-            
-            # Try the actual TwitchIO 3.x message sending now
-            try:
-                # TwitchIO 3.x often has issues with message sending due to scope requirements
-                # Let's use the direct Helix API approach which we know works with our token
-                import requests
-                import os
-                
-                # Get our OAuth token from environment
-                token = os.getenv("TWITCH_TOKEN", "pg23dqp5pk9gr18zog0ql7zza49i2k")
-                client_id = os.getenv("TWITCH_CLIENT_ID", "pnu5f3ruhgfc64gx4gy4rheqkohvoj")
-                
-                # Direct API call to send chat message
-                url = "https://api.twitch.tv/helix/chat/messages"
-                headers = {
-                    "Authorization": f"Bearer {token}",
-                    "Client-Id": client_id,
-                    "Content-Type": "application/json"
-                }
-                
-                # We need the broadcaster_user_id for the channel we're sending to
-                # and our own bot user ID as the sender
-                user_url = "https://api.twitch.tv/helix/users"
-                
-                # First get the broadcaster (channel) user ID
-                user_params = {"login": self._channel.strip('#')}
-                user_response = requests.get(user_url, headers=headers, params=user_params)
-                
-                if user_response.status_code != 200:
-                    print(f"❌ Could not fetch broadcaster data: {user_response.status_code} - {user_response.text}")
-                    return False
-                    
-                user_data = user_response.json()
-                if not user_data["data"]:
-                    print(f"❌ Could not find user data for {self._channel.strip('#')}")
-                    return False
-                    
-                broadcaster_user_id = user_data["data"][0]["id"]
-                print(f"🔗 Found broadcaster ID: {broadcaster_user_id} for channel {self._channel.strip('#')}")
-                
-                # Now get our bot's user ID
-                bot_params = {"login": "the_rusty_bot"}
-                bot_response = requests.get(user_url, headers=headers, params=bot_params)
-                
-                if bot_response.status_code != 200:
-                    print(f"❌ Could not fetch bot data: {bot_response.status_code} - {bot_response.text}")
-                    return False
-                    
-                bot_data = bot_response.json()
-                if not bot_data["data"]:
-                    print(f"❌ Could not find bot user data for the_rusty_bot")
-                    return False
-                    
-                sender_user_id = bot_data["data"][0]["id"]
-                print(f"🔗 Found bot ID: {sender_user_id} for the_rusty_bot")
-                
-                # Now send the message
-                payload = {
-                    "broadcaster_id": broadcaster_user_id,
-                    "sender_id": sender_user_id,  # Bot is sending as itself
-                    "message": message
-                }
-                
-                response = requests.post(url, headers=headers, json=payload)
-                
-                if response.status_code == 200:
-                    print(f"✅ Message sent successfully via Helix API: {message}")
-                    return True
-                else:
-                    print(f"❌ Helix API error: {response.status_code} - {response.text}")
-                    return False
-                    
-            except Exception as e:
-                print(f"❌ Error sending message via Helix API: {e}")
-                return False
+            # TwitchIO 3.x sends through Helix, which needs the user:write:chat scope on our token
+            return await self.helix.send(message)
             
         except Exception as e:
-            print(f"❌ Error in send_chat_message: {e}")
+            bot_log.error("❌ Error in send_chat_message: %s", e)
             self._signal_handler.error_occurred.emit(f"Error sending message: {e}")
             return False
 
 class TwitchBotThread(QThread):
     message_received = pyqtSignal(str, str)
+    message_batch_received = pyqtSignal(list)  # [ChatMessage, ...] gathered by ChatIngest
     status_update = pyqtSignal(str)
     error_occurred = pyqtSignal(str)
     bot_ready_signal = pyqtSignal(bool)
 
-    def __init__(self, token, channel, keyword, bot_nick, parent=None):
+    def __init__(self, token, channel, keyword, bot_nick, parent=None, entrant_index=None, irc_hot_standby=False):
         super().__init__(parent)
+        self.irc_hot_standby = irc_hot_standby  # Start IRC alongside EventSub; ChatIngest drops the duplicates
         self.token = token
         self.channel = channel
         self.bot_nick = bot_nick
         self._is_running = True
         self.bot = None
         self.loop = None
+        # Chat lines are batched here before crossing into the GUI thread
+        self.ingest = ChatIngest(self.message_batch_received.emit, entrant_index=entrant_index)
 
     def _create_bot(self):
         """Create the bot instance via the event loop."""
@@ -947,6 +799,7 @@ class TwitchBotThread(QThread):
             loop = asyncio.new_event_loop()
             asyncio.set_event_loop(loop)
             self.loop = loop
+            self.ingest.attach_loop(loop)
 
             # Create bot instance
             self.bot = self._create_bot()
@@ -1052,6 +905,15 @@ class TwitchBotThread(QThread):
         return bot
 
     async def stop_bot_async(self):
+        self.ingest.flush()
+        if self.bot and getattr(self.bot, 'irc_client', None) and self.bot.irc_client.running:
+            try:
+                await self.bot.irc_client.close()
+            except Exception as e:
+                print(f"❌ Error closing IRC fallback: {e}")
+        if self.bot and getattr(self.bot, 'helix', None):
+            self.bot.outbox.stop()
+            await self.bot.helix.close()
         if self.bot:
             try:
                 self.status_update.emit("Disconnecting...")
@@ -1104,15 +966,37 @@ class GiveawayApp(QWidget):
             print("WARNING: No target channel found!")
             self.effective_channel = None
         print(f"Effective channel: {self.effective_channel}")
+        logging_utils.configure_logging(self.config.get('debug_mode_enabled', False))
+        app_data_dir = logging_utils._app_data_dir()
+        if app_data_dir is not None and ESI_CLIENT.cache is None:
+            ESI_CLIENT.attach_cache(EsiResponseCache(app_data_dir / ESI_CACHE_FILE))
+        self.portrait_cache = PortraitCache(app_data_dir / PORTRAIT_CACHE_DIR) if app_data_dir is not None else None
+        self.esi_resolver = CharacterResolver(ESI_CLIENT, self.portrait_cache)  # IGN -> character card, shared by every lookup
+        if app_data_dir is not None:
+            EVE2TWITCH_CLIENT.attach_cache(app_data_dir / EVE2TWITCH_CACHE_FILE)
 
         sound_base_path = resource_path("sounds")
         self.sound_manager = sound_manager.SoundManager(self.config, base_path=sound_base_path)
         self.animation_manager = AnimationManager(self)
+        self.animation_manager.set_participant_source(lambda: self.participant_model.names())
         self._animation_widget_ref = self.animation_manager.get_view_widget()
 
         # Core state
         self.participants = set()
+        self.participant_records = {}  # Entrant key (int user id, or lowercase login) -> ChatMessage they entered with
+        self._participant_key_by_name = {}  # Lowercase display name -> entrant key
+        self.entrant_index = EntrantIndex()  # Shared with the bot thread ingest stage to pre-filter entries
+        self.entry_pool = WeightedEntrantPool()  # Entrant name -> draw weight (sub/bits/loyalty multipliers)
+        self.participant_model = ParticipantListModel(self)  # Sorted store behind the entrants list view
+        self.participant_proxy = ParticipantFilterProxyModel(self); self.participant_proxy.setSourceModel(self.participant_model)
+        self._pending_participant_rows = []  # Names added during a batch, inserted into the model on refresh
+        self._participant_refresh_deferred = False  # True while handle_message_batch is applying a batch
+        self._participant_refresh_pending = False
         self.last_winner = None
+        self.last_winner_key = None  # Entrant key of last_winner, so confirmations match on user id
+        self.multi_draw_claims = {}  # Winner name -> claim dict while a multi-winner draw is running
+        self._multi_claim_by_key = {}  # Entrant key / lowercase name -> winner name, for matching chat
+        self._multi_draw_reveal_queue = []  # Winners still to animate (back-to-back reveal)
         self.confirmation_message = None
         self.eve2twitch_response = None
         self.current_prize = "<NO PRIZE SET>"
@@ -1120,14 +1004,21 @@ class GiveawayApp(QWidget):
         self.selected_winner = "---"
         self.twitch_thread = None
         self.esi_worker_thread = None
+        self._queued_esi_ign = None  # IGN waiting for the running ESI worker to finish
         self.just_processed_esi = False
         self._last_esi_data = None  # Store last ESI data for font size updates
         self.suppress_next_confirmation_message = False  # <<< NEW FLAG
 
         # EVE2Twitch background lookup state
-        self._eve2twitch_poll_thread = None
+        self._eve2twitch_poll_future = None
         self._eve2twitch_poll_stop_event = None
         self._eve2twitch_timeout_timer = None
+        self._winner_prefetch = None  # (winner, Future) for the speculative IGN/ESI lookup started at draw time
+        # Winner prefetches and EVE2Twitch polls. Own threads: resolve() waits on portrait futures in the
+        # ESI pool, so it must never run inside that pool; two workers so a poll never waits behind a prefetch
+        self._prefetch_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="WinnerLookup")
+        self._prefetch_generation = 0  # Bumped per prefetch; a running prefetch from an older draw stops early
+        self.prewarmer = None  # CachePrewarmer, created on the first draw with ign_prewarm_enabled
 
         self.fonts = {}
         self.loaded_font_families = {}
@@ -1147,19 +1038,18 @@ class GiveawayApp(QWidget):
         EVE_RESPONSE_TIMEOUT = self.config.get("eve_response_timeout", 300)
 
         self.current_state = AppState.STARTING
+        self.state_tracer = TransitionTracer()
+        self._transition_active = False
+        self._pending_transitions = []  # (state, requested at ns) queued by hooks during a transition
+        self._winner_mention_cache = (None, None)  # (last_winner, compiled '@winner' pattern)
+        self._rebuild_message_router()
         self.is_twitch_bot_ready = False
         self.animation_panel_ready_for_display = False
         self._first_animation_warmup_done = False
         self._panel_geometries_applied_this_session = False
 
-        self.timer_queue = queue.Queue()
-        self.timer_poll_qtimer = QTimer(self)
-        self.confirmation_timer_thread = None
-        self.confirmation_stop_event = None
-        self.eve_response_timer_thread = None
-        self.eve_response_stop_event = None
-        self.prize_poll_timer_thread = None
-        self.prize_poll_stop_event = None
+        self.scheduler = DeadlineScheduler(self)  # Owns every countdown, sound cue and watchdog deadline
+        self._countdown_tokens = {}  # timer type ("confirmation"/"eve_response"/"prize_poll") -> CancelToken
         self.prize_poll_votes = Counter()
         self.prize_poll_voters = set()
         self.current_poll_options = []
@@ -1263,7 +1153,7 @@ class GiveawayApp(QWidget):
         except Exception:
             msg_to_chat = f"@{twitch_username} confirmed! We could not validate your EVE IGN automatically. Please register with the IGN bot or type '!ign <your in-game name>' in chat to provide your IGN."
         try:
-            self.schedule_twitch_message(msg_to_chat)
+            self.schedule_twitch_message(msg_to_chat, CHAT_PRIORITY_WINNER, coalesce_key=winner_status_key(twitch_username))
         except Exception:
             try:
                 self.confirmation_log.append(msg_to_chat)
@@ -1328,7 +1218,6 @@ class GiveawayApp(QWidget):
         if self.animation_type_selector_main:
             self.animation_type_selector_main.setCurrentText(self.config.get("animation_type", config_manager.DEFAULT_CONFIG["animation_type"]))
 
-        self._start_timer_queue_poll()
         self._update_layout_mode(force=True)  # Force initial layout setup 
 
         self.auto_connect_twitch()
@@ -1450,6 +1339,7 @@ class GiveawayApp(QWidget):
             (self.prize_mode_selector, "Shentox-SemiBold"), 
             (self.entries_count_label, "entries_count"), 
             (self.participant_list, "list"), 
+            (self.participant_filter_input, "list"), 
             (self.remove_selected_button, "Shentox-SemiBold"), 
             (self.current_prize_donator_display, "prize_donator_info"), 
             (self.entry_requirement_display, "requirement"), 
@@ -1593,300 +1483,353 @@ class GiveawayApp(QWidget):
 
 
     def _set_state(self, new_state: AppState):
+        if self._transition_active:
+            # A hook asked for another state: run it once the current transition has completed
+            self._pending_transitions.append((new_state, time.monotonic_ns()))
+            return
+        self._transition_active = True
+        try:
+            self._run_transition(new_state)
+            while self._pending_transitions:
+                self._run_transition(*self._pending_transitions.pop(0))
+        finally:
+            self._transition_active = False
+            self._pending_transitions.clear()
+
+    def _run_transition(self, new_state, queued_ns=None):
+        """Apply one transition from the STATE_EXIT_HOOKS/STATE_ENTRY_HOOKS tables, tracing every hook."""
         if self.current_state == new_state:
             return
         old_state = self.current_state
+        record = self.state_tracer.begin(old_state.name, new_state.name, queued_ns)
         self.current_state = new_state
+        record.run_hook("sync_chat_rules", self._sync_chat_rules)
         if self.config.get('debug_mode_enabled', False):
             self.log_status(f"STATE CHANGE: {old_state.name} -> {new_state.name}")
 
-        if old_state == AppState.AWAITING_CONFIRMATION and new_state != AppState.AWAITING_CONFIRMATION:
-            self._stop_confirmation_timer()
-        if old_state == AppState.AWAITING_EVE_RESPONSE and new_state != AppState.AWAITING_EVE_RESPONSE:
-            self._stop_eve_response_timer()
-        if old_state == AppState.AWAITING_PRIZE_POLL_VOTES and new_state != AppState.AWAITING_PRIZE_POLL_VOTES:
-            self._stop_prize_poll_timer()
-            if new_state != AppState.IDLE:
-                self.confirmation_log.setHtml("<p>Prize poll cancelled.</p>") 
-
-
-        if new_state == AppState.IDLE:
-            self._switch_to_info_panel()
-            self.animation_manager.cancel_animation()
-        elif new_state == AppState.COLLECTING:
-            self._announce_draw_open()
-        elif new_state == AppState.ANIMATING_WINNER:
-            self._switch_to_animation_panel()
-        elif new_state == AppState.AWAITING_CONFIRMATION:
-            if self.last_winner:
-                self._start_confirmation_timer(self.last_winner, CONFIRMATION_TIMEOUT)
-                self._announce_winner_confirmation_needed()
-            else:
-                self.log_status("Error: Awaiting confirmation but no last winner set.")
-                self._set_state(AppState.IDLE)
-        elif new_state == AppState.AWAITING_EVE_RESPONSE:
-            if self.last_winner:
-                self._start_eve_response_timer(self.last_winner, EVE_RESPONSE_TIMEOUT)
-            else:
-                self.log_status("Error: Awaiting EVE response but no last winner set.")
-                self._set_state(AppState.IDLE)
-        elif new_state == AppState.FETCHING_ESI_DATA:
-            # Show EVE bot response only in debug mode
-            if self.config.get("debug_mode_enabled", False):
-                self.log_status(f"Fetching ESI data for: {self.last_winner} (from EVE Bot: {self.eve2twitch_response})")
+        exit_hook = STATE_EXIT_HOOKS.get(old_state)
+        if exit_hook:
+            record.run_hook(exit_hook, getattr(self, exit_hook), new_state)
+        entry_hook = STATE_ENTRY_HOOKS.get(new_state)
+        if entry_hook:
+            record.run_hook(entry_hook, getattr(self, entry_hook), old_state)
+        record.run_hook("_after_state_entered", self._after_state_entered, new_state)
+        record.finish()
 
-            resp_text_for_search = self.eve2twitch_response if isinstance(self.eve2twitch_response, (str, bytes)) else ""
-            ign_match = re.search(r'IGN\s*["\']([^"\']+)["\']', resp_text_for_search, re.IGNORECASE)
-            if ign_match:
-                ign = ign_match.group(1)
-                if self.config.get("debug_mode_enabled", False):
-                    # Create styled IGN extraction message with modern design
-                    font_multiplier = self.config.get("font_size_multiplier", 1.0)
-                    font_size = int(14 * font_multiplier)
-                    ign_html = f"<div style='text-align: center; margin: 15px 0; padding: 0;'>"
-                    ign_html += f"<div style='display: inline-block; background: linear-gradient(135deg, #0a1a0a 0%, #1a2a1a 50%, #0f1f0f 100%); "
-                    ign_html += f"border: 2px solid #4af1f2; border-radius: 12px; padding: 15px 25px; "
-                    ign_html += f"box-shadow: 0 0 20px rgba(74, 241, 242, 0.3); position: relative;'>"
-                    ign_html += f"<div style='font-size: {int(font_size * 0.9)}pt; color: #4af1f2; font-weight: bold; "
-                    ign_html += f"text-transform: uppercase; letter-spacing: 1px; margin-bottom: 8px;'>🔍 IGN EXTRACTED</div>"
-                    ign_html += f"<div style='font-size: {int(font_size * 1.4)}pt; color: #e8d900; font-weight: bold; "
-                    ign_html += f"text-shadow: 0 0 10px rgba(232, 217, 0, 0.8); letter-spacing: 1px;'>{ign}</div>"
-                    ign_html += f"<div style='position: absolute; top: -2px; left: -2px; right: -2px; bottom: -2px; "
-                    ign_html += f"border: 1px solid rgba(232, 217, 0, 0.3); border-radius: 12px; pointer-events: none;'></div>"
-                    ign_html += f"</div></div>"
-                    self.confirmation_log.append(ign_html)
-                self._fetch_esi_data(ign)
-            else:
-                if self.config.get("debug_mode_enabled", False):
-                    font_multiplier = self.config.get("font_size_multiplier", 1.0)
-                    font_size = int(14 * font_multiplier)
-                    error_html = f"<div style='text-align: center; margin: 15px 0; padding: 0;'>"
-                    error_html += f"<div style='display: inline-block; background: linear-gradient(135deg, #2a0a0a 0%, #3a1a1a 50%, #2f0f0f 100%); "
-                    error_html += f"border: 2px solid #ff6b6b; border-radius: 12px; padding: 15px 25px; "
-                    error_html += f"box-shadow: 0 0 20px rgba(255, 107, 107, 0.3);'>"
-                    error_html += f"<div style='font-size: {int(font_size * 1.1)}pt; color: #ff6b6b; font-weight: bold; "
-                    error_html += f"text-shadow: 0 0 8px rgba(255, 107, 107, 0.6);'>❌ Could not extract IGN from EVE Bot response</div>"
-                    error_html += f"</div></div>"
-                    self.confirmation_log.append(error_html) 
-                self._set_state(AppState.CONFIRMED_NO_IGN)
-        elif new_state == AppState.CONFIRMED_NO_IGN:
-            # If a previous ESI error already appended a dedicated message and
-            # requested suppression, skip the generic confirmation block.
-            if getattr(self, 'suppress_next_confirmation_message', False):
-                # reset the flag and perform minimal housekeeping
-                self.suppress_next_confirmation_message = False
-                self._remove_winner_from_participants()
-                # Remove confirmed random prize if appropriate and return early
-                self._remove_confirmed_prize_from_lists()
-                return
+    def _sync_chat_rules(self):
+        self._sync_entrant_index_rule(); self._rebuild_message_router()
+
+    def _on_exit_collecting(self, new_state):
+        # Interactive lookups (winner prefetch, EVE2Twitch, ESI) get the network to themselves
+        if self.prewarmer is not None:
+            self.prewarmer.pause()
+
+    def _on_exit_awaiting_confirmation(self, new_state):
+        self._stop_confirmation_timer()
+
+    def _on_exit_awaiting_eve_response(self, new_state):
+        self._stop_eve_response_timer()
+
+    def _on_exit_awaiting_prize_poll_votes(self, new_state):
+        self._stop_prize_poll_timer()
+        if new_state != AppState.IDLE:
+            self.confirmation_log.setHtml("<p>Prize poll cancelled.</p>") 
 
+    def _on_enter_idle(self, old_state):
+        self._switch_to_info_panel()
+        self.animation_manager.cancel_animation()
+
+    def _on_enter_collecting(self, old_state):
+        self._announce_draw_open()
+        if EVE2TWITCH_API_URL and self.config.get('ign_prewarm_enabled', False):
+            if self.prewarmer is None:
+                self.prewarmer = CachePrewarmer(self._prewarm_entrant, should_skip=lambda: ESI_CLIENT.governor.low)
+            self.prewarmer.reset()
+            self.prewarmer.resume()
+
+    def _on_enter_animating_winner(self, old_state):
+        self._switch_to_animation_panel()
+
+    def _on_enter_awaiting_confirmation(self, old_state):
+        if self.multi_draw_claims:
+            pass  # Each multi-draw winner runs their own confirmation timer
+        elif self.last_winner:
+            self._start_confirmation_timer(self.last_winner, CONFIRMATION_TIMEOUT)
+            self._announce_winner_confirmation_needed()
+        else:
+            self.log_status("Error: Awaiting confirmation but no last winner set.")
+            self._set_state(AppState.IDLE)
+
+    def _on_enter_awaiting_eve_response(self, old_state):
+        if self.last_winner:
+            self._start_eve_response_timer(self.last_winner, EVE_RESPONSE_TIMEOUT)
+        else:
+            self.log_status("Error: Awaiting EVE response but no last winner set.")
+            self._set_state(AppState.IDLE)
+
+    def _on_enter_fetching_esi_data(self, old_state):
+        # Show EVE bot response only in debug mode
+        if self.config.get("debug_mode_enabled", False):
+            self.log_status(f"Fetching ESI data for: {self.last_winner} (from EVE Bot: {self.eve2twitch_response})")
+
+        resp_text_for_search = self.eve2twitch_response if isinstance(self.eve2twitch_response, (str, bytes)) else ""
+        ign_match = re.search(r'IGN\s*["\']([^"\']+)["\']', resp_text_for_search, re.IGNORECASE)
+        if ign_match:
+            ign = ign_match.group(1)
+            if self.config.get("debug_mode_enabled", False):
+                # Create styled IGN extraction message with modern design
+                font_multiplier = self.config.get("font_size_multiplier", 1.0)
+                font_size = int(14 * font_multiplier)
+                ign_html = f"<div style='text-align: center; margin: 15px 0; padding: 0;'>"
+                ign_html += f"<div style='display: inline-block; background: linear-gradient(135deg, #0a1a0a 0%, #1a2a1a 50%, #0f1f0f 100%); "
+                ign_html += f"border: 2px solid #4af1f2; border-radius: 12px; padding: 15px 25px; "
+                ign_html += f"box-shadow: 0 0 20px rgba(74, 241, 242, 0.3); position: relative;'>"
+                ign_html += f"<div style='font-size: {int(font_size * 0.9)}pt; color: #4af1f2; font-weight: bold; "
+                ign_html += f"text-transform: uppercase; letter-spacing: 1px; margin-bottom: 8px;'>🔍 IGN EXTRACTED</div>"
+                ign_html += f"<div style='font-size: {int(font_size * 1.4)}pt; color: #e8d900; font-weight: bold; "
+                ign_html += f"text-shadow: 0 0 10px rgba(232, 217, 0, 0.8); letter-spacing: 1px;'>{ign}</div>"
+                ign_html += f"<div style='position: absolute; top: -2px; left: -2px; right: -2px; bottom: -2px; "
+                ign_html += f"border: 1px solid rgba(232, 217, 0, 0.3); border-radius: 12px; pointer-events: none;'></div>"
+                ign_html += f"</div></div>"
+                self.confirmation_log.append(ign_html)
+            self._fetch_esi_data(ign)
+        else:
+            if self.config.get("debug_mode_enabled", False):
+                font_multiplier = self.config.get("font_size_multiplier", 1.0)
+                font_size = int(14 * font_multiplier)
+                error_html = f"<div style='text-align: center; margin: 15px 0; padding: 0;'>"
+                error_html += f"<div style='display: inline-block; background: linear-gradient(135deg, #2a0a0a 0%, #3a1a1a 50%, #2f0f0f 100%); "
+                error_html += f"border: 2px solid #ff6b6b; border-radius: 12px; padding: 15px 25px; "
+                error_html += f"box-shadow: 0 0 20px rgba(255, 107, 107, 0.3);'>"
+                error_html += f"<div style='font-size: {int(font_size * 1.1)}pt; color: #ff6b6b; font-weight: bold; "
+                error_html += f"text-shadow: 0 0 8px rgba(255, 107, 107, 0.6);'>❌ Could not extract IGN from EVE Bot response</div>"
+                error_html += f"</div></div>"
+                self.confirmation_log.append(error_html) 
+            self._set_state(AppState.CONFIRMED_NO_IGN)
+
+    def _on_enter_confirmed_no_ign(self, old_state):
+        # If a previous ESI error already appended a dedicated message and
+        # requested suppression, skip the generic confirmation block.
+        if getattr(self, 'suppress_next_confirmation_message', False):
+            # reset the flag and perform minimal housekeeping
+            self.suppress_next_confirmation_message = False
             self._remove_winner_from_participants()
-            # Decide whether to ask the winner to type !ign or to run automatic EVE2Twitch lookup.
+            # Remove confirmed random prize if appropriate and return early
+            self._remove_confirmed_prize_from_lists()
+            return
+
+        self._remove_winner_from_participants()
+        # Decide whether to ask the winner to type !ign or to run automatic EVE2Twitch lookup.
+        try:
+            auto_lookup_enabled = self.config.get('auto_eve2twitch_lookup', True)
+        except Exception:
+            auto_lookup_enabled = True
+        # If auto-lookup is enabled and we haven't yet received any eve2twitch response,
+        # start automatic lookup so the user doesn't have to type anything.
+        if auto_lookup_enabled and not self.eve2twitch_response:
+            template = self.config.get("chat_msg_auto_lookup_attempt") or config_manager.DEFAULT_CONFIG.get("chat_msg_auto_lookup_attempt")
             try:
-                auto_lookup_enabled = self.config.get('auto_eve2twitch_lookup', True)
+                msg = template.format(winner=self.last_winner)
             except Exception:
-                auto_lookup_enabled = True
-            # If auto-lookup is enabled and we haven't yet received any eve2twitch response,
-            # start automatic lookup so the user doesn't have to type anything.
-            if auto_lookup_enabled and not self.eve2twitch_response:
-                template = self.config.get("chat_msg_auto_lookup_attempt") or config_manager.DEFAULT_CONFIG.get("chat_msg_auto_lookup_attempt")
+                msg = f"@{self.last_winner} confirmed! Congratulations! Attempting automatic EVE2Twitch lookup for your EVE IGN — please wait."
+            self.schedule_twitch_message(msg, CHAT_PRIORITY_WINNER, coalesce_key=winner_status_key(self.last_winner))
+        else:
+            # If an automatic EVE2Twitch lookup already ran but did not produce
+            # a usable IGN (or ESI validation failed), prompt the winner to
+            # register with the IGN bot or provide their IGN with the !ign command.
+            if self.eve2twitch_response:
+                # Explicit request when auto-lookup ran but no valid IGN was extractable
+                template = self.config.get("chat_msg_auto_lookup_failed") or config_manager.DEFAULT_CONFIG.get("chat_msg_auto_lookup_failed")
                 try:
                     msg = template.format(winner=self.last_winner)
                 except Exception:
-                    msg = f"@{self.last_winner} confirmed! Congratulations! Attempting automatic EVE2Twitch lookup for your EVE IGN — please wait."
-                self.schedule_twitch_message(msg)
-            else:
-                # If an automatic EVE2Twitch lookup already ran but did not produce
-                # a usable IGN (or ESI validation failed), prompt the winner to
-                # register with the IGN bot or provide their IGN with the !ign command.
-                if self.eve2twitch_response:
-                    # Explicit request when auto-lookup ran but no valid IGN was extractable
-                    template = self.config.get("chat_msg_auto_lookup_failed") or config_manager.DEFAULT_CONFIG.get("chat_msg_auto_lookup_failed")
-                    try:
-                        msg = template.format(winner=self.last_winner)
-                    except Exception:
-                        msg = f"@{self.last_winner} confirmed! We could not validate your EVE IGN automatically. Please register with the IGN bot or type '!ign <your in-game name>' in chat to provide your IGN."
-                    self.schedule_twitch_message(msg)
-                else:
-                    # Fallback: no auto-lookup configured or it was disabled — ask for !ign
-                    self._announce_confirmation_in_chat()
-            # Style the confirmation message with premium design
-            font_multiplier = self.config.get("font_size_multiplier", 1.0)
-            font_size = int(16 * font_multiplier)
-            confirmation_html = f"<div style='text-align: center; margin: 20px 0; padding: 0;'>"
-            confirmation_html += f"<div style='display: inline-block; background: linear-gradient(135deg, #0a1a0a 0%, #1a2a1a 50%, #0f1f0f 100%); "
-            confirmation_html += f"border-radius: 15px; padding: 20px 30px; "
-            confirmation_html += f"box-shadow: 0 0 25px rgba(74, 241, 242, 0.4), inset 0 0 15px rgba(74, 241, 242, 0.1); position: relative;'>"
-            confirmation_html += f"<div style='font-size: {int(font_size * 1.2)}pt; color: #4af1f2; font-weight: bold; "
-            confirmation_html += f"text-shadow: 0 0 10px rgba(74, 241, 242, 0.8); letter-spacing: 1px; margin-bottom: 12px;'>✅ WINNER CONFIRMED</div>"
-            confirmation_html += f"<div style='font-size: {int(font_size * 1.5)}pt; color: #e8d900; font-weight: bold; "
-            confirmation_html += f"text-shadow: 0 0 12px rgba(232, 217, 0, 0.8); margin-bottom: 8px;'>{self.last_winner}</div>"
-            confirmation_html += f"<div style='font-size: {int(font_size * 0.9)}pt; color: #cccccc; font-style: italic; "
-            confirmation_html += f"opacity: 0.8;'>No IGN provided or !ign not used</div>"
-            confirmation_html += f"<div style='position: absolute; top: -3px; left: -3px; right: -3px; bottom: -3px; "
-            confirmation_html += f"border: 1px solid rgba(232, 217, 0, 0.3); border-radius: 15px; pointer-events: none;'></div>"
-            confirmation_html += f"</div></div>"
-            # The confirmation HTML is intentionally not appended to the confirmation_log
-            # to avoid duplicative or noisy confirmation messages in the UI.
-            # self.confirmation_log.append(confirmation_html)
-            logging_utils.send_ga_event(self.config, "winner_confirmed", {"winner": self.last_winner, "ign_provided": False}, self.log_status)
-            # Attempt automatic EVE2TWITCH lookup for the twitch username if enabled
-            # Start automatic lookup only if enabled and we haven't already received a response.
-            if auto_lookup_enabled and not self.eve2twitch_response:
-                try:
-                    if self.config.get('debug_mode_enabled', False):
-                        self.log_status(f"Attempting automatic EVE2Twitch lookup for @{self.last_winner}...")
-                    self._start_eve2twitch_lookup(self.last_winner)
-                except Exception as e:
-                    print(f"Error starting eve2twitch lookup: {e}")
+                    msg = f"@{self.last_winner} confirmed! We could not validate your EVE IGN automatically. Please register with the IGN bot or type '!ign <your in-game name>' in chat to provide your IGN."
+                self.schedule_twitch_message(msg, CHAT_PRIORITY_WINNER, coalesce_key=winner_status_key(self.last_winner))
             else:
-                # Remove confirmed random prize from list immediately if auto-lookup disabled
-                # or if lookup already ran and provided no usable IGN.
-                self._remove_confirmed_prize_from_lists()
-        elif new_state == AppState.CONFIRMED_WITH_IGN:
-            self._remove_winner_from_participants()
-            # The _format_character_sheet_html is now called directly in _handle_esi_data_ready
-            # self.confirmation_log.append(f"{self.last_winner} confirmed. ESI data processed.") # This line is redundant now
-            logging_utils.send_ga_event(self.config, "winner_confirmed", {"winner": self.last_winner, "ign_provided": True}, self.log_status)
-            # Remove confirmed random prize from list
+                # Fallback: no auto-lookup configured or it was disabled — ask for !ign
+                self._announce_confirmation_in_chat()
+        # Style the confirmation message with premium design
+        font_multiplier = self.config.get("font_size_multiplier", 1.0)
+        font_size = int(16 * font_multiplier)
+        confirmation_html = f"<div style='text-align: center; margin: 20px 0; padding: 0;'>"
+        confirmation_html += f"<div style='display: inline-block; background: linear-gradient(135deg, #0a1a0a 0%, #1a2a1a 50%, #0f1f0f 100%); "
+        confirmation_html += f"border-radius: 15px; padding: 20px 30px; "
+        confirmation_html += f"box-shadow: 0 0 25px rgba(74, 241, 242, 0.4), inset 0 0 15px rgba(74, 241, 242, 0.1); position: relative;'>"
+        confirmation_html += f"<div style='font-size: {int(font_size * 1.2)}pt; color: #4af1f2; font-weight: bold; "
+        confirmation_html += f"text-shadow: 0 0 10px rgba(74, 241, 242, 0.8); letter-spacing: 1px; margin-bottom: 12px;'>✅ WINNER CONFIRMED</div>"
+        confirmation_html += f"<div style='font-size: {int(font_size * 1.5)}pt; color: #e8d900; font-weight: bold; "
+        confirmation_html += f"text-shadow: 0 0 12px rgba(232, 217, 0, 0.8); margin-bottom: 8px;'>{self.last_winner}</div>"
+        confirmation_html += f"<div style='font-size: {int(font_size * 0.9)}pt; color: #cccccc; font-style: italic; "
+        confirmation_html += f"opacity: 0.8;'>No IGN provided or !ign not used</div>"
+        confirmation_html += f"<div style='position: absolute; top: -3px; left: -3px; right: -3px; bottom: -3px; "
+        confirmation_html += f"border: 1px solid rgba(232, 217, 0, 0.3); border-radius: 15px; pointer-events: none;'></div>"
+        confirmation_html += f"</div></div>"
+        # The confirmation HTML is intentionally not appended to the confirmation_log
+        # to avoid duplicative or noisy confirmation messages in the UI.
+        # self.confirmation_log.append(confirmation_html)
+        logging_utils.send_ga_event(self.config, "winner_confirmed", {"winner": self.last_winner, "ign_provided": False}, self.log_status)
+        # Attempt automatic EVE2TWITCH lookup for the twitch username if enabled
+        # Start automatic lookup only if enabled and we haven't already received a response.
+        if auto_lookup_enabled and not self.eve2twitch_response:
+            try:
+                if self.config.get('debug_mode_enabled', False):
+                    self.log_status(f"Attempting automatic EVE2Twitch lookup for @{self.last_winner}...")
+                self._start_eve2twitch_lookup(self.last_winner)
+            except Exception as e:
+                print(f"Error starting eve2twitch lookup: {e}")
+        else:
+            # Remove confirmed random prize from list immediately if auto-lookup disabled
+            # or if lookup already ran and provided no usable IGN.
             self._remove_confirmed_prize_from_lists()
-        elif new_state == AppState.TIMED_OUT:
-            font_multiplier = self.config.get("font_size_multiplier", 1.0)
-            font_size = int(16 * font_multiplier)
-            
-            # Modern card-based timeout display - simplified for QTextEdit centering
-            timeout_html = ""
-            
-            # Outer glow container
-            timeout_html += f"<div style='display: inline-block; position: relative; padding: 6px; "
-            timeout_html += f"background: linear-gradient(135deg, rgba(255, 68, 68, 0.3) 0%, rgba(255, 68, 68, 0.1) 50%, rgba(255, 68, 68, 0.3) 100%); "
-            timeout_html += f"border-radius: 26px; "
-            timeout_html += f"box-shadow: 0 0 50px rgba(255, 68, 68, 0.6), 0 0 100px rgba(255, 68, 68, 0.3);'>"
-            
-            # Main card
-            timeout_html += f"<div style='background: linear-gradient(135deg, #0f0202 0%, #2a0606 40%, #1a0404 70%, #0f0202 100%); "
-            timeout_html += f"border: 3px solid #ff3333; border-radius: 22px; padding: 35px 50px; "
-            timeout_html += f"box-shadow: 0 10px 40px rgba(0, 0, 0, 0.8), inset 0 0 30px rgba(255, 68, 68, 0.15); "
-            timeout_html += f"position: relative; min-width: 450px; overflow: hidden;'>"
-            
-            # Animated background pattern
-            timeout_html += f"<div style='position: absolute; top: -50%; left: -50%; width: 200%; height: 200%; "
-            timeout_html += f"background: radial-gradient(circle, rgba(255, 68, 68, 0.08) 1px, transparent 1px); "
-            timeout_html += f"background-size: 30px 30px; opacity: 0.4; pointer-events: none;'></div>"
-            
-            # Content container
-            timeout_html += f"<div style='position: relative; z-index: 1;'>"
-            
-            # Title
-            timeout_html += f"<div style='font-size: {int(font_size * 1.6)}pt; color: #ff5555; font-weight: 900; "
-            timeout_html += f"text-transform: uppercase; letter-spacing: 4px; margin-bottom: 8px; text-align: center; "
-            timeout_html += f"text-shadow: 0 0 15px rgba(255, 85, 85, 0.9), 0 3px 6px rgba(0, 0, 0, 0.8), "
-            timeout_html += f"0 0 3px rgba(255, 85, 85, 1);'>Confirmation Timeout</div>"
-            
-            # Decorative line
-            timeout_html += f"<div style='width: 60%; height: 3px; margin: 18px auto; "
-            timeout_html += f"background: linear-gradient(90deg, transparent, #ff4444 20%, #ff4444 80%, transparent); "
-            timeout_html += f"box-shadow: 0 0 10px rgba(255, 68, 68, 0.8); border-radius: 2px;'></div>"
-            
-            # Username with backdrop
-            timeout_html += f"<div style='margin: 20px 0; padding: 15px 25px; "
-            timeout_html += f"background: rgba(255, 255, 255, 0.05); "
-            timeout_html += f"border: 1px solid rgba(255, 68, 68, 0.3); border-radius: 12px; "
-            timeout_html += f"box-shadow: inset 0 2px 8px rgba(0, 0, 0, 0.3); text-align: center;'>"
-            timeout_html += f"<div style='font-size: {int(font_size * 2.0)}pt; color: #ffffff; font-weight: bold; "
-            timeout_html += f"text-shadow: 0 0 15px rgba(255, 255, 255, 0.8), 0 3px 10px rgba(0, 0, 0, 0.9), "
-            timeout_html += f"0 0 5px rgba(255, 255, 255, 1); letter-spacing: 1.5px; text-align: center;'>{self.last_winner}</div>"
-            timeout_html += f"</div>"
-            
-            # Message
-            timeout_html += f"<div style='font-size: {int(font_size * 1.05)}pt; color: #ffb3b3; font-style: italic; "
-            timeout_html += f"opacity: 0.95; line-height: 1.6; margin-top: 15px; text-align: center; "
-            timeout_html += f"text-shadow: 0 2px 4px rgba(0, 0, 0, 0.8);'>⚠️ Failed to confirm within time limit</div>"
-            
-            timeout_html += f"</div></div></div>"
-            
-            self.confirmation_log.append(timeout_html)
-            self.schedule_twitch_message(f"@{self.last_winner} did not confirm in time. Rerolling may occur.")
-            logging_utils.send_ga_event(self.config, "winner_timeout", {"winner": self.last_winner, "timeout_type": "confirmation"}, self.log_status)
-        elif new_state == AppState.EVE_TIMED_OUT:
-            font_multiplier = self.config.get("font_size_multiplier", 1.0)
-            font_size = int(16 * font_multiplier)
-            
-            # Modern card-based EVE timeout display
-            eve_timeout_html = f"<div style='text-align: center; margin: 30px auto; max-width: 650px;'>"
-            
-            # Outer glow container
-            eve_timeout_html += f"<div style='display: block; position: relative; padding: 6px; width: fit-content; margin: 0 auto; "
-            eve_timeout_html += f"background: linear-gradient(135deg, rgba(255, 149, 0, 0.3) 0%, rgba(255, 149, 0, 0.1) 50%, rgba(255, 149, 0, 0.3) 100%); "
-            eve_timeout_html += f"border-radius: 26px; "
-            eve_timeout_html += f"box-shadow: 0 0 50px rgba(255, 149, 0, 0.6), 0 0 100px rgba(255, 149, 0, 0.3);'>"
-            
-            # Main card
-            eve_timeout_html += f"<div style='background: linear-gradient(135deg, #0f0a02 0%, #2a1906 40%, #1a0f04 70%, #0f0a02 100%); "
-            eve_timeout_html += f"border: 3px solid #ff9933; border-radius: 22px; padding: 35px 50px; "
-            eve_timeout_html += f"box-shadow: 0 10px 40px rgba(0, 0, 0, 0.8), inset 0 0 30px rgba(255, 149, 0, 0.15); "
-            eve_timeout_html += f"position: relative; min-width: 450px; overflow: hidden;'>"
-            
-            # Animated background pattern
-            eve_timeout_html += f"<div style='position: absolute; top: -50%; left: -50%; width: 200%; height: 200%; "
-            eve_timeout_html += f"background: radial-gradient(circle, rgba(255, 149, 0, 0.08) 1px, transparent 1px); "
-            eve_timeout_html += f"background-size: 30px 30px; opacity: 0.4; pointer-events: none;'></div>"
-            
-            # Content container
-            eve_timeout_html += f"<div style='position: relative; z-index: 1;'>"
-            
-            # Title
-            eve_timeout_html += f"<div style='font-size: {int(font_size * 1.6)}pt; color: #ffaa55; font-weight: 900; "
-            eve_timeout_html += f"text-transform: uppercase; letter-spacing: 4px; margin-bottom: 8px; text-align: center; "
-            eve_timeout_html += f"text-shadow: 0 0 15px rgba(255, 170, 85, 0.9), 0 3px 6px rgba(0, 0, 0, 0.8), "
-            eve_timeout_html += f"0 0 3px rgba(255, 170, 85, 1);'>EVE Response Timeout</div>"
-            
-            # Decorative line
-            eve_timeout_html += f"<div style='width: 60%; height: 3px; margin: 18px auto; "
-            eve_timeout_html += f"background: linear-gradient(90deg, transparent, #ff9933 20%, #ff9933 80%, transparent); "
-            eve_timeout_html += f"box-shadow: 0 0 10px rgba(255, 149, 0, 0.8); border-radius: 2px;'></div>"
-            
-            # Username with backdrop
-            eve_timeout_html += f"<div style='margin: 20px 0; padding: 15px 25px; "
-            eve_timeout_html += f"background: rgba(255, 255, 255, 0.05); "
-            eve_timeout_html += f"border: 1px solid rgba(255, 149, 0, 0.3); border-radius: 12px; "
-            eve_timeout_html += f"box-shadow: inset 0 2px 8px rgba(0, 0, 0, 0.3); text-align: center;'>"
-            eve_timeout_html += f"<div style='font-size: {int(font_size * 2.0)}pt; color: #ffffff; font-weight: bold; "
-            eve_timeout_html += f"text-shadow: 0 0 15px rgba(255, 255, 255, 0.8), 0 3px 10px rgba(0, 0, 0, 0.9), "
-            eve_timeout_html += f"0 0 5px rgba(255, 255, 255, 1); letter-spacing: 1.5px; text-align: center;'>{self.last_winner}</div>"
-            eve_timeout_html += f"</div>"
-            
-            # Message
-            eve_timeout_html += f"<div style='font-size: {int(font_size * 1.05)}pt; color: #ffd9aa; font-style: italic; "
-            eve_timeout_html += f"opacity: 0.95; line-height: 1.6; margin-top: 15px; text-align: center; "
-            eve_timeout_html += f"text-shadow: 0 2px 4px rgba(0, 0, 0, 0.8);'>⚠️ IGN details not provided in time (or EVE Bot issue)</div>"
-            
-            eve_timeout_html += f"</div></div></div>"
-            
-            self.confirmation_log.append(eve_timeout_html)
-            # Prefer configurable chat messages; fall back to a sensible default
+
+    def _on_enter_confirmed_with_ign(self, old_state):
+        self._remove_winner_from_participants()
+        # The _format_character_sheet_html is now called directly in _handle_esi_data_ready
+        # self.confirmation_log.append(f"{self.last_winner} confirmed. ESI data processed.") # This line is redundant now
+        logging_utils.send_ga_event(self.config, "winner_confirmed", {"winner": self.last_winner, "ign_provided": True}, self.log_status)
+        # Remove confirmed random prize from list
+        self._remove_confirmed_prize_from_lists()
+
+    def _on_enter_timed_out(self, old_state):
+        font_multiplier = self.config.get("font_size_multiplier", 1.0)
+        font_size = int(16 * font_multiplier)
+        
+        # Modern card-based timeout display - simplified for QTextEdit centering
+        timeout_html = ""
+        
+        # Outer glow container
+        timeout_html += f"<div style='display: inline-block; position: relative; padding: 6px; "
+        timeout_html += f"background: linear-gradient(135deg, rgba(255, 68, 68, 0.3) 0%, rgba(255, 68, 68, 0.1) 50%, rgba(255, 68, 68, 0.3) 100%); "
+        timeout_html += f"border-radius: 26px; "
+        timeout_html += f"box-shadow: 0 0 50px rgba(255, 68, 68, 0.6), 0 0 100px rgba(255, 68, 68, 0.3);'>"
+        
+        # Main card
+        timeout_html += f"<div style='background: linear-gradient(135deg, #0f0202 0%, #2a0606 40%, #1a0404 70%, #0f0202 100%); "
+        timeout_html += f"border: 3px solid #ff3333; border-radius: 22px; padding: 35px 50px; "
+        timeout_html += f"box-shadow: 0 10px 40px rgba(0, 0, 0, 0.8), inset 0 0 30px rgba(255, 68, 68, 0.15); "
+        timeout_html += f"position: relative; min-width: 450px; overflow: hidden;'>"
+        
+        # Animated background pattern
+        timeout_html += f"<div style='position: absolute; top: -50%; left: -50%; width: 200%; height: 200%; "
+        timeout_html += f"background: radial-gradient(circle, rgba(255, 68, 68, 0.08) 1px, transparent 1px); "
+        timeout_html += f"background-size: 30px 30px; opacity: 0.4; pointer-events: none;'></div>"
+        
+        # Content container
+        timeout_html += f"<div style='position: relative; z-index: 1;'>"
+        
+        # Title
+        timeout_html += f"<div style='font-size: {int(font_size * 1.6)}pt; color: #ff5555; font-weight: 900; "
+        timeout_html += f"text-transform: uppercase; letter-spacing: 4px; margin-bottom: 8px; text-align: center; "
+        timeout_html += f"text-shadow: 0 0 15px rgba(255, 85, 85, 0.9), 0 3px 6px rgba(0, 0, 0, 0.8), "
+        timeout_html += f"0 0 3px rgba(255, 85, 85, 1);'>Confirmation Timeout</div>"
+        
+        # Decorative line
+        timeout_html += f"<div style='width: 60%; height: 3px; margin: 18px auto; "
+        timeout_html += f"background: linear-gradient(90deg, transparent, #ff4444 20%, #ff4444 80%, transparent); "
+        timeout_html += f"box-shadow: 0 0 10px rgba(255, 68, 68, 0.8); border-radius: 2px;'></div>"
+        
+        # Username with backdrop
+        timeout_html += f"<div style='margin: 20px 0; padding: 15px 25px; "
+        timeout_html += f"background: rgba(255, 255, 255, 0.05); "
+        timeout_html += f"border: 1px solid rgba(255, 68, 68, 0.3); border-radius: 12px; "
+        timeout_html += f"box-shadow: inset 0 2px 8px rgba(0, 0, 0, 0.3); text-align: center;'>"
+        timeout_html += f"<div style='font-size: {int(font_size * 2.0)}pt; color: #ffffff; font-weight: bold; "
+        timeout_html += f"text-shadow: 0 0 15px rgba(255, 255, 255, 0.8), 0 3px 10px rgba(0, 0, 0, 0.9), "
+        timeout_html += f"0 0 5px rgba(255, 255, 255, 1); letter-spacing: 1.5px; text-align: center;'>{self.last_winner}</div>"
+        timeout_html += f"</div>"
+        
+        # Message
+        timeout_html += f"<div style='font-size: {int(font_size * 1.05)}pt; color: #ffb3b3; font-style: italic; "
+        timeout_html += f"opacity: 0.95; line-height: 1.6; margin-top: 15px; text-align: center; "
+        timeout_html += f"text-shadow: 0 2px 4px rgba(0, 0, 0, 0.8);'>⚠️ Failed to confirm within time limit</div>"
+        
+        timeout_html += f"</div></div></div>"
+        
+        self.confirmation_log.append(timeout_html)
+        self.schedule_twitch_message(f"@{self.last_winner} did not confirm in time. Rerolling may occur.")
+        logging_utils.send_ga_event(self.config, "winner_timeout", {"winner": self.last_winner, "timeout_type": "confirmation"}, self.log_status)
+
+    def _on_enter_eve_timed_out(self, old_state):
+        font_multiplier = self.config.get("font_size_multiplier", 1.0)
+        font_size = int(16 * font_multiplier)
+        
+        # Modern card-based EVE timeout display
+        eve_timeout_html = f"<div style='text-align: center; margin: 30px auto; max-width: 650px;'>"
+        
+        # Outer glow container
+        eve_timeout_html += f"<div style='display: block; position: relative; padding: 6px; width: fit-content; margin: 0 auto; "
+        eve_timeout_html += f"background: linear-gradient(135deg, rgba(255, 149, 0, 0.3) 0%, rgba(255, 149, 0, 0.1) 50%, rgba(255, 149, 0, 0.3) 100%); "
+        eve_timeout_html += f"border-radius: 26px; "
+        eve_timeout_html += f"box-shadow: 0 0 50px rgba(255, 149, 0, 0.6), 0 0 100px rgba(255, 149, 0, 0.3);'>"
+        
+        # Main card
+        eve_timeout_html += f"<div style='background: linear-gradient(135deg, #0f0a02 0%, #2a1906 40%, #1a0f04 70%, #0f0a02 100%); "
+        eve_timeout_html += f"border: 3px solid #ff9933; border-radius: 22px; padding: 35px 50px; "
+        eve_timeout_html += f"box-shadow: 0 10px 40px rgba(0, 0, 0, 0.8), inset 0 0 30px rgba(255, 149, 0, 0.15); "
+        eve_timeout_html += f"position: relative; min-width: 450px; overflow: hidden;'>"
+        
+        # Animated background pattern
+        eve_timeout_html += f"<div style='position: absolute; top: -50%; left: -50%; width: 200%; height: 200%; "
+        eve_timeout_html += f"background: radial-gradient(circle, rgba(255, 149, 0, 0.08) 1px, transparent 1px); "
+        eve_timeout_html += f"background-size: 30px 30px; opacity: 0.4; pointer-events: none;'></div>"
+        
+        # Content container
+        eve_timeout_html += f"<div style='position: relative; z-index: 1;'>"
+        
+        # Title
+        eve_timeout_html += f"<div style='font-size: {int(font_size * 1.6)}pt; color: #ffaa55; font-weight: 900; "
+        eve_timeout_html += f"text-transform: uppercase; letter-spacing: 4px; margin-bottom: 8px; text-align: center; "
+        eve_timeout_html += f"text-shadow: 0 0 15px rgba(255, 170, 85, 0.9), 0 3px 6px rgba(0, 0, 0, 0.8), "
+        eve_timeout_html += f"0 0 3px rgba(255, 170, 85, 1);'>EVE Response Timeout</div>"
+        
+        # Decorative line
+        eve_timeout_html += f"<div style='width: 60%; height: 3px; margin: 18px auto; "
+        eve_timeout_html += f"background: linear-gradient(90deg, transparent, #ff9933 20%, #ff9933 80%, transparent); "
+        eve_timeout_html += f"box-shadow: 0 0 10px rgba(255, 149, 0, 0.8); border-radius: 2px;'></div>"
+        
+        # Username with backdrop
+        eve_timeout_html += f"<div style='margin: 20px 0; padding: 15px 25px; "
+        eve_timeout_html += f"background: rgba(255, 255, 255, 0.05); "
+        eve_timeout_html += f"border: 1px solid rgba(255, 149, 0, 0.3); border-radius: 12px; "
+        eve_timeout_html += f"box-shadow: inset 0 2px 8px rgba(0, 0, 0, 0.3); text-align: center;'>"
+        eve_timeout_html += f"<div style='font-size: {int(font_size * 2.0)}pt; color: #ffffff; font-weight: bold; "
+        eve_timeout_html += f"text-shadow: 0 0 15px rgba(255, 255, 255, 0.8), 0 3px 10px rgba(0, 0, 0, 0.9), "
+        eve_timeout_html += f"0 0 5px rgba(255, 255, 255, 1); letter-spacing: 1.5px; text-align: center;'>{self.last_winner}</div>"
+        eve_timeout_html += f"</div>"
+        
+        # Message
+        eve_timeout_html += f"<div style='font-size: {int(font_size * 1.05)}pt; color: #ffd9aa; font-style: italic; "
+        eve_timeout_html += f"opacity: 0.95; line-height: 1.6; margin-top: 15px; text-align: center; "
+        eve_timeout_html += f"text-shadow: 0 2px 4px rgba(0, 0, 0, 0.8);'>⚠️ IGN details not provided in time (or EVE Bot issue)</div>"
+        
+        eve_timeout_html += f"</div></div></div>"
+        
+        self.confirmation_log.append(eve_timeout_html)
+        # Prefer configurable chat messages; fall back to a sensible default
+        try:
+            if self.eve2twitch_response:
+                template = self.config.get("chat_msg_auto_lookup_failed") or config_manager.DEFAULT_CONFIG.get("chat_msg_auto_lookup_failed")
+            else:
+                template = self.config.get("chat_msg_awaiting_ign") or config_manager.DEFAULT_CONFIG.get("chat_msg_awaiting_ign")
             try:
-                if self.eve2twitch_response:
-                    template = self.config.get("chat_msg_auto_lookup_failed") or config_manager.DEFAULT_CONFIG.get("chat_msg_auto_lookup_failed")
-                else:
-                    template = self.config.get("chat_msg_awaiting_ign") or config_manager.DEFAULT_CONFIG.get("chat_msg_awaiting_ign")
-                try:
-                    msg = template.format(winner=self.last_winner)
-                except Exception:
-                    raise
+                msg = template.format(winner=self.last_winner)
             except Exception:
-                # Fallback messages
-                if self.eve2twitch_response:
-                    msg = f"@{self.last_winner} confirmed! We could not validate your EVE IGN automatically. Please register with the IGN bot or type '!ign <your in-game name>' in chat to provide your IGN."
-                else:
-                    msg = f"@{self.last_winner} confirmed! Congratulations! Awaiting Capsuleers name, Please type !ign in chat"
+                raise
+        except Exception:
+            # Fallback messages
+            if self.eve2twitch_response:
+                msg = f"@{self.last_winner} confirmed! We could not validate your EVE IGN automatically. Please register with the IGN bot or type '!ign <your in-game name>' in chat to provide your IGN."
+            else:
+                msg = f"@{self.last_winner} confirmed! Congratulations! Awaiting Capsuleers name, Please type !ign in chat"
+
+        self.schedule_twitch_message(msg, CHAT_PRIORITY_WINNER, coalesce_key=winner_status_key(self.last_winner))
+        logging_utils.send_ga_event(self.config, "winner_timeout", {"winner": self.last_winner, "timeout_type": "eve_response"}, self.log_status)
 
-            self.schedule_twitch_message(msg)
-            logging_utils.send_ga_event(self.config, "winner_timeout", {"winner": self.last_winner, "timeout_type": "eve_response"}, self.log_status)
-        elif new_state == AppState.AWAITING_PRIZE_POLL_VOTES:
-             self._start_prize_poll_timer(self.config.get("poll_duration", 30))
-             self._update_prize_poll_display_in_log()
+    def _on_enter_awaiting_prize_poll_votes(self, old_state):
+        self._start_prize_poll_timer(self.config.get("poll_duration", 30))
+        self._update_prize_poll_display_in_log()
 
+    def _after_state_entered(self, new_state):
         resolved_states_that_should_show_info_panel = [
             AppState.TIMED_OUT,
             AppState.EVE_TIMED_OUT,
@@ -1907,6 +1850,15 @@ class GiveawayApp(QWidget):
 
         self.update_ui_button_states()
 
+    def export_state_trace(self, path=None):
+        """Write recorded state transitions as Chrome trace JSON (open in ui.perfetto.dev)."""
+        if path is None:
+            app_data_dir = logging_utils._app_data_dir()
+            if app_data_dir is None:
+                return None
+            path = str(app_data_dir / STATE_TRACE_FILE)
+        return self.state_tracer.export_chrome_trace(path)
+
     @pyqtSlot()
     def draw_winner(self):
         print(f"DEBUG: draw_winner called. Current state: {self.current_state}, Prize: {self.current_prize}, Participants: {len(self.participants)}")
@@ -1948,9 +1900,18 @@ class GiveawayApp(QWidget):
         self.confirmation_message = None
         self.eve2twitch_response = None
 
-        self.last_winner = random.choice(list(self.participants))
+        winner_count = self._multi_draw_winner_count()
+        if winner_count > 1:
+            # Sample every winner up front from the current pool, then reveal/confirm them together
+            winners = self.entry_pool.sample(winner_count)
+            self._begin_multi_draw(winners)
+            self.last_winner = winners[0]
+        else:
+            self.last_winner = self.entry_pool.pick()
+            self._start_winner_prefetch(self.last_winner)
+        self.last_winner_key = self._participant_key_by_name.get(self.last_winner.lower())
         if self.config.get('debug_mode_enabled', False):
-            self.log_status(f"WINNER SELECTED (Internally): {self.last_winner}")
+            self.log_status(f"WINNER SELECTED (Internally): {self.last_winner} (weight {self.entry_pool.weight(self.last_winner):g}, odds {self.entry_pool.odds(self.last_winner):.2%})")
 
         # If both prize and animation are set to random, pick a random animation type
         animation_type = self.config.get("animation_type", None)
@@ -2065,21 +2026,15 @@ class GiveawayApp(QWidget):
                   if not self.info_panel.isVisible(): self.info_panel.show() 
                   self.info_panel.update(); QApplication.processEvents() 
 
-    def _update_participant_list_widget(self):
-        self.participant_list.clear() 
-        sorted_participants = sorted(list(self.participants), key=str.lower)
-        for name in sorted_participants:
-            item = QListWidgetItem(name)
-            item.setFlags(item.flags() | Qt.ItemFlag.ItemIsUserCheckable | Qt.ItemFlag.ItemIsEnabled)
-            item.setCheckState(Qt.CheckState.Unchecked)
-            self.participant_list.addItem(item) 
-        self.update_ui_button_states()
+    def _flush_pending_participant_rows(self):
+        if self._pending_participant_rows:
+            pending, self._pending_participant_rows = self._pending_participant_rows, []
+            self.participant_model.add_names(pending)
 
     def _remove_winner_from_participants(self, winner_to_remove=None):
          name_to_remove = winner_to_remove if winner_to_remove else self.last_winner
-         if name_to_remove and name_to_remove in self.participants:
-             self.participants.discard(name_to_remove); self._update_participant_list_widget()
-             self.animation_manager.update_participants(sorted(list(self.participants), key=str.lower))
+         if name_to_remove and self._discard_participant(name_to_remove):
+             self._refresh_participant_views()
 
     def _remove_confirmed_prize_from_lists(self):
         """Remove the confirmed random prize from the appropriate prize list"""
@@ -2127,12 +2082,12 @@ class GiveawayApp(QWidget):
         if self.config.get('debug_mode_enabled', False):
             self.log_status(f"Draw OPEN! Requirement: {req_text} in chat.")
         prize_text_for_chat = (self.current_prize if self.current_prize != "<NO PRIZE SET>" else "prize").upper()
-        self.schedule_twitch_message(f"🎁 GIVEAWAY OPEN! 🎁 Prize: {prize_text_for_chat}. {req_text} in chat!")
+        self.schedule_twitch_message(f"🎁 GIVEAWAY OPEN! 🎁 Prize: {prize_text_for_chat}. {req_text} in chat!", coalesce_key=CHAT_KEY_DRAW_STATUS)
 
     def _announce_draw_closed(self):
         if self.config.get('debug_mode_enabled', False):
             self.log_status("Draw CLOSED.")
-        self.schedule_twitch_message("Giveaway entries are now CLOSED.")
+        self.schedule_twitch_message("Giveaway entries are now CLOSED.", coalesce_key=CHAT_KEY_DRAW_STATUS)
 
     def _announce_winner_confirmation_needed(self):
         if not self.last_winner: return
@@ -2143,7 +2098,7 @@ class GiveawayApp(QWidget):
             msg = template.format(winner=self.last_winner, prize=prize_text_for_chat, timeout=conf_timeout)
         except Exception:
             msg = f"🎉 Congrats @{self.last_winner}! 🎉 You won: {prize_text_for_chat}! Type anything (or !ign) in chat within {conf_timeout}s to confirm!"
-        self.schedule_twitch_message(msg)
+        self.schedule_twitch_message(msg, CHAT_PRIORITY_WINNER)
 
     def _announce_confirmation_in_chat(self):
         if not self.last_winner: return
@@ -2152,7 +2107,7 @@ class GiveawayApp(QWidget):
             msg = template.format(winner=self.last_winner)
         except Exception:
             msg = f"@{self.last_winner} confirmed! Congratulations! Awaiting Capsuleers name, Please type !ign in chat"
-        self.schedule_twitch_message(msg)
+        self.schedule_twitch_message(msg, CHAT_PRIORITY_WINNER, coalesce_key=winner_status_key(self.last_winner))
 
     @pyqtSlot(QWidget, str)
     def _handle_widget_geometry_change(self, widget, geometry_str):
@@ -2184,21 +2139,6 @@ class GiveawayApp(QWidget):
         if self.main_content_area: self.main_content_area.update() 
         self.log_status("Unsaved layout changes discarded.")
 
-    def _start_timer_queue_poll(self):
-        self.timer_poll_qtimer.timeout.connect(self.process_timer_queue); self.timer_poll_qtimer.start(50)
-
-    @pyqtSlot()
-    def process_timer_queue(self):
-        try:
-            while True:
-                message = self.timer_queue.get_nowait(); msg_type, data = message[0], message[1]
-                if msg_type == "timer_update": self.timer_update_signal.emit(data)
-                elif msg_type == "timer_expired": self.timer_expired_signal.emit(data)
-                elif msg_type == "timer_stopped": self.timer_stopped_signal.emit(data)
-                elif msg_type == "play_sound": self.play_sound_signal.emit(data)
-        except queue.Empty: pass
-        except Exception as e: print(f"ERROR in process_timer_queue: {e}"); traceback.print_exc()
-
     def log_loaded_config(self):
         self.confirmation_log.append("--- Configuration ---") 
         token_ok = bool(self.config.get("token")); env_channel = self.config.get("channel", "N/A"); cfg_channel = self.config.get("target_channel"); active_channel = self.effective_channel or "N/A"
@@ -2262,7 +2202,8 @@ class GiveawayApp(QWidget):
         self.clear_prize_button.clicked.connect(self.clear_prize) 
         self.prize_input.returnPressed.connect(self._set_prize_and_donator_from_inputs) 
         self.copy_log_button.clicked.connect(self.copy_eve_response_content) 
-        self.participant_list.itemChanged.connect(self.update_ui_button_states)  
+        self.participant_model.dataChanged.connect(self.update_ui_button_states)
+        self.participant_filter_input.textChanged.connect(self.participant_proxy.setFilterFixedString)
         self.options_button.clicked.connect(self.open_options_dialog) 
         if hasattr(self, 'set_prize_and_open_button'): self.set_prize_and_open_button.clicked.connect(self._set_prize_and_open_draw) 
         if hasattr(self, 'start_prize_poll_button'): self.start_prize_poll_button.clicked.connect(self.start_prize_poll) 
@@ -2290,6 +2231,27 @@ class GiveawayApp(QWidget):
             if hasattr(self.twitch_thread.bot, '_ready'):
                 bot_ready = self.twitch_thread.bot._ready
         debug_info.append(f"Bot Connected: {'Yes' if bot_ready else 'No'}")
+        if self.twitch_thread:
+            dedup = self.twitch_thread.ingest.deduplicator
+            if dedup.checks:
+                debug_info.append(f"Dedup: {dedup.hits}/{dedup.checks} ({dedup.hit_rate:.0%})")
+            bot = self.twitch_thread.bot
+            counters = [getattr(bot, 'eventsub_stats', None), getattr(getattr(bot, 'irc_client', None), 'stats', None)]
+            transports = [c.snapshot() for c in counters if c is not None]
+            if transports:
+                debug_info.append("Chat In: " + " | ".join(
+                    f"{t['transport']} {t['messages']} msgs" + (f"/{t['lines']} lines" if t['lines'] else "") + f", {t['messages_per_s']}/s (now {t['recent_messages_per_s']}/s)" for t in transports))
+        esi_timing = ESI_CLIENT.timing_summary()
+        if esi_timing:
+            debug_info.append(esi_timing)
+        if self.twitch_thread and self.twitch_thread.bot:
+            chat_stats = self.twitch_thread.bot.outbox.stats()
+            debug_info.append(f"Chat Queue: {chat_stats['depth']} queued, {chat_stats['sent']} sent, avg {chat_stats['avg_latency_ms']:.0f}ms "
+                              f"(max {chat_stats['max_latency_ms']:.0f}ms), {chat_stats['retries']} retried, {chat_stats['coalesced']} merged, {chat_stats['dropped']} dropped")
+        e2t_stats = EVE2TWITCH_CLIENT.stats()
+        debug_info.append(f"EVE2Twitch: {e2t_stats['requests']} requests, {e2t_stats['cache_hits']} cache hits")
+        if self.prewarmer is not None:
+            debug_info.append(f"Pre-warm: {self.prewarmer.warmed} warmed, {self.prewarmer.failed} failed, {self.prewarmer.pending} queued")
         if self.current_state == AppState.AWAITING_CONFIRMATION:
             debug_info.append(f"Confirmation Timeout: {CONFIRMATION_TIMEOUT}s")
         elif self.current_state == AppState.AWAITING_EVE_RESPONSE:
@@ -2298,6 +2260,9 @@ class GiveawayApp(QWidget):
         elif self.current_state == AppState.AWAITING_PRIZE_POLL_VOTES:
             debug_info.append(f"Poll Votes: {sum(self.prize_poll_votes.values())}")
             debug_info.append(f"Poll Voters: {len(self.prize_poll_voters)}")
+        last_problem = logging_utils.recent_log_lines(1, logging.WARNING)
+        if last_problem:
+            debug_info.append(f"Last Warning: {last_problem[0]}")
         return " | " + " | ".join(debug_info)
 
     def log_status(self, message):
@@ -2352,8 +2317,9 @@ class GiveawayApp(QWidget):
         if self.twitch_thread and self.twitch_thread.isRunning():
             self.stop_twitch_connection()
         try:
-            self.twitch_thread = TwitchBotThread(token, channel, "", bot_nick)
-            self.twitch_thread.message_received.connect(self.handle_message)
+            self.twitch_thread = TwitchBotThread(token, channel, "", bot_nick, entrant_index=self.entrant_index,
+                                                 irc_hot_standby=self.config.get("irc_hot_standby_enabled", False))
+            self.twitch_thread.message_batch_received.connect(self.handle_message_batch)
             self.twitch_thread.status_update.connect(self.handle_status_update)
             self.twitch_thread.error_occurred.connect(self.handle_error)
             self.twitch_thread.bot_ready_signal.connect(self.handle_bot_ready)
@@ -2402,180 +2368,360 @@ class GiveawayApp(QWidget):
             self.log_status(f"ERROR: {error_message}"); QMessageBox.critical(self, "Twitch Error", error_message)
             if self.current_state != AppState.BOT_DOWN: self._set_state(AppState.BOT_DOWN)
 
+    @pyqtSlot(list)
+    def handle_message_batch(self, batch):
+        """Apply a batch of chat messages, refreshing the entrant views once at the end."""
+        self._participant_refresh_deferred = True
+        try:
+            for record in batch:
+                try:
+                    # Identity is the login: winner lookups, @mentions and the mention pattern need it
+                    self.handle_message(record.login, record.text, record)
+                except Exception as e:
+                    print(f"❌ Error handling batched message from {record.display_name}: {e}")
+                    traceback.print_exc()
+        finally:
+            self._participant_refresh_deferred = False
+            if self._participant_refresh_pending:
+                self._refresh_participant_views()
+
+    def _refresh_participant_views(self):
+        """Refresh the participant list, count label and animation page (once per batch while batching)."""
+        if self._participant_refresh_deferred:
+            self._participant_refresh_pending = True
+            return
+        self._participant_refresh_pending = False
+        self._flush_pending_participant_rows()
+        self.update_ui_button_states()
+
+    def _add_participant(self, name, record=None):
+        """Add an entrant, keyed on their user id when known. Returns False if they already entered."""
+        name_lower = name.lower()
+        key = record.key if record is not None else name_lower
+        if key in self.participant_records or name_lower in self._participant_key_by_name:
+            return False
+        self.participant_records[key] = record if record is not None else ChatMessage(name, "")
+        self._participant_key_by_name[name_lower] = key
+        self.participants.add(name); self.entrant_index.add(key)
+        self.entry_pool.add(name, entry_weight(record, self.config))
+        if self._participant_refresh_deferred:
+            self._pending_participant_rows.append(name)
+        else:
+            self.participant_model.add_name(name)
+        self.animation_manager.add_participants([name])  # Throttled delta to the animation page
+        return True
+
+    def _discard_participant(self, name):
+        """Remove an entrant. Returns False if they were not in the list."""
+        if name not in self.participants:
+            return False
+        self._flush_pending_participant_rows(); self.participant_model.remove_name(name)
+        key = self._participant_key_by_name.pop(name.lower(), name.lower())
+        self.participant_records.pop(key, None); self.participants.discard(name); self.entrant_index.discard(key); self.entry_pool.discard(name)
+        self.animation_manager.remove_participants([name])
+        return True
+
+    def _clear_participant_entries(self):
+        self.participants.clear(); self.participant_records.clear(); self._participant_key_by_name.clear(); self.entrant_index.clear(); self.entry_pool.clear()
+        self._pending_participant_rows = []; self.participant_model.clear()
+        self.animation_manager.clear_participants()
+
+    def _reweight_entries(self):
+        """Recompute every entrant's draw weight after the weighted-entry options change."""
+        for name in self.participants:
+            key = self._participant_key_by_name.get(name.lower())
+            self.entry_pool.add(name, entry_weight(self.participant_records.get(key), self.config))
+
+    def _sync_entrant_index_rule(self):
+        """Push the current entry rule to the shared entrant index used by the bot thread."""
+        collecting = self.current_state == AppState.COLLECTING
+        entry_type = self.config.get('entry_condition_type', ENTRY_TYPE_PREDEFINED)
+        if entry_type == ENTRY_TYPE_CUSTOM:
+            entry_command = self.config.get("custom_join_command", "##INVALID##")
+        else:
+            entry_command = self.config.get("join_command", "##INVALID##")
+        if collecting:
+            # Re-sync in case entries were dropped by the GUI after the index claimed them
+            self.entrant_index.reset(self.participant_records.keys())
+        self.entrant_index.set_rule(collecting, entry_type, entry_command)
+
+    def _is_last_winner(self, username_lower, record=None):
+        """Match a chatter against last_winner, by user id when both sides have one."""
+        if not self.last_winner:
+            return False
+        if record is not None and record.user_id is not None and isinstance(self.last_winner_key, int):
+            return record.user_id == self.last_winner_key
+        return username_lower == self.last_winner.lower()
+
+    def _rebuild_message_router(self):
+        """Rebuild the per-state chat handlers and cached entry rule. Called on state/config changes."""
+        entry_type = self.config.get('entry_condition_type', ENTRY_TYPE_PREDEFINED)
+        if entry_type == ENTRY_TYPE_CUSTOM:
+            join_command = self.config.get("custom_join_command", "##INVALID##")
+        else:
+            join_command = self.config.get("join_command", "##INVALID##")
+        self._router_entry_type = entry_type
+        self._router_join_command = (join_command or "##INVALID##").lower()
+        self._router_debug = bool(self.config.get('debug_mode_enabled', False))
+        self._message_router = {
+            AppState.COLLECTING: self._route_collecting,
+            AppState.AWAITING_PRIZE_POLL_VOTES: self._route_prize_poll_vote,
+            AppState.AWAITING_CONFIRMATION: self._route_awaiting_confirmation,
+            AppState.CONFIRMED_NO_IGN: self._route_confirmed_no_ign,
+            AppState.AWAITING_EVE_RESPONSE: self._route_awaiting_eve_response,
+        }
+        if self.multi_draw_claims:
+            # Revealed winners can confirm while later winners are still animating
+            self._message_router[AppState.ANIMATING_WINNER] = self._route_multi_draw_confirmation
+            self._message_router[AppState.AWAITING_CONFIRMATION] = self._route_multi_draw_confirmation
+
+    def _winner_mention_pattern(self):
+        """Compiled '@<last_winner>' pattern, recompiled only when the winner changes."""
+        if self._winner_mention_cache[0] != self.last_winner:
+            self._winner_mention_cache = (self.last_winner, re.compile(rf"@{re.escape(self.last_winner)}", re.IGNORECASE) if self.last_winner else None)
+        return self._winner_mention_cache[1]
+
+    def _cancel_eve2twitch_watchdog(self):
+        timer = getattr(self, '_eve2twitch_timeout_timer', None)
+        if timer:
+            try:
+                timer.cancel()
+            except Exception:
+                pass
+            self._eve2twitch_timeout_timer = None
+
+    def _start_esi_lookup(self, ign):
+        self._set_state(AppState.FETCHING_ESI_DATA)
+        QTimer.singleShot(50, lambda ign=ign: self._fetch_esi_data(ign))
+
     @pyqtSlot(str, str)
-    def handle_message(self, username, message):
-        print(f"🔧 DEBUG: handle_message called with username='{username}', message='{message}'")
-        print(f"🔧 DEBUG: current_state = {self.current_state}")
-        
-        ignored_bot_name = ENV_EVE2TWITCH_BOT_NAME;
-        if not username: 
-            print(f"🔧 DEBUG: No username provided, returning")
+    def handle_message(self, username, message, record=None):
+        if not username:
             return
-        username_lower, message_clean, message_lower = username.lower(), message.strip(), message.strip().lower()
-        
-        print(f"🔧 DEBUG: processed - username_lower='{username_lower}', message_clean='{message_clean}', message_lower='{message_lower}'")
+        chat_log.debug("🔧 handle_message username=%r, message=%r, state=%s", username, message, self.current_state)
+
         # If an external message mentions the winner in the form: @Winner: IGN "In Game Name" ...
-        try:
-            mention_ign_match = re.search(r"@(?P<tuser>[A-Za-z0-9_\-]+)\s*:\s*IGN\s*['\"](?P<ign>[^'\"]+)['\"]", message, re.IGNORECASE)
-            if mention_ign_match:
-                mentioned = mention_ign_match.group('tuser')
-                quoted_ign = mention_ign_match.group('ign').strip()
-                print(f"🔧 DEBUG: Detected @mention IGN pattern - mentioned='{mentioned}', quoted_ign='{quoted_ign}'")
-                if self.last_winner and mentioned.lower() == self.last_winner.lower():
-                    # Only accept this flow if the mention targets the current winner
-                    try:
-                        if self.config.get('debug_mode_enabled', False):
-                            self.confirmation_log.append(f"Auto-detected registered IGN for @{mentioned}: {quoted_ign} — querying ESI...")
-                    except Exception:
-                        pass
-                    # store raw response and move to ESI fetch directly
-                    self.eve2twitch_response = message
-                    # Cancel watchdog timer since we have a response
-                    try:
-                        if getattr(self, '_eve2twitch_timeout_timer', None):
-                            try:
-                                self._eve2twitch_timeout_timer.cancel()
-                            except Exception:
-                                pass
-                            self._eve2twitch_timeout_timer = None
-                    except Exception:
-                        pass
-                    self._set_state(AppState.FETCHING_ESI_DATA)
-                    QTimer.singleShot(50, lambda ign=quoted_ign: self._fetch_esi_data(ign))
-                    return
-        except Exception as e:
-            print(f"DEBUG: Error parsing mention-IGN pattern: {e}")
-        
-        if ignored_bot_name and username_lower == ignored_bot_name:
-            print(f"🔧 DEBUG: Message from ignored bot {ignored_bot_name}, checking EVE response logic")
-            if self.current_state == AppState.AWAITING_EVE_RESPONSE and self.last_winner and re.search(rf"(?i)@{re.escape(self.last_winner)}", message) and re.search(r'(?i)\bign\b', message):
-                self.eve2twitch_response = message
-                # Cancel watchdog timer since we have a response
-                try:
-                    if getattr(self, '_eve2twitch_timeout_timer', None):
-                        try:
-                            self._eve2twitch_timeout_timer.cancel()
-                        except Exception:
-                            pass
-                        self._eve2twitch_timeout_timer = None
-                except Exception:
-                    pass
-                    self._set_state(AppState.FETCHING_ESI_DATA)
-                return
+        if self.last_winner and '@' in message and not self.multi_draw_claims and self._route_winner_mention(message):
+            return
 
-            # If a winner has been confirmed with ESI, ignore subsequent !ign commands for this cycle.
-            if self.current_state == AppState.CONFIRMED_WITH_IGN and message_lower.startswith("!ign"):
-                if self.config.get('debug_mode_enabled', False):
-                    self.log_status(f"DEBUG: Ignoring '{message_clean}' from {username}; ESI already processed for this win.")
-                return
-        if self.current_state in [AppState.ANIMATING_WINNER, AppState.FETCHING_ESI_DATA]: 
-            print(f"🔧 DEBUG: In state {self.current_state}, ignoring message")
+        handler = self._message_router.get(self.current_state)
+        if handler is not None:
+            handler(username, message, record)
+
+    def _route_winner_mention(self, message):
+        """Handle '@Winner: IGN "Name"' from any chatter. Returns True if the message was consumed."""
+        mention_ign_match = MENTION_IGN_PATTERN.search(message)
+        if not mention_ign_match:
+            return False
+        mentioned = mention_ign_match.group('tuser')
+        if mentioned.lower() != self.last_winner.lower():
+            return False  # Only accept this flow if the mention targets the current winner
+        quoted_ign = mention_ign_match.group('ign').strip()
+        chat_log.debug("🔧 Detected @mention IGN pattern - mentioned=%r, quoted_ign=%r", mentioned, quoted_ign)
+        if self._router_debug:
+            self.confirmation_log.append(f"Auto-detected registered IGN for @{mentioned}: {quoted_ign} — querying ESI...")
+        # store raw response and move to ESI fetch directly
+        self.eve2twitch_response = message
+        self._cancel_eve2twitch_watchdog()
+        self._start_esi_lookup(quoted_ign)
+        return True
+
+    def _route_collecting(self, username, message, record):
+        message_lower = message.strip().lower()
+        if self._router_entry_type == ENTRY_TYPE_ANYTHING:
+            user_can_enter = bool(message_lower)
+        else:
+            user_can_enter = message_lower == self._router_join_command
+        if not user_can_enter or not self._add_participant(username, record):
             return
-        if self.current_state == AppState.AWAITING_PRIZE_POLL_VOTES:
-            print(f"🔧 DEBUG: In prize poll voting state")
-            if username_lower not in self.prize_poll_voters:
-                try:
-                    vote_number = int(message_clean)
-                    for idx, option_data in enumerate(self.current_poll_options):
-                        if option_data["number"] == vote_number: self.prize_poll_votes[option_data["original_index"]] += 1; self.prize_poll_voters.add(username_lower); self._update_prize_poll_display_in_log(); break
-                except ValueError: pass
+        logging_utils.log_activity("DRAW_ENTRY", username)
+        if self.prewarmer is not None:
+            self.prewarmer.enqueue(username)
+        if self._router_debug:
+            self.log_status(f"Entry added: {username}")
+        self._refresh_participant_views()
+        logging_utils.send_ga_event(self.config, "draw_entry", {"event_label": "UserJoinedDraw", "entry_method": self._router_entry_type}, self.log_status)
+
+    def _route_prize_poll_vote(self, username, message, record):
+        voter_key = record.key if record is not None else username.lower()
+        if voter_key in self.prize_poll_voters:
             return
-        # Confirmation / IGN handling
-        if self.current_state == AppState.AWAITING_CONFIRMATION and self.last_winner and username_lower == self.last_winner.lower():
-            print(f"🔧 DEBUG: Processing confirmation from winner")
-            self.confirmation_message = message_clean
-
-            # Allow the winner to provide their IGN directly with: !ign <IGN_NAME>
-            if message_clean.lower().startswith("!ign "):
-                # Extract provided IGN and start ESI lookup immediately
-                provided_ign = message_clean.split(None, 1)[1].strip()
-                if provided_ign:
-                    print(f"🔧 DEBUG: Winner provided IGN inline: {provided_ign}")
-                    # Move to fetching ESI data for the provided IGN
-                    self._set_state(AppState.FETCHING_ESI_DATA)
-                    # Start ESI lookup for the provided IGN
-                    QTimer.singleShot(50, lambda ign=provided_ign: self._fetch_esi_data(ign))
-                    return
-
-            # If winner types bare !ign we wait for the external EVE bot response
-            if message_lower == "!ign":
-                self._set_state(AppState.AWAITING_EVE_RESPONSE)
-            else:
-                # Any other chat text counts as a simple confirmation without IGN
-                self._set_state(AppState.CONFIRMED_NO_IGN)
+        try:
+            vote_number = int(message.strip())
+        except ValueError:
+            return
+        for option_data in self.current_poll_options:
+            if option_data["number"] == vote_number: self.prize_poll_votes[option_data["original_index"]] += 1; self.prize_poll_voters.add(voter_key); self._update_prize_poll_display_in_log(); break
+
+    def _route_winner_ign_command(self, message_clean):
+        """Handle '!ign <IGN>' / bare '!ign' from the winner. Returns True if handled."""
+        message_lower = message_clean.lower()
+        if message_lower.startswith("!ign "):
+            provided_ign = message_clean.split(None, 1)[1].strip()
+            if provided_ign:
+                chat_log.debug("🔧 Winner provided IGN inline: %s", provided_ign)
+                self._start_esi_lookup(provided_ign)
+                return True
+        if message_lower == "!ign":
+            # Wait for the external EVE bot response
+            self._set_state(AppState.AWAITING_EVE_RESPONSE)
+            return True
+        return False
+
+    def _route_awaiting_confirmation(self, username, message, record):
+        if not self._is_last_winner(username.lower(), record):
+            return
+        message_clean = message.strip()
+        self.confirmation_message = message_clean
+        if not self._route_winner_ign_command(message_clean):
+            # Any other chat text counts as a simple confirmation without IGN
+            self._set_state(AppState.CONFIRMED_NO_IGN)
+
+    def _route_confirmed_no_ign(self, username, message, record):
+        if not self._is_last_winner(username.lower(), record):
+            return
+        if self._route_winner_ign_command(message.strip()):
             return
+        # Allow winner to write IGN in the form: IGN "In Game Name" (without the leading !)
+        ign_quoted_match = IGN_QUOTED_PATTERN.search(message)
+        if ign_quoted_match:
+            provided_ign = ign_quoted_match.group(1).strip()
+            if provided_ign:
+                chat_log.debug("🔧 Winner provided quoted IGN: %s", provided_ign)
+                self._start_esi_lookup(provided_ign)
+
+    def _route_awaiting_eve_response(self, username, message, record):
+        if not ENV_EVE2TWITCH_BOT_NAME or username.lower() != ENV_EVE2TWITCH_BOT_NAME:
+            return
+        winner_pattern = self._winner_mention_pattern()
+        if winner_pattern is not None and winner_pattern.search(message) and IGN_WORD_PATTERN.search(message):
+            self.eve2twitch_response = message
+            self._cancel_eve2twitch_watchdog()
+            self._set_state(AppState.FETCHING_ESI_DATA)
+
+    # --- Multi-winner draws ---
+    def _multi_draw_winner_count(self):
+        if not self.config.get("multi_draw_enabled", False):
+            return 1
+        return max(1, min(self.config.get("multi_draw_count", 1), len(self.entry_pool)))
+
+    def _begin_multi_draw(self, winners):
+        """Open a claim per winner; timers start as each winner is revealed."""
+        self._end_multi_draw()
+        for name in winners:
+            key = self._participant_key_by_name.get(name.lower(), name.lower())
+            self.multi_draw_claims[name] = {"key": key, "status": "revealing", "timer": None, "ign": None}
+            self._multi_claim_by_key[key] = name
+            self._multi_claim_by_key[name.lower()] = name
+        combined = self.config.get("multi_draw_combined_reveal", False)
+        self._multi_draw_reveal_queue = [] if combined else list(winners[1:])
+        self._rebuild_message_router()
+        if self.config.get('debug_mode_enabled', False):
+            self.log_status(f"MULTI-DRAW: {len(winners)} winners selected ({'combined' if combined else 'back-to-back'} reveal): {', '.join(winners)}")
 
-        elif self.current_state == AppState.CONFIRMED_NO_IGN and self.last_winner and username_lower == self.last_winner.lower():
-            # Allow the winner to send !ign or !ign <IGN> after confirmation as well
-            if message_clean.lower().startswith("!ign "):
-                provided_ign = message_clean.split(None, 1)[1].strip()
-                if provided_ign:
-                    print(f"🔧 DEBUG: Confirmed winner provided IGN inline: {provided_ign}")
-                    self._set_state(AppState.FETCHING_ESI_DATA)
-                    QTimer.singleShot(50, lambda ign=provided_ign: self._fetch_esi_data(ign))
-                    return
-            if message_lower == "!ign":
-                print(f"🔧 DEBUG: Processing IGN request from confirmed winner")
-                self._set_state(AppState.AWAITING_EVE_RESPONSE)
-                return
+    def _end_multi_draw(self):
+        """Stop all claim timers and leave multi-draw mode."""
+        if not self.multi_draw_claims:
+            return
+        for claim in self.multi_draw_claims.values():
+            if claim["timer"]:
+                claim["timer"].cancel()
+        self.multi_draw_claims = {}; self._multi_claim_by_key = {}; self._multi_draw_reveal_queue = []
+        self.sound_manager.stop("countdown")
+        self._rebuild_message_router()
+
+    def _handle_multi_draw_reveal(self, winner_name):
+        """Visuals finished for one winner (or the combined reveal): start confirmations, then reveal the next."""
+        if self.current_state != AppState.ANIMATING_WINNER or winner_name not in self.multi_draw_claims:
+            self._end_multi_draw(); self._set_state(AppState.IDLE)
+            return
+        if self._multi_draw_reveal_queue:
+            revealed = [winner_name]
+        else:
+            revealed = [name for name, claim in self.multi_draw_claims.items() if claim["status"] == "revealing"]
 
-            # Allow winner to write IGN in the form: IGN "In Game Name" (without the leading !)
-            ign_quoted_match = re.search(r"\bIGN\s*[\"']([^\"']+)[\"']", message, re.IGNORECASE)
-            if ign_quoted_match:
-                provided_ign = ign_quoted_match.group(1).strip()
-                if provided_ign:
-                    print(f"🔧 DEBUG: Winner provided quoted IGN: {provided_ign}")
-                    self._set_state(AppState.FETCHING_ESI_DATA)
-                    QTimer.singleShot(50, lambda ign=provided_ign: self._fetch_esi_data(ign))
-                    return
-            # Also accept the format: IGN "In Game Name"
-            ign_quoted_match = re.search(r"\bIGN\s*[\"']([^\"']+)[\"']", message, re.IGNORECASE)
-            if ign_quoted_match:
-                provided_ign = ign_quoted_match.group(1).strip()
-                if provided_ign:
-                    print(f"🔧 DEBUG: Confirmed winner provided quoted IGN: {provided_ign}")
-                    self._set_state(AppState.FETCHING_ESI_DATA)
-                    QTimer.singleShot(50, lambda ign=provided_ign: self._fetch_esi_data(ign))
-                    return
-        elif self.current_state == AppState.COLLECTING:
-            print(f"🔧 DEBUG: In COLLECTING state, processing entry")
-            entry_type = self.config.get('entry_condition_type', ENTRY_TYPE_PREDEFINED)
-            print(f"🔧 DEBUG: entry_type = '{entry_type}'")
-            
-            user_can_enter = False
-            if entry_type == ENTRY_TYPE_PREDEFINED: 
-                join_command = self.config.get("join_command", "##INVALID##").lower()
-                user_can_enter = message_lower == join_command
-                print(f"🔧 DEBUG: PREDEFINED - join_command='{join_command}', message_lower='{message_lower}', match={user_can_enter}")
-            elif entry_type == ENTRY_TYPE_CUSTOM: 
-                custom_command = self.config.get("custom_join_command", "##INVALID##").lower()
-                user_can_enter = message_lower == custom_command
-                print(f"🔧 DEBUG: CUSTOM - custom_command='{custom_command}', message_lower='{message_lower}', match={user_can_enter}")
-            elif entry_type == ENTRY_TYPE_ANYTHING: 
-                user_can_enter = bool(message_clean)
-                print(f"🔧 DEBUG: ANYTHING - message_clean='{message_clean}', bool(message_clean)={user_can_enter}")
-            
-            print(f"🔧 DEBUG: user_can_enter = {user_can_enter}")
-            
-            if user_can_enter:
-                existing_participants_lower = {p.lower() for p in self.participants}
-                print(f"🔧 DEBUG: existing participants (lowercase): {existing_participants_lower}")
-                print(f"🔧 DEBUG: username_lower in existing: {username_lower in existing_participants_lower}")
-                
-                if username_lower not in existing_participants_lower:
-                    print(f"🔧 DEBUG: Adding {username} to participants")
-                    self.participants.add(username); logging_utils.log_activity("DRAW_ENTRY", username); self._update_participant_list_widget()
-                    if self.config.get('debug_mode_enabled', False):
-                        self.log_status(f"Entry added: {username}")
-                    self.animation_manager.update_participants(sorted(list(self.participants), key=str.lower))
-                    logging_utils.send_ga_event(self.config, "draw_entry", {"event_label": "UserJoinedDraw", "entry_method": entry_type}, self.log_status)
-                    print(f"🔧 DEBUG: Successfully added {username}. Total participants: {len(self.participants)}")
-                else:
-                    print(f"🔧 DEBUG: {username} already in participants, not adding again")
-            else:
-                print(f"🔧 DEBUG: user_can_enter is False, not adding {username}")
+        self.sound_manager.play("winner")
+        already_counting = any(claim["status"] == "pending" for claim in self.multi_draw_claims.values())
+        conf_timeout = self.config.get('confirmation_timeout', CONFIRMATION_TIMEOUT)
+        for name in revealed:
+            claim = self.multi_draw_claims[name]
+            claim["status"] = "pending"
+            claim["timer"] = self.scheduler.call_later(conf_timeout, lambda name=name: self._multi_draw_claim_timed_out(name))
+            log_donator = f" (Donated by: {self.current_donator})" if self.current_donator != "<NO DONATOR SET>" else ""
+            self.confirmation_log.append(f"\n--- WINNER: {name} | Prize: {self.current_prize}{log_donator} ---")
+        self.selected_winner = ", ".join(name for name, claim in self.multi_draw_claims.items() if claim["status"] != "revealing")
+        self.update_displays()
+        self._announce_multi_draw_winners(revealed, conf_timeout)
+        if not already_counting:
+            self.sound_manager.play("countdown", loops=-1)
+
+        if self._multi_draw_reveal_queue:
+            self.last_winner = self._multi_draw_reveal_queue.pop(0)
+            self.last_winner_key = self._participant_key_by_name.get(self.last_winner.lower())
+            QTimer.singleShot(MULTI_DRAW_REVEAL_GAP_MS, lambda: self._start_js_animation(self._chosen_animation_type_for_draw))
         else:
-            print(f"🔧 DEBUG: In state {self.current_state}, not processing as entry")
+            self._set_state(AppState.AWAITING_CONFIRMATION)
+
+    def _announce_multi_draw_winners(self, names, conf_timeout):
+        prize_text_for_chat = (self.current_prize if self.current_prize != "<NO PRIZE SET>" else "prize").upper()
+        winners_text = ", @".join(names)
+        template = self.config.get("chat_msg_winner_confirmation_needed") or config_manager.DEFAULT_CONFIG.get("chat_msg_winner_confirmation_needed")
+        try:
+            msg = template.format(winner=winners_text, prize=prize_text_for_chat, timeout=conf_timeout)
+        except Exception:
+            msg = f"🎉 Congrats @{winners_text}! 🎉 You won: {prize_text_for_chat}! Type anything in chat within {conf_timeout}s to confirm!"
+        self.schedule_twitch_message(msg, CHAT_PRIORITY_WINNER)
+
+    def _route_multi_draw_confirmation(self, username, message, record):
+        name = None
+        if record is not None:
+            name = self._multi_claim_by_key.get(record.key)
+        if name is None:
+            name = self._multi_claim_by_key.get(username.lower())
+        claim = self.multi_draw_claims.get(name) if name else None
+        if claim is None or claim["status"] != "pending":
+            return
+        claim["status"] = "confirmed"
+        claim["timer"].cancel()
+        message_clean = message.strip()
+        if message_clean.lower().startswith("!ign "):
+            claim["ign"] = message_clean.split(None, 1)[1].strip() or None
+        else:
+            ign_quoted_match = IGN_QUOTED_PATTERN.search(message)
+            if ign_quoted_match:
+                claim["ign"] = ign_quoted_match.group(1).strip() or None
+        ign_text = f" (IGN: {claim['ign']})" if claim["ign"] else ""
+        self.confirmation_log.append(f"✅ {name} confirmed{ign_text}")
+        logging_utils.log_activity("WINNER_CONFIRMED", f"Winner: {name}{ign_text}, Prize: {self.current_prize}")
+        logging_utils.send_ga_event(self.config, "winner_confirmed", {"winner": name, "ign_provided": bool(claim["ign"]), "multi_draw": True}, self.log_status)
+        self._remove_winner_from_participants(name)
+        self._check_multi_draw_complete()
+
+    def _multi_draw_claim_timed_out(self, name):
+        claim = self.multi_draw_claims.get(name)
+        if claim is None or claim["status"] != "pending":
+            return
+        claim["status"] = "timed_out"
+        self.sound_manager.play("fail")
+        self.confirmation_log.append(f"⌛ {name} did not confirm in time")
+        logging_utils.log_activity("WINNER_TIMEOUT", f"Winner: {name}, Prize: {self.current_prize}")
+        self._remove_winner_from_participants(name)  # Users who time out are always removed
+        self._check_multi_draw_complete()
+
+    def _check_multi_draw_complete(self):
+        claims = self.multi_draw_claims
+        if any(claim["status"] in ("revealing", "pending") for claim in claims.values()):
+            return
+        confirmed = [name for name, claim in claims.items() if claim["status"] == "confirmed"]
+        timed_out = len(claims) - len(confirmed)
+        self.confirmation_log.append(f"\n--- Multi-draw complete: {len(confirmed)} confirmed, {timed_out} timed out ---")
+        self.selected_winner = ", ".join(confirmed) if confirmed else "---"
+        self._end_multi_draw()
+        if confirmed:
+            self._remove_confirmed_prize_from_lists()
+        self.last_winner = None; self.last_winner_key = None
+        self._set_state(AppState.IDLE)
+        self.update_displays()
 
     def update_participant_count(self): self.entries_count_label.setText(f"ENTRIES: {len(self.participants)}") 
 
@@ -2592,7 +2738,7 @@ class GiveawayApp(QWidget):
         if hasattr(self, 'animation_type_selector_main'): self.animation_type_selector_main.setEnabled(can_change_selectors) 
         self._update_prize_dropdown_behavior()
         is_connected = self.current_state not in [AppState.STARTING, AppState.BOT_CONNECTING, AppState.BOT_DOWN]; has_participants = bool(self.participants)
-        is_item_checked = any(self.participant_list.item(i).checkState() == Qt.CheckState.Checked for i in range(self.participant_list.count()) if self.participant_list.item(i)) 
+        is_item_checked = self.participant_model.has_checked()
         busy_states = [AppState.ANIMATING_WINNER, AppState.AWAITING_CONFIRMATION, AppState.AWAITING_EVE_RESPONSE, AppState.FETCHING_ESI_DATA, AppState.BOT_CONNECTING, AppState.AWAITING_PRIZE_POLL_VOTES]
         can_purge = True; can_options = self.current_state not in busy_states; can_open_close = is_connected and self.current_state not in busy_states
         can_select = is_connected and self.current_state in finished_states and has_participants
@@ -2622,43 +2768,89 @@ class GiveawayApp(QWidget):
         if hasattr(self, 'start_prize_poll_button'): self.start_prize_poll_button.setEnabled(can_start_poll) 
         self.update_participant_count()
 
-    def _start_confirmation_timer(self, winner_name, timeout):
-        self._stop_confirmation_timer()
-        self.confirmation_stop_event = threading.Event()
-        self.confirmation_timer_thread = threading.Thread(
-            target=run_timer_thread,
-            args=("confirmation", winner_name, timeout, self.confirmation_stop_event, self)
-        )
-        self.confirmation_timer_thread.start()
-
-    def _stop_confirmation_timer(self):
-        if self.confirmation_timer_thread and self.confirmation_timer_thread.is_alive():
-            if self.confirmation_stop_event: self.confirmation_stop_event.set()
-            self.confirmation_timer_thread.join(timeout=1.0)
-            if self.confirmation_timer_thread.is_alive():
-                 print("Warning: Confirmation timer thread did not stop cleanly.")
-        self.confirmation_timer_thread = None
-        self.confirmation_stop_event = None
-
-    def _start_eve_response_timer(self, winner_name, timeout):
-        self._stop_eve_response_timer()
-        self.eve_response_stop_event = threading.Event()
-        self.eve_response_timer_thread = threading.Thread(
-            target=run_timer_thread,
-            args=("eve_response", winner_name, timeout, self.eve_response_stop_event, self)
-        )
-        self.eve_response_timer_thread.start()
-
-    def _stop_eve_response_timer(self):
-        if self.eve_response_timer_thread and self.eve_response_timer_thread.is_alive():
-            if self.eve_response_stop_event: self.eve_response_stop_event.set()
-            self.eve_response_timer_thread.join(timeout=1.0)
-            if self.eve_response_timer_thread.is_alive():
-                 print("Warning: EVE Response timer thread did not stop cleanly.")
-        self.eve_response_timer_thread = None
-        self.eve_response_stop_event = None
-
-    def _start_eve2twitch_lookup(self, twitch_username: str, interval_seconds: int = 1, lookup_timeout: int = None):
+    def _start_countdown_timer(self, timer_type, context, timeout):
+        """Schedule a countdown on the shared scheduler; it reports through the timer_* and play_sound signals."""
+        self._stop_countdown_timer(timer_type)
+        if self.config.get('debug_mode_enabled', False):
+            print(f"TIMER ({timer_type}): Starting for '{context}' ({timeout}s)")
+        cues = [(timeout + at if at < 0 else timeout * at, self._countdown_cue_callback(timer_type, kind, payload))
+                for at, kind, payload in COUNTDOWN_CUES.get(timer_type, ())]
+        on_second = None
+        if timer_type in COUNTDOWN_SECOND_TICKS:
+            on_second = lambda seconds_left: self.timer_update_signal.emit({"type": timer_type, "remaining": seconds_left})
+
+        def _expired():
+            self._countdown_tokens.pop(timer_type, None)
+            self.timer_expired_signal.emit({"type": timer_type, "context": context})
+            if timer_type == "confirmation": self._stop_timer_sounds()
+
+        self._countdown_tokens[timer_type] = self.scheduler.countdown(timeout, _expired, cues, on_second)
+
+    def _countdown_cue_callback(self, timer_type, kind, payload):
+        if kind == "sound":
+            return lambda: self.play_sound_signal.emit({"key": payload, "action": "play"})
+        return lambda: self.timer_update_signal.emit({"type": timer_type, "cue": payload})
+
+    def _stop_countdown_timer(self, timer_type):
+        token = self._countdown_tokens.pop(timer_type, None)
+        if token is not None and not token.cancelled:
+            token.cancel()
+            self.timer_stopped_signal.emit(timer_type)
+
+    def _stop_timer_sounds(self):
+        for key in ("countdown", "timer_high", "timer_mid", "timer_low"):
+            self.play_sound_signal.emit({"key": key, "action": "stop"})
+
+    def _start_confirmation_timer(self, winner_name, timeout): self._start_countdown_timer("confirmation", winner_name, timeout)
+    def _stop_confirmation_timer(self): self._stop_countdown_timer("confirmation")
+    def _start_eve_response_timer(self, winner_name, timeout): self._start_countdown_timer("eve_response", winner_name, timeout)
+    def _stop_eve_response_timer(self): self._stop_countdown_timer("eve_response")
+
+    def _start_winner_prefetch(self, winner):
+        """Speculatively resolve twitch -> IGN -> ESI card (warming the ESI and portrait caches) while
+        the winner animation plays. The result is only consumed once the winner confirms."""
+        self._clear_winner_prefetch()
+        self._prefetch_generation += 1
+        if not (EVE2TWITCH_API_URL and self.config.get('ign_prefetch_enabled', True) and self.config.get('auto_eve2twitch_lookup', True)):
+            return
+        self._winner_prefetch = (winner, self._prefetch_executor.submit(self._prefetch_winner_identity, winner, self._prefetch_generation))
+
+    def _clear_winner_prefetch(self):
+        """Drop the current prefetch, cancelling it if it has not started yet (a re-draw supersedes it)."""
+        if self._winner_prefetch:
+            self._winner_prefetch[1].cancel()
+        self._winner_prefetch = None
+
+    def _prefetch_winner_identity(self, winner, generation):
+        """Prefetch thread: one EVE2Twitch lookup (usually a cache hit for repeat winners), then the full
+        ESI lookup. Returns None if no IGN is registered or a re-draw superseded this winner."""
+        result = EVE2TWITCH_CLIENT.lookup(winner)
+        if result.status != E2T_FOUND or generation != self._prefetch_generation:
+            return None
+        return {"winner": winner, "ign": result.ign, "raw": result.raw, "esi_data": self.esi_resolver.resolve(result.ign)}
+
+    def _prewarm_entrant(self, login):
+        """Pre-warm thread: fill the EVE2Twitch, ESI and portrait caches for one entrant."""
+        result = EVE2TWITCH_CLIENT.lookup(login)
+        if result.status == E2T_FOUND:
+            self.esi_resolver.resolve(result.ign)
+
+    def _winner_prefetch_result(self, winner=None, ign=None):
+        """Finished prefetch result matching the winner (and IGN, if given), else None."""
+        if not self._winner_prefetch:
+            return None
+        prefetch_winner, future = self._winner_prefetch
+        if (winner or self.last_winner or "").lower() != prefetch_winner.lower() or not future.done() or future.cancelled():
+            return None
+        if future.exception() is not None:
+            esi_log.debug("Prefetch for %s failed: %s", prefetch_winner, future.exception())
+            return None
+        result = future.result()
+        if result is None or (ign is not None and result["ign"].lower() != ign.strip().lower()):
+            return None
+        return result
+
+    def _start_eve2twitch_lookup(self, twitch_username: str, lookup_timeout: int = None):
         """Start a background lookup to an EVE2Twitch HTTP API for the given twitch username.
         The URL should be configured via the EVE2TWITCH_API_URL env var and may include '{twitch}' for templating.
         If not configured, this function logs and returns.
@@ -2673,7 +2865,15 @@ class GiveawayApp(QWidget):
             self.log_status("Automatic EVE2Twitch lookup not configured (EVE2TWITCH_API_URL unset). Waiting for bot response instead.")
             return
 
-        # stop existing poll thread if any
+        # The speculative lookup from draw time already found the IGN: skip straight to the card
+        prefetched = self._winner_prefetch_result(twitch_username)
+        if prefetched:
+            if self.config.get('debug_mode_enabled', False):
+                self.log_status(f"Using prefetched EVE2Twitch IGN {prefetched['ign']} for @{twitch_username}")
+            self.eve2twitch_ign_found.emit(twitch_username, prefetched["ign"], prefetched["raw"])
+            return
+
+        # stop existing poll if any
         try:
             if getattr(self, '_eve2twitch_poll_stop_event', None):
                 self._eve2twitch_poll_stop_event.set()
@@ -2683,9 +2883,7 @@ class GiveawayApp(QWidget):
         # Logging of the auto-lookup attempt is handled by _set_state (debug-only).
 
         self._eve2twitch_poll_stop_event = threading.Event()
-        self._eve2twitch_poll_thread = threading.Thread(target=self._eve2twitch_lookup_thread, args=(twitch_username, interval_seconds, self._eve2twitch_poll_stop_event))
-        self._eve2twitch_poll_thread.daemon = True
-        self._eve2twitch_poll_thread.start()
+        self._eve2twitch_poll_future = self._prefetch_executor.submit(self._eve2twitch_lookup_thread, twitch_username, self._eve2twitch_poll_stop_event)
 
         # If a lookup timeout is requested, schedule a fallback to ask for !ign
         try:
@@ -2701,15 +2899,8 @@ class GiveawayApp(QWidget):
                                 pass
                             # If no eve2twitch_response was produced, ask the winner to use !ign
                             if not self.eve2twitch_response:
-                                # Schedule UI-affecting calls on the Qt main thread
-                                try:
-                                    QTimer.singleShot(0, lambda: self.log_status("Automatic EVE2Twitch lookup timed out. Asking winner to provide !ign in chat."))
-                                except Exception:
-                                    print("E2T: Failed to schedule log_status on main thread")
-                                try:
-                                    QTimer.singleShot(0, lambda: self._announce_confirmation_in_chat())
-                                except Exception:
-                                    print("E2T: Failed to schedule announce_confirmation_in_chat on main thread")
+                                self.log_status("Automatic EVE2Twitch lookup timed out. Asking winner to provide !ign in chat.")
+                                self._announce_confirmation_in_chat()
                     finally:
                         # Clear the timer reference
                         try:
@@ -2717,14 +2908,8 @@ class GiveawayApp(QWidget):
                         except Exception:
                             pass
 
-                # Use a threading.Timer so it runs even if the Qt event loop is busy
-                try:
-                    self._eve2twitch_timeout_timer = threading.Timer(float(timeout_secs), _eve2twitch_lookup_timeout_watchdog)
-                    self._eve2twitch_timeout_timer.daemon = True
-                    self._eve2twitch_timeout_timer.start()
-                except Exception:
-                    # Fallback to QTimer if threading.Timer cannot be created
-                    QTimer.singleShot(int(timeout_secs * 1000), _eve2twitch_lookup_timeout_watchdog)
+                # Deadline on the shared scheduler; the returned token's cancel() disarms it
+                self._eve2twitch_timeout_timer = self.scheduler.call_later(float(timeout_secs), _eve2twitch_lookup_timeout_watchdog)
         except Exception:
             pass
 
@@ -2732,8 +2917,8 @@ class GiveawayApp(QWidget):
         try:
             if getattr(self, '_eve2twitch_poll_stop_event', None):
                 self._eve2twitch_poll_stop_event.set()
-            if getattr(self, '_eve2twitch_poll_thread', None) and self._eve2twitch_poll_thread.is_alive():
-                self._eve2twitch_poll_thread.join(timeout=1.0)
+            if getattr(self, '_eve2twitch_poll_future', None):
+                self._eve2twitch_poll_future.cancel()  # Not started yet; a running poll stops at its next backoff wait
         except Exception:
             pass
         # Cancel watchdog timer if present
@@ -2745,124 +2930,67 @@ class GiveawayApp(QWidget):
                     pass
         except Exception:
             pass
-        self._eve2twitch_poll_thread = None
+        self._eve2twitch_poll_future = None
         self._eve2twitch_poll_stop_event = None
         self._eve2twitch_timeout_timer = None
 
-    def _eve2twitch_lookup_thread(self, twitch_username: str, interval_seconds: int, stop_event: threading.Event):
+    def _eve2twitch_lookup_thread(self, twitch_username: str, stop_event: threading.Event):
         try:
-            # Build URL
-            lookup_url = EVE2TWITCH_API_URL
-            if not lookup_url:
+            if not EVE2TWITCH_API_URL:
                 return
 
-            while not stop_event.is_set():
-                try:
-                    # URL-encode the twitch username for safe inclusion
-                    safe_twitch = quote_plus(twitch_username)
-                    if '{twitch}' in lookup_url:
-                        url = lookup_url.format(twitch=safe_twitch)
-                    else:
-                        sep = '&' if '?' in lookup_url else '?'
-                        url = f"{lookup_url}{sep}twitch={safe_twitch}"
-
-                    print(f"EVE2TWITCH: Querying {url}")
-                    resp = requests.get(url, timeout=10)
-                    if resp.status_code == 200:
-                        try:
-                            payload = resp.json()
-                        except Exception:
-                            payload = None
-
-                        raw = resp.text
-                        ign = None
-                        if isinstance(payload, dict):
-                            ign = payload.get('ign') or payload.get('character') or payload.get('name')
-                        if not ign and payload and isinstance(payload, list) and payload:
-                            first = payload[0]
-                            if isinstance(first, dict):
-                                ign = first.get('ign') or first.get('name')
-
-                        if not ign:
-                            m = re.search(r'"([^"\n]{2,40})"', raw)
-                            if m: ign = m.group(1)
-
-                        if ign:
-                                self.eve2twitch_response = raw
-                                print(f"E2T LOOKUP: Found IGN '{ign}' for @{twitch_username}")
-                                try:
-                                    # Emit signal to main thread to log and start ESI fetch
-                                    self.eve2twitch_ign_found.emit(twitch_username, ign, raw)
-                                except Exception:
-                                    # Fallback: attempt to schedule via QTimer on main thread
-                                    try:
-                                        if self.config.get('debug_mode_enabled', False):
-                                            QTimer.singleShot(0, lambda: self.confirmation_log.append(f"EVE2Twitch lookup found IGN: {ign} for @{twitch_username}. Fetching ESI..."))
-                                        QTimer.singleShot(50, lambda ign=ign: self._fetch_esi_data(ign))
-                                    except Exception:
-                                        pass
-                                return
-                    else:
-                        print(f"E2T LOOKUP: HTTP {resp.status_code} for {url}")
-                        # If the API returns 404 the user likely hasn't registered with EVE2Twitch.
-                        # Immediately fall back to asking the user to register or provide their IGN.
-                        # If the API returns 404 the user likely hasn't registered with EVE2Twitch.
-                        # Emit a signal to the main thread to handle this failure case.
-                        if resp.status_code == 404:
-                            try:
-                                # Emit to main thread; the slot will log and schedule chat safely
-                                self.eve2twitch_lookup_failed.emit(twitch_username)
-                            except Exception:
-                                # As fallback, attempt to schedule on main thread via QTimer
-                                try:
-                                    template = self.config.get("chat_msg_auto_lookup_failed") or config_manager.DEFAULT_CONFIG.get("chat_msg_auto_lookup_failed")
-                                    try:
-                                        msg = template.format(winner=twitch_username)
-                                    except Exception:
-                                        msg = f"@{twitch_username} confirmed! We could not validate your EVE IGN automatically. Please register with the IGN bot or type '!ign <your in-game name>' in chat to provide your IGN."
-                                except Exception:
-                                    msg = f"@{twitch_username} confirmed! We could not validate your EVE IGN automatically. Please register with the IGN bot or type '!ign <your in-game name>' in chat to provide your IGN."
-                                try:
-                                    QTimer.singleShot(0, lambda m=msg: self.confirmation_log.append(m))
-                                except Exception:
-                                    print("E2T: Failed to append auto-lookup failed message to confirmation log (fallback)")
-                                try:
-                                    QTimer.singleShot(0, lambda m=msg: self.schedule_twitch_message(m))
-                                except Exception:
-                                    print("E2T: Failed to schedule auto-lookup failed chat message (fallback)")
-                            # Stop polling and exit thread; main thread will handle messaging
-                            return
+            def _log_attempt(attempt, result):
+                e2t_log.debug("@%s -> %s (attempt %d%s)", twitch_username, result.status, attempt + 1, ", cached" if result.cached else "")
 
-                except Exception as e:
-                    print(f"E2T LOOKUP ERR: {e}")
-                # Wait before retry
-                stop_event.wait(timeout=interval_seconds)
+            # Retries with jittered exponential backoff until found / not registered / stopped
+            result = EVE2TWITCH_CLIENT.poll(twitch_username, stop_event, on_attempt=_log_attempt)
+            if result is None or stop_event.is_set():
+                return
+            if result.status == E2T_FOUND:
+                self.eve2twitch_response = result.raw
+                e2t_log.debug("Found IGN '%s' for @%s", result.ign, twitch_username)
+                # Emit signal to main thread to log and start ESI fetch
+                self.eve2twitch_ign_found.emit(twitch_username, result.ign, result.raw)
+            elif result.status == E2T_NOT_REGISTERED:
+                # A 404 means the user hasn't registered with EVE2Twitch; the main thread asks for !ign
+                self.eve2twitch_lookup_failed.emit(twitch_username)
         except Exception as e:
-            print(f"E2T LOOKUP THREAD ERROR: {e}")
-            traceback.print_exc()
+            e2t_log.error("❌ EVE2Twitch lookup for @%s failed: %s", twitch_username, e, exc_info=True)
 
-    def _start_prize_poll_timer(self, timeout):
-        self._stop_prize_poll_timer()
-        self.prize_poll_stop_event = threading.Event()
-        self.prize_poll_timer_thread = threading.Thread(
-            target=run_timer_thread,
-            args=("prize_poll", "PrizePoll", timeout, self.prize_poll_stop_event, self)
-        )
-        self.prize_poll_timer_thread.start()
+    def _start_queued_esi_fetch(self):
+        ign, self._queued_esi_ign = self._queued_esi_ign, None
+        if ign and self.current_state == AppState.FETCHING_ESI_DATA:
+            self._fetch_esi_data(ign)
 
-    def _stop_prize_poll_timer(self):
-        if self.prize_poll_timer_thread and self.prize_poll_timer_thread.is_alive():
-            if self.prize_poll_stop_event: self.prize_poll_stop_event.set()
-            self.prize_poll_timer_thread.join(timeout=1.0)
-            if self.prize_poll_timer_thread.is_alive():
-                print("Warning: Prize Poll timer thread did not stop cleanly.")
-        self.prize_poll_timer_thread = None
-        self.prize_poll_stop_event = None
+    def _start_prize_poll_timer(self, timeout): self._start_countdown_timer("prize_poll", "PrizePoll", timeout)
+    def _stop_prize_poll_timer(self): self._stop_countdown_timer("prize_poll")
 
     def _fetch_esi_data(self, ign):
-        if self.esi_worker_thread and self.esi_worker_thread.isRunning():
+        worker = self.esi_worker_thread
+        if worker and worker.isRunning():
+            if worker.ign.lower() == ign.lower():
+                # Same pilot already in flight: its result arrives on the same signals
+                if self.config.get('debug_mode_enabled', False):
+                    self.log_status(f"ESI lookup for {ign} already running, merging request.")
+                return
+            # Different pilot: drop the stale lookup's result and run this one when the worker exits
+            if self._queued_esi_ign is None:
+                worker.finished.connect(self._start_queued_esi_fetch)
+            try:
+                worker.esi_data_ready.disconnect(self._handle_esi_data_ready)
+                worker.esi_error.disconnect(self._handle_esi_error)
+            except TypeError:
+                pass
+            self._queued_esi_ign = ign
+            if self.config.get('debug_mode_enabled', False):
+                self.log_status(f"ESI worker busy, queued lookup for {ign}.")
+            return
+        prefetched = self._winner_prefetch_result(ign=ign)
+        if prefetched:
+            self._winner_prefetch = None
             if self.config.get('debug_mode_enabled', False):
-                self.log_status("ESI worker busy. Please wait.")
+                self.log_status(f"Using prefetched ESI data for {ign}")
+            QTimer.singleShot(0, lambda data=prefetched["esi_data"]: self._handle_esi_data_ready(data))
             return
         # reset watchdog flag and possibly cancel existing watchdog
         self._esi_response_received = False
@@ -2876,7 +3004,7 @@ class GiveawayApp(QWidget):
         except Exception:
             self._esi_watchdog_timer = None
 
-        self.esi_worker_thread = ESIWorkerThread(ign)
+        self.esi_worker_thread = ESIWorkerThread(ign, self.esi_resolver)
         self.esi_worker_thread.esi_data_ready.connect(self._handle_esi_data_ready)
         self.esi_worker_thread.esi_error.connect(self._handle_esi_error)
         self.esi_worker_thread.start()
@@ -2901,15 +3029,13 @@ class GiveawayApp(QWidget):
                             msg = f"@{self.last_winner} confirmed! Congratulations! Awaiting Capsuleers name, Please type !ign in chat"
                         self.log_status("ESI watchdog: no response within 5s, prompting for IGN in chat")
                         try:
-                            self.schedule_twitch_message(msg)
+                            self.schedule_twitch_message(msg, CHAT_PRIORITY_WINNER, coalesce_key=winner_status_key(self.last_winner))
                         except Exception:
                             pass
                 except Exception:
                     pass
 
-            self._esi_watchdog_timer = threading.Timer(esi_watchdog_timeout, _watchdog_cb)
-            self._esi_watchdog_timer.daemon = True
-            self._esi_watchdog_timer.start()
+            self._esi_watchdog_timer = self.scheduler.call_later(esi_watchdog_timeout, _watchdog_cb)
         except Exception:
             self._esi_watchdog_timer = None
 
@@ -2918,8 +3044,7 @@ class GiveawayApp(QWidget):
         char_name_original = data.get('name', 'N/A')
         corp_name_original = data.get('corporation_name', 'N/A')
         alliance_name_original = data.get('alliance_name') 
-        portrait_base64 = data.get('portrait_base64')
-        portrait_content_type = data.get('portrait_content_type', 'image/png')
+        portrait_url = data.get('portrait_url')
 
         char_name_html = char_name_original.replace('<', '&lt;').replace('>', '&gt;') if isinstance(char_name_original, str) else (char_name_original or "N/A")
         corp_name_html = corp_name_original.replace('<', '&lt;').replace('>', '&gt;') if isinstance(corp_name_original, str) else (corp_name_original or "N/A")
@@ -2955,9 +3080,9 @@ class GiveawayApp(QWidget):
         
         # Portrait section - Table-based centering for QTextEdit compatibility
         html += f"<table style='width: 100%; margin-bottom: 25px;'><tr><td style='text-align: center;'>"
-        if portrait_base64 and portrait_content_type:
+        if portrait_url:
             html += f"<div style='position: relative; display: inline-block;'>"
-            html += f"<img src='data:{portrait_content_type};base64,{portrait_base64}' width='{img_size}' height='{img_size}' "
+            html += f"<img src='{portrait_url}' width='{img_size}' height='{img_size}' "
             html += f"style='border: 4px solid #e8d900; border-radius: 12px; "
             html += f"box-shadow: 0 0 25px rgba(232, 217, 0, 0.6), 0 0 50px rgba(74, 241, 242, 0.3); "
             html += f"transition: transform 0.3s ease; display: block; margin: 0 auto;'>"
@@ -3039,8 +3164,8 @@ class GiveawayApp(QWidget):
             pass
 
         if self.current_state != AppState.FETCHING_ESI_DATA:
-            print(f"MAIN_APP_DEBUG: _handle_esi_data_ready called while in state {self.current_state}; continuing for debug.")
-        print(f"MAIN_APP_DEBUG: _handle_esi_data_ready received data. Portrait base64 present: {bool(data.get('portrait_base64'))}, Type: {data.get('portrait_content_type')}")
+            esi_log.debug("_handle_esi_data_ready called while in state %s; continuing.", self.current_state)
+        esi_log.debug("_handle_esi_data_ready received data. Portrait URL: %s, Type: %s", data.get('portrait_url'), data.get('portrait_content_type'))
 
         # Store the ESI data for potential font size updates
         self._last_esi_data = data.copy()
@@ -3076,7 +3201,7 @@ class GiveawayApp(QWidget):
                 # Announce in chat that IGN was found and congratulate the winner
                 try:
                     # Simple fixed announcement per request
-                    self.schedule_twitch_message("IGN found, congratulations on winning")
+                    self.schedule_twitch_message("IGN found, congratulations on winning", CHAT_PRIORITY_INFO)
                 except Exception as _msg_e:
                     print(f"MAIN_APP_DEBUG: Failed to schedule IGN-found chat message: {_msg_e}")
         except Exception as _e:
@@ -3087,28 +3212,16 @@ class GiveawayApp(QWidget):
             self.confirmation_log.append(f"\n--- ESI Data for {self.last_winner} ---")
         html_sheet = self._format_character_sheet_html(data)
 
-        # If a portrait base64 is present, insert it programmatically into the
-        # QTextEdit using a QTextCursor and QTextImageFormat. This avoids HTML
-        # rendering issues with data: URIs or custom resource schemes.
+        # If a cached portrait is present, insert it programmatically into the
+        # QTextEdit using a QTextCursor and QTextImageFormat pointing at its
+        # file:// URL (QTextDocument loads and caches the file itself).
         try:
-            portrait_b64 = data.get('portrait_base64')
-            portrait_ct = data.get('portrait_content_type', 'image/png')
+            portrait_url = data.get('portrait_url')
             img_inserted = False
-            if portrait_b64:
+            if portrait_url:
                 try:
-                    img_bytes = base64.b64decode(portrait_b64)
-                    qimg = QImage.fromData(img_bytes)
-                    if not qimg.isNull():
-                        doc = self.confirmation_log.document()
-                        resource_name = f"esiimage://{data.get('id')}"
-                        resource_url = QUrl(resource_name)
-                        # Use the ResourceType enum available on QTextDocument in PyQt6
-                        doc.addResource(QTextDocument.ResourceType.ImageResource, resource_url, qimg)
-                        try:
-                            reg = doc.resource(QTextDocument.ResourceType.ImageResource, resource_url)
-                            print(f"MAIN_APP_DEBUG: Resource registration check for {resource_name}: {'FOUND' if reg is not None else 'NOT FOUND'}")
-                        except Exception as _res_e:
-                            print(f"MAIN_APP_DEBUG: Could not query document resource: {_res_e}")
+                    if os.path.exists(QUrl(portrait_url).toLocalFile()):
+                        resource_name = portrait_url
 
                         # Split the HTML around the <img ...> tag so we can insert
                         # the image programmatically between the two parts.
@@ -3168,12 +3281,12 @@ class GiveawayApp(QWidget):
                             except Exception as e:
                                 print(f"MAIN_APP_DEBUG: Failed to append html_after: {e}")
                     else:
-                        print("MAIN_APP_DEBUG: QImage.fromData returned null image.")
+                        print(f"MAIN_APP_DEBUG: Cached portrait file missing: {portrait_url}")
                 except Exception as img_e:
-                    print(f"MAIN_APP_DEBUG: Error decoding or inserting portrait image: {img_e}")
+                    print(f"MAIN_APP_DEBUG: Error inserting portrait image: {img_e}")
 
             # If the image wasn't inserted programmatically, fall back to appending
-            # the full HTML (which may include a file:// URL if earlier code replaced it).
+            # the full HTML (which references the portrait by its file:// URL).
             if not ('img_inserted' in locals() and img_inserted):
                 preview = html_sheet
                 if isinstance(preview, str) and len(preview) > 1000:
@@ -3314,7 +3427,7 @@ class GiveawayApp(QWidget):
             chat_msg = f"@{self.last_winner} confirmed! We could not validate your EVE IGN automatically. Please register with the IGN bot or type '!ign \"your in-game name\"' in chat to provide your IGN."
 
         try:
-            self.schedule_twitch_message(chat_msg)
+            self.schedule_twitch_message(chat_msg, CHAT_PRIORITY_WINNER, coalesce_key=winner_status_key(self.last_winner))
         except Exception:
             pass
 
@@ -3323,6 +3436,8 @@ class GiveawayApp(QWidget):
 
     def _cancel_active_draw_processes(self, reason="Cancelled"):
         self.log_status(f"Cancelling active processes: {reason}")
+        self._end_multi_draw()
+        self._clear_winner_prefetch(); self._prefetch_generation += 1
         self._stop_confirmation_timer()
         self._stop_eve_response_timer()
         self._stop_prize_poll_timer()
@@ -3338,6 +3453,7 @@ class GiveawayApp(QWidget):
         except Exception:
             pass
 
+        self._queued_esi_ign = None
         if self.esi_worker_thread and self.esi_worker_thread.isRunning():
             self.log_status("Stopping ESI worker...")
             self.esi_worker_thread.quit()
@@ -3356,8 +3472,8 @@ class GiveawayApp(QWidget):
 
     @pyqtSlot(dict)
     def _handle_timer_update(self, data):
-        if data.get("type") == "prize_poll":
-            remaining = data.get("remaining", 0)
+        if data.get("type") == "prize_poll" and "remaining" in data:
+            remaining = data["remaining"]  # Whole seconds; ticks only arrive when this changes
             if int(remaining) % 5 == 0 or remaining < 10: 
                 self._update_prize_poll_display_in_log()
                 base_message = f"Prize Poll Time Remaining: {remaining:.0f}s"
@@ -3375,10 +3491,8 @@ class GiveawayApp(QWidget):
         if timer_type == "confirmation" and self.current_state == AppState.AWAITING_CONFIRMATION and self.last_winner == context:
             self.sound_manager.play("fail")
             # Remove the winner from the participants list
-            if self.last_winner in self.participants:
-                self.participants.discard(self.last_winner)
-                self._update_participant_list_widget()
-                self.animation_manager.update_participants(sorted(list(self.participants), key=str.lower))
+            if self._discard_participant(self.last_winner):
+                self._refresh_participant_views()
                 self.log_status(f"Removed {self.last_winner} from draw list due to no response.")
             self._set_state(AppState.TIMED_OUT)
         elif timer_type == "eve_response" and self.current_state == AppState.AWAITING_EVE_RESPONSE and self.last_winner == context: self.sound_manager.play("fail"); self._set_state(AppState.EVE_TIMED_OUT)
@@ -3403,7 +3517,8 @@ class GiveawayApp(QWidget):
          if self.config.get('debug_mode_enabled', False):
              self.log_status("Animation page ready.")
          self.animation_panel_ready_for_display = True
-         self.animation_manager.update_participants(sorted(list(self.participants), key=str.lower))
+         self._flush_pending_participant_rows()
+         self.animation_manager.resync_participants(self.participant_model.names())
          if webengine_available and not self._first_animation_warmup_done and self._animation_widget_ref:
              current_widget = self.main_stack.currentWidget() 
              if not self._animation_widget_ref.isVisible(): self._animation_widget_ref.show()
@@ -3435,6 +3550,10 @@ class GiveawayApp(QWidget):
             self._finish_prize_reveal_and_continue_to_winner_draw()
             return
 
+        if self.multi_draw_claims:
+            self._handle_multi_draw_reveal(winner_name)
+            return
+
         if self.current_state != AppState.ANIMATING_WINNER or winner_name != self.last_winner:
             self._set_state(AppState.IDLE)
             return
@@ -3486,6 +3605,7 @@ class GiveawayApp(QWidget):
         self.effective_channel = self.config.get("target_channel") or self.config.get("channel")
         global CONFIRMATION_TIMEOUT, EVE_RESPONSE_TIMEOUT; CONFIRMATION_TIMEOUT = self.config.get("confirmation_timeout", 90); EVE_RESPONSE_TIMEOUT = self.config.get("eve_response_timeout", 300)
         self.sound_manager.apply_volumes(self.config); self._load_prize_options_into_dropdown(); self.update_displays()
+        self._sync_entrant_index_rule(); self._rebuild_message_router(); self._reweight_entries()
 
         font_changed_from_original = abs(new_font_multiplier - old_font_multiplier) > 0.001
         if font_changed_from_original:
@@ -3497,7 +3617,7 @@ class GiveawayApp(QWidget):
 
         self._update_layout_mode()
         self.update_ui_button_states()
-        logging_utils.init_ga_config_ref(self.config)
+        logging_utils.init_ga_config_ref(self.config); logging_utils.configure_logging(self.config.get('debug_mode_enabled', False))
         if self.config.get("google_analytics_enabled", False): logging_utils._ensure_ga_client_id()
 
     def _remove_completed_prize_from_list(self):
@@ -3805,11 +3925,11 @@ class GiveawayApp(QWidget):
     def remove_selected_participant(self):
         allowed_states = [AppState.IDLE, AppState.COLLECTING, AppState.CONFIRMED_NO_IGN, AppState.CONFIRMED_WITH_IGN, AppState.TIMED_OUT, AppState.EVE_TIMED_OUT, AppState.AWAITING_PRIZE_POLL_VOTES]
         if self.current_state not in allowed_states: QMessageBox.warning(self, "Action Denied", f"Cannot remove in {self.current_state.name} state."); return
-        to_remove = [self.participant_list.item(i).text() for i in range(self.participant_list.count()) if self.participant_list.item(i).checkState() == Qt.CheckState.Checked] 
+        to_remove = self.participant_model.checked_names()
         if not to_remove: self.log_status("No participant(s) checked to remove."); return
         if QMessageBox.question(self, "Remove", f"Remove {len(to_remove)} participant(s)?", QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No) == QMessageBox.StandardButton.Yes:
-            removed_count = sum(1 for name in to_remove if name in self.participants and self.participants.remove(name) is None)
-            if removed_count > 0: self._update_participant_list_widget(); self.log_status(f"Removed {removed_count} participant(s)."); self.animation_manager.update_participants(sorted(list(self.participants), key=str.lower)); self.update_ui_button_states()
+            removed_count = sum(1 for name in to_remove if self._discard_participant(name))
+            if removed_count > 0: self._refresh_participant_views(); self.log_status(f"Removed {removed_count} participant(s)."); self.update_ui_button_states()
 
     @pyqtSlot()
     def copy_eve_response_content(self):
@@ -3844,8 +3964,8 @@ class GiveawayApp(QWidget):
         if self.current_state in cancel_states: prompt = f"Current process will be cancelled.\n\n{prompt}"
         if QMessageBox.question(self, "Confirm Purge", prompt, QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No) == QMessageBox.StandardButton.Yes:
             if self.current_state in cancel_states: self._cancel_active_draw_processes("Purged")
-            self.participants.clear(); self.last_winner = None; self.selected_winner = "---"; self.confirmation_message = None; self.eve2twitch_response = None; self.current_donator = "<NO DONATOR SET>"
-            self._set_state(AppState.IDLE); self._update_participant_list_widget(); self.confirmation_log.append("\n--- LIST PURGED ---"); self.log_status("List PURGED."); self.animation_manager.update_participants([]) 
+            self._clear_participant_entries(); self.last_winner = None; self.selected_winner = "---"; self.confirmation_message = None; self.eve2twitch_response = None; self.current_donator = "<NO DONATOR SET>"
+            self._set_state(AppState.IDLE); self._refresh_participant_views(); self.confirmation_log.append("\n--- LIST PURGED ---"); self.log_status("List PURGED.")
 
     def _start_js_animation(self, animation_type_override=None, is_continuation=False):
         if not self.last_winner:
@@ -3920,6 +4040,7 @@ class GiveawayApp(QWidget):
                 self.log_status("Options cancelled. Reverting to pre-dialog settings if necessary.")
             self.config = self.options_dialog_instance.initial_config_snapshot.copy()
             self.config["customisable_ui_enabled"] = True
+            self._sync_entrant_index_rule(); self._rebuild_message_router()
 
             font_was_reverted = False
             if abs(self.config.get("font_size_multiplier", 1.0) - self._font_multiplier_before_options) > 0.001:
@@ -3983,6 +4104,9 @@ class GiveawayApp(QWidget):
         countdown_s = self.config.get('confirmation_timeout', 90)
         # Add the is_continuation flag to the options passed to JavaScript
         options = {'countdownDurationS': countdown_s, 'isContinuation': is_continuation}
+        if self.multi_draw_claims and self.config.get("multi_draw_combined_reveal", False):
+            # One animation for every winner: the page shows the rest next to the revealed name
+            options['coWinners'] = [name for name, claim in self.multi_draw_claims.items() if claim["status"] == "revealing" and name != winner_name]
 
         tech_theme_animations = [
             config_manager.ANIM_TYPE_HACKING, config_manager.ANIM_TYPE_TRIGLAVIAN,
@@ -4049,18 +4173,14 @@ class GiveawayApp(QWidget):
         Place a sample PNG at `portraits/sample_portrait.png` relative to the app folder to use this.
         """
         try:
-            import os, base64
             sample_path = os.path.join(os.path.dirname(__file__), 'portraits', 'sample_portrait.png')
             if not os.path.exists(sample_path):
                 self.log_status(f"DEBUG: Sample portrait not found at {sample_path}")
                 return
-            with open(sample_path, 'rb') as f:
-                img_bytes = f.read()
-            b64 = base64.b64encode(img_bytes).decode('ascii')
             fake_data = {
                 'id': 99999999,
                 'name': 'DEBUG_Sample',
-                'portrait_base64': b64,
+                'portrait_url': QUrl.fromLocalFile(os.path.abspath(sample_path)).toString(),
                 'portrait_content_type': 'image/png',
                 'corporation_name': 'Debug Corp',
                 'corporation_id': 12345,
@@ -4078,19 +4198,21 @@ class GiveawayApp(QWidget):
          if not self.config.get("enable_test_entries", False): self.log_status("Test entry adding is disabled."); QMessageBox.warning(self, "Feature Disabled", "Enable in Options."); return
          templates = ["QuickFox_{num}","Supercali","Awesome_{num}","Generic_{num}","TestUser_{num}"]
          fake_names = [ (random.choice(templates).replace("{num}", f"{i+1:02d}") )[:25] for i in range(20)]
-         added = {name for name in fake_names if name.lower() not in {p.lower() for p in self.participants}}
+         added = [name for name in fake_names if self._add_participant(name)]
          if added:
-             self.participants.update(added); self._update_participant_list_widget(); self.log_status(f"Added {len(added)} test entries.")
-             self.animation_manager.update_participants(sorted(list(self.participants), key=str.lower))
+             self._refresh_participant_views(); self.log_status(f"Added {len(added)} test entries.")
              for name in added: logging_utils.send_ga_event(self.config, "draw_entry", {"event_label": "TestEntryAdded"}, self.log_status)
          else: self.log_status("All test entries already in list.")
 
     def clear_confirmation_log(self):
         if hasattr(self, 'confirmation_log'): self.confirmation_log.clear() 
 
-    def schedule_twitch_message(self, message):
+    def schedule_twitch_message(self, message, priority=CHAT_PRIORITY_NORMAL, coalesce_key=None):
+        """Queue a chat message on the bot's outbound queue (winner prompts jump ahead of normal/info text)."""
         if self.twitch_thread and self.twitch_thread.bot and self.twitch_thread.loop and self.is_twitch_bot_ready:
-            try: asyncio.run_coroutine_threadsafe(self.twitch_thread.bot.send_chat_message(message), self.twitch_thread.loop)
+            try:
+                if not self.twitch_thread.bot.outbox.submit(message, priority, coalesce_key):
+                    self.log_status("Error: Chat queue not running, message not sent.")
             except Exception as e: self.log_status(f"Error scheduling Twitch message: {e}")
         else: self.log_status("Error: Bot not ready to send message.")
 
@@ -4321,7 +4443,7 @@ class GiveawayApp(QWidget):
             perc = (votes / total_votes * 100) if total_votes > 0 else 0
             html += f"<tr style='border-bottom:1px solid #333; background:rgba(17,17,17,0.5);'><td style='padding:3px 6px; text-align:center; color:#4af1f2;'>[{opt['number']}]</td><td style='padding:3px 6px; color:#c0c0c0;'><i>{opt['text'].upper()}</i></td><td style='padding:3px 6px; text-align:center; color:#4af1f2;'>{votes}</td><td style='padding:3px 6px; text-align:center; color:#c0c0c0;'>{perc:.0f}%</td></tr>"
         html += "</tbody></table>"
-        if self.prize_poll_timer_thread and self.prize_poll_timer_thread.is_alive(): html += "<p style='text-align:center; color:#a0a0a0; margin-top:8px; font-size:9pt;'><i>POLL ACTIVE...</i></p>"
+        if "prize_poll" in self._countdown_tokens: html += "<p style='text-align:center; color:#a0a0a0; margin-top:8px; font-size:9pt;'><i>POLL ACTIVE...</i></p>"
         elif total_votes >= 0: html += f"<p style='text-align:center; color:#e8d900; margin-top:8px; font-size:9pt;'><b>POLL CONCLUDED | TOTAL: {total_votes}</b></p>"
         
         # Add debug information if debug mode is enabled
@@ -4379,7 +4501,14 @@ class GiveawayApp(QWidget):
 
         self.stop_twitch_connection(); self._stop_confirmation_timer(); self._stop_eve_response_timer(); self._stop_prize_poll_timer()
         if self.esi_worker_thread and self.esi_worker_thread.isRunning(): self.esi_worker_thread.quit(); self.esi_worker_thread.wait(1000)
-        if self.timer_poll_qtimer.isActive(): self.timer_poll_qtimer.stop()
+        ESI_CLIENT.close()
+        EVE2TWITCH_CLIENT.close()
+        self.scheduler.clear()
+        self._clear_winner_prefetch(); self._stop_eve2twitch_poll()
+        self._prefetch_executor.shutdown(wait=False)
+        if self.prewarmer is not None:
+            self.prewarmer.stop()
+        if self.config.get('debug_mode_enabled', False): self.export_state_trace()
         if self.current_state == AppState.ANIMATING_WINNER: self.animation_manager.cancel_animation()
         if hasattr(self, 'sound_manager'): self.sound_manager.stop_all(); self.sound_manager.quit()
         if self.animation_manager: self.animation_manager.stop()
@@ -13,7 +13,7 @@ import traceback
 from pathlib import Path
 
 # --- PyQt6 Imports ---
-from PyQt6.QtCore import pyqtSignal, QObject, pyqtSlot, QUrl, Qt
+from PyQt6.QtCore import pyqtSignal, QObject, pyqtSlot, QUrl, Qt, QTimer
 from PyQt6.QtGui import QPalette, QColor # Added QPalette, QColor
 from PyQt6.QtWidgets import QLabel, QApplication, QStackedWidget 
 # --- PyQt6 WebEngine Imports ---
@@ -36,11 +36,15 @@ ANIMATION_QWEBCHANNEL_FILE = "assets/qwebchannel.js"
 NETWORK_JS_FILE = "assets/network_animation.js"
 BG_LISTS_JS_FILE = "assets/background_lists.js"
 
+# Participant add/remove deltas are sent to the page at most this often
+PARTICIPANT_SYNC_INTERVAL_MS = 250
+
 class BackendBridge(QObject):
     jsReady = pyqtSignal()
     visualAnimationComplete = pyqtSignal(str)
     requestSound = pyqtSignal(str)
     prizeRevealComplete = pyqtSignal(str, str) # <<< NEW
+    participantResyncRequested = pyqtSignal(int)
 
     @pyqtSlot()
     def js_ready(self):
@@ -64,6 +68,11 @@ class BackendBridge(QObject):
         print(f"ANIM_BRIDGE: Received jsPrizeRevealComplete for prize '{prizeName}'")
         self.prizeRevealComplete.emit(prizeName, donatorName)
 
+    @pyqtSlot(int)
+    def jsRequestParticipantResync(self, jsVersion):
+        print(f"ANIM_BRIDGE: JS requested a full participant resync (JS version {jsVersion}).")
+        self.participantResyncRequested.emit(jsVersion)
+
     @pyqtSlot(str)
     def jsDebugMessage(self, message):
         print(f"JS_DEBUG: {message}")  # This will show JavaScript debug messages in Python console
@@ -85,6 +94,16 @@ class AnimationManager(QObject):
         self._page_load_finished_successfully = False
         self.main_app_ref = parent 
 
+        # Participant delta sync state (see add_participants / resync_participants)
+        self._participant_version = 0
+        self._pending_participant_adds = {}     # lowercase name -> name
+        self._pending_participant_removes = {}  # lowercase name -> name
+        self._participant_source = None         # Callable returning the full sorted list for resyncs
+        self._participant_sync_timer = QTimer(self)
+        self._participant_sync_timer.setSingleShot(True)
+        self._participant_sync_timer.setInterval(PARTICIPANT_SYNC_INTERVAL_MS)
+        self._participant_sync_timer.timeout.connect(self._flush_participant_deltas)
+
         if not webengine_available:
             print("ANIM_MANAGER: WebEngine not available. Creating placeholder.")
             self._view = QLabel("Winner Animation Disabled\n(PyQtWebEngine not installed)")
@@ -135,6 +154,7 @@ class AnimationManager(QObject):
             self._bridge.visualAnimationComplete.connect(self._on_visuals_complete)
             self._bridge.requestSound.connect(self._on_sound_request)
             self._bridge.prizeRevealComplete.connect(self._on_prize_reveal_complete) # <<< NEW
+            self._bridge.participantResyncRequested.connect(lambda _v: self.resync_participants())
             print("ANIM_MANAGER: WebEngine components initialized.")
 
         except Exception as e:
@@ -305,14 +325,67 @@ class AnimationManager(QObject):
              self.error_signal.emit(error_msg)
              traceback.print_exc()
 
+    def set_participant_source(self, source):
+        """Callable returning the full sorted participant list, used for on-demand resyncs."""
+        self._participant_source = source
+
+    def add_participants(self, names):
+        for name in names:
+            key = name.lower()
+            if self._pending_participant_removes.pop(key, None) is None:
+                self._pending_participant_adds[key] = name
+        self._schedule_participant_sync()
+
+    def remove_participants(self, names):
+        for name in names:
+            key = name.lower()
+            if self._pending_participant_adds.pop(key, None) is None:
+                self._pending_participant_removes[key] = name
+        self._schedule_participant_sync()
+
+    def clear_participants(self):
+        self.resync_participants([])
+
     def update_participants(self, participants):
+        """Send the whole participant list (kept for callers that want a full resync)."""
+        self.resync_participants(participants)
+
+    def _schedule_participant_sync(self):
+        if not self._participant_sync_timer.isActive():
+            self._participant_sync_timer.start()
+
+    def _flush_participant_deltas(self):
+        adds = list(self._pending_participant_adds.values())
+        removes = list(self._pending_participant_removes.values())
+        self._pending_participant_adds.clear(); self._pending_participant_removes.clear()
+        if not (adds or removes):
+            return
+        if not self._is_ready or not isinstance(self._view, QWebEngineView):
+            return  # The page gets a full resync once it reports ready
+        self._participant_version += 1
+        try:
+            js_code = f"if(typeof applyParticipantDeltaJS === 'function') {{ applyParticipantDeltaJS({self._participant_version}, {json.dumps(adds)}, {json.dumps(removes)}); }} else {{ console.warn('JS function applyParticipantDeltaJS not found'); }}"
+            self._view.page().runJavaScript(js_code)
+        except Exception as e:
+            error_msg = f"Failed to send participant delta to JS: {e}"
+            print(f"ANIM_MANAGER ERROR: {error_msg}")
+            self.error_signal.emit(error_msg)
+            traceback.print_exc()
+
+    def resync_participants(self, participants=None):
+        """Replace the page's participant list in one go (page load, JS resync request, purge)."""
+        self._participant_sync_timer.stop()
+        self._pending_participant_adds.clear(); self._pending_participant_removes.clear()
+        if participants is None:
+            participants = self._participant_source() if self._participant_source else []
         if not self._is_ready:
             return
         if not isinstance(self._view, QWebEngineView):
              return
+        self._participant_version += 1
         try:
             js_arg = json.dumps(participants);
-            js_code = f"if(typeof updateParticipantsJS === 'function') {{ updateParticipantsJS({js_arg}); }} else {{ console.warn('JS function updateParticipantsJS not found'); }}";
+            js_code = f"if(typeof syncParticipantsJS === 'function') {{ syncParticipantsJS({self._participant_version}, {js_arg}); }} else if(typeof updateParticipantsJS === 'function') {{ updateParticipantsJS({js_arg}); }} else {{ console.warn('JS function updateParticipantsJS not found'); }}";
             self._view.page().runJavaScript(js_code)
         except Exception as e:
             error_msg = f"Failed to send participant list to JS: {e}"
@@ -321,7 +394,7 @@ class AnimationManager(QObject):
             traceback.print_exc()
 
     def update_winner_esi_details_js(self, winner_data: dict):
-        print(f"ANIM_MANAGER: update_winner_esi_details_js called. Portrait base64 present: {bool(winner_data.get('portrait_base64'))}, Type: {winner_data.get('portrait_content_type')}")
+        print(f"ANIM_MANAGER: update_winner_esi_details_js called. Portrait URL: {winner_data.get('portrait_url')}, Type: {winner_data.get('portrait_content_type')}")
         if not self._is_ready or not isinstance(self._view, QWebEngineView):
             print("ANIM_MANAGER WARN: JS not ready or view invalid for ESI update (update_winner_esi_details_js).")
             return
@@ -42,6 +42,7 @@ function callPythonBackend(methodName, ...args) {
                     console.warn(`Cannot call pythonBackend.jsRequestSound with arguments:`, args);
                 }
             } else {
+                if (methodName === 'jsVisualsComplete') showCoWinners();
                 pythonBackend[methodName](...args);
             }
         }
@@ -193,6 +194,7 @@ let currentTrigCodeFinalistCount = OPTIONS.TRIG_CODE_DEFAULT_FINALIST_COUNT;
 let progressRingCircumference = 0; let animationSequenceTimeoutIds = [];
 let isCountdownActive = false; let countdownStartTime = 0;
 let currentWinnerNameForCallback = "Unknown";
+let currentCoWinners = []; // Multi-draw combined reveal: other winners shown alongside the revealed name
 let currentCountdownDurationS = 30;
 let _cachedParticipantList = []; let isBackgroundListsReady = false;
 let currentNodePathStepDuration = NODE_PATH_SPEED_DURATIONS["Normal"];
@@ -204,7 +206,16 @@ const tickSoundDebounceDelay = 120;
 // --- Helper Functions ---
 
 // Universal animation state reset
+function showCoWinners() {
+    const el = document.getElementById('co-winners-display');
+    if (!el) return;
+    el.textContent = currentCoWinners.length ? `ALSO WINNING: ${currentCoWinners.map(n => n.toUpperCase()).join(' • ')}` : '';
+    el.classList.toggle('visible', currentCoWinners.length > 0);
+}
+
 function resetAllAnimationStates() {
+    const coWinnersEl = document.getElementById('co-winners-display');
+    if (coWinnersEl) coWinnersEl.classList.remove('visible');
     resetListState();
     resetTriglavianState();
     resetNodePathState();
@@ -338,6 +349,29 @@ function stopBackgroundNetworkAnimation() { if (typeof NetworkAnimation !== 'und
 function updateParticipantsJS(participantArray) { console.log("JS: updateParticipantsJS function ENTRY. Received type:", typeof participantArray, "Value:", participantArray ? participantArray.slice(0,5) : 'null/undefined'); try { _cachedParticipantList = Array.isArray(participantArray) ? participantArray : []; console.log("JS: _cachedParticipantList updated. Count:", _cachedParticipantList.length); if (isBackgroundListsReady && typeof BackgroundLists !== 'undefined' && typeof BackgroundLists.update === 'function') { console.log("JS: Calling BackgroundLists.update..."); BackgroundLists.update(_cachedParticipantList); console.log("JS: BackgroundLists.update call finished."); } else if (!isBackgroundListsReady) { console.warn("BackgroundLists module not ready yet, skipping update."); } else { console.warn("BackgroundLists module ready but update function not found!"); } } catch (e) { console.error("JS Error within updateParticipantsJS:", e); } }
 window.updateParticipantsJS = updateParticipantsJS;
 
+// --- Participant delta protocol (Python sends versioned add/remove deltas, full list only on resync) ---
+let _participantListVersion = 0;
+function syncParticipantsJS(version, participantArray) { _participantListVersion = version; updateParticipantsJS(participantArray); }
+window.syncParticipantsJS = syncParticipantsJS;
+function _participantInsertIndex(list, lowerName) { let lo = 0, hi = list.length; while (lo < hi) { const mid = (lo + hi) >>> 1; if (list[mid].toLowerCase() < lowerName) lo = mid + 1; else hi = mid; } return lo; }
+function applyParticipantDeltaJS(version, added, removed) {
+    if (version !== _participantListVersion + 1) {
+        console.warn(`JS: Participant delta version ${version} does not follow ${_participantListVersion}, requesting full resync.`);
+        callPythonBackend('jsRequestParticipantResync', _participantListVersion);
+        return;
+    }
+    _participantListVersion = version;
+    try {
+        let list = _cachedParticipantList.slice();
+        if (removed && removed.length) { const removedLower = new Set(removed.map(n => n.toLowerCase())); list = list.filter(n => !removedLower.has(n.toLowerCase())); }
+        if (added && added.length) {
+            added.forEach(name => { const lower = name.toLowerCase(); const idx = _participantInsertIndex(list, lower); if (idx >= list.length || list[idx].toLowerCase() !== lower) list.splice(idx, 0, name); });
+        }
+        updateParticipantsJS(list);
+    } catch (e) { console.error("JS Error within applyParticipantDeltaJS:", e); }
+}
+window.applyParticipantDeltaJS = applyParticipantDeltaJS;
+
 // --- Hacking (Box) Creation / Cycling / Reveal ---
 function createBoxes() { if (!boxesRow) { console.error("Boxes row missing!"); return; } if (boxes.length !== OPTIONS.BOX_COUNT) { boxesRow.innerHTML = ''; boxes = []; for (let i = 0; i < OPTIONS.BOX_COUNT; i++) { const box = document.createElement('div'); box.classList.add('box'); box.id = `box-${i}`; boxesRow.appendChild(box); boxes.push(box); } } }
 function cycleChars() { if (!bodyElement.classList.contains('show-boxes')) { if (cyclingIntervalId) { clearInterval(cyclingIntervalId); cyclingIntervalId = null; } return; } if (boxes.length !== OPTIONS.BOX_COUNT) return; boxes.forEach((box, index) => { if (box && !revealedIndices.has(index)) { box.textContent = getRandomChar(); box.classList.remove('revealed'); } }); }
@@ -1662,7 +1696,7 @@ function handleESIDataUpdate(esiData) {
     }
     // console.log("JS_DEBUG: RAW DATA:", JSON.stringify(esiData));
 
-    console.log(`JS_DEBUG: Portrait base64 present: ${!!esiData.portrait_base64}, Length: ${esiData.portrait_base64 ? esiData.portrait_base64.length : 0}, Type: ${esiData.portrait_content_type}`);
+    console.log(`JS_DEBUG: Portrait URL: ${esiData.portrait_url || 'none'}, Type: ${esiData.portrait_content_type}`);
     console.log(`JS_DEBUG: ESI Data: Name=${esiData.name}, Corp=${esiData.corporation_name}, Alliance=${esiData.alliance_name}`);
 
     // Determine which animation mode's winner display is currently active
@@ -1736,15 +1770,15 @@ function handleESIDataUpdate(esiData) {
         }
 
         if (portraitImgElem) {
-            if (esiData.portrait_base64 && esiData.portrait_content_type) {
-                portraitImgElem.src = `data:${esiData.portrait_content_type};base64,${esiData.portrait_base64}`;
+            if (esiData.portrait_url) {
+                portraitImgElem.src = esiData.portrait_url; // Cached file:// portrait
                 portraitImgElem.alt = "";
                 portraitImgElem.style.display = 'block';
                 console.log("JS_DEBUG: Winner portrait SRC set and displayed.");
             } else {
                 portraitImgElem.src = "#";
                 portraitImgElem.style.display = 'none';
-                console.log("JS_DEBUG: No portrait base64/type, hiding image.");
+                console.log("JS_DEBUG: No portrait URL, hiding image.");
             }
         } else {
             console.warn("JS_DEBUG: Portrait img element not found in active display for ESI update.");
@@ -1910,6 +1944,7 @@ function startAnimation(winnerName, animationType = 'random', options = {}) {
     if (animationContent) animationContent.style.display = 'flex';
 
     currentWinnerNameForCallback = String(winnerName || "Unknown");
+    currentCoWinners = Array.isArray(options.coWinners) ? options.coWinners.map(String) : [];
     console.log(`JS: Stored original winner name: '${currentWinnerNameForCallback}'`);
 
     const revealInterval = options.revealInterval ?? OPTIONS.DEFAULT_REVEAL_INTERVAL_MS;
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+"""
+Entrant Cache Pre-warmer
+While a draw is collecting entries, walks new entrants in the background and
+resolves them (twitch login -> IGN -> ESI card) so the EVE2Twitch, ESI and
+portrait caches are already warm when one of them wins. Rate limited, capped to
+a few worker threads, and paused whenever the app needs the network for an
+interactive lookup.
+"""
+
+import threading
+import time
+from collections import deque
+
+import logging_utils
+
+log = logging_utils.get_logger("prewarm")
+
+PREWARM_WORKERS = 2              # Concurrent pre-warm lookups
+PREWARM_RATE = 2.0               # Lookups started per second, across all workers
+
+
+class CachePrewarmer:
+    """Background queue of logins fed to resolve(login). Each login is resolved at most once until reset()."""
+
+    def __init__(self, resolve, workers=PREWARM_WORKERS, rate=PREWARM_RATE, should_skip=None):
+        self.resolve = resolve
+        self.should_skip = should_skip   # Optional () -> bool; True defers work (e.g. ESI error budget low)
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._queue = deque()
+        self._seen = set()
+        self._cond = threading.Condition()
+        self._running = threading.Event()   # Cleared while paused
+        self._stopped = False
+        self._next_start = 0.0
+        self.warmed = 0
+        self.failed = 0
+        self._threads = [threading.Thread(target=self._worker, name=f"CachePrewarm-{i}", daemon=True) for i in range(max(1, workers))]
+        for thread in self._threads:
+            thread.start()
+
+    def enqueue(self, login):
+        login = login.strip().lstrip('@').lower()
+        if not login:
+            return
+        with self._cond:
+            if login in self._seen:
+                return
+            self._seen.add(login)
+            self._queue.append(login)
+            self._cond.notify()
+
+    def resume(self):
+        self._running.set()
+        with self._cond:
+            self._cond.notify_all()
+
+    def pause(self):
+        """Stop starting new lookups (ones already running finish) so interactive lookups get the network."""
+        self._running.clear()
+
+    def reset(self):
+        """Forget queued and seen logins (a new draw)."""
+        with self._cond:
+            self._queue.clear()
+            self._seen.clear()
+
+    @property
+    def pending(self):
+        return len(self._queue)
+
+    def stop(self):
+        self._running.clear()
+        with self._cond:
+            self._stopped = True
+            self._queue.clear()
+            self._cond.notify_all()
+
+    def _take(self):
+        """Block until a login may be started (not paused, rate slot free). None when stopped."""
+        with self._cond:
+            while True:
+                if self._stopped:
+                    return None
+                if not self._running.is_set() or not self._queue:
+                    self._cond.wait(timeout=1.0)
+                    continue
+                now = time.monotonic()
+                if now < self._next_start:
+                    self._cond.wait(timeout=self._next_start - now)
+                    continue
+                if self.should_skip is not None and self.should_skip():
+                    self._next_start = now + 5.0
+                    continue
+                self._next_start = now + self.interval
+                return self._queue.popleft()
+
+    def _worker(self):
+        while True:
+            login = self._take()
+            if login is None:
+                return
+            try:
+                self.resolve(login)
+                self.warmed += 1
+            except Exception as e:
+                self.failed += 1
+                log.debug("Pre-warm for @%s failed: %s", login, e)
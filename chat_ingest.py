@@ -0,0 +1,252 @@
+# -*- coding: utf-8 -*-
+"""
+Chat Ingest Stage for the Twitch bot thread
+Gathers chat lines from EventSub and the IRC fallback into batches so the
+GUI thread receives one signal per batch instead of one per chat message.
+Every chat line travels through the pipeline as a compact ChatMessage record.
+"""
+
+import threading
+from collections import OrderedDict
+
+from config_manager import ENTRY_TYPE_PREDEFINED, ENTRY_TYPE_ANYTHING
+import logging_utils
+
+log = logging_utils.get_logger("ingest")
+
+# --- Batching Configuration ---
+INGEST_FLUSH_INTERVAL_MS = 25   # Max time a message waits before being delivered
+INGEST_MAX_BATCH_SIZE = 250     # Flush immediately once this many messages are pending
+DEDUP_CAPACITY = 4096           # Message ids remembered for cross-transport dedup
+
+
+class ChatMessage:
+    """Compact chat message record shared by the EventSub and IRC paths."""
+
+    __slots__ = ("user_id", "login", "display_name", "badges", "message_id", "text")
+
+    def __init__(self, login, text, display_name=None, user_id=None, badges=None, message_id=None):
+        self.user_id = user_id                            # int Twitch user id, None if unknown (simulated/test)
+        self.login = login.lower()
+        self.display_name = display_name or login
+        self.badges = badges or {}                        # badge set id -> version, e.g. {"subscriber": "12"}
+        self.message_id = message_id                      # Twitch message id (same for IRC and EventSub)
+        self.text = text
+
+    @property
+    def key(self):
+        """Stable identity: the user id when known, otherwise the lowercase login."""
+        return self.user_id if self.user_id is not None else self.login
+
+    @property
+    def is_subscriber(self):
+        return "subscriber" in self.badges or "founder" in self.badges
+
+    @property
+    def is_moderator(self):
+        return "moderator" in self.badges or "broadcaster" in self.badges
+
+    @property
+    def is_vip(self):
+        return "vip" in self.badges
+
+    def __repr__(self):
+        return f"ChatMessage({self.display_name!r}, id={self.user_id}, text={self.text!r})"
+
+
+def parse_badges(value):
+    """Parse an IRC badges tag value ("subscriber/12,vip/1") into a dict."""
+    badges = {}
+    if value:
+        for badge in value.split(','):
+            name, _, version = badge.partition('/')
+            if name:
+                badges[name] = version
+    return badges
+
+
+class ChatIngest:
+    """Collects chat messages off the GUI thread and delivers them in batches."""
+
+    def __init__(self, deliver_batch, entrant_index=None, flush_interval_ms=INGEST_FLUSH_INTERVAL_MS, max_batch_size=INGEST_MAX_BATCH_SIZE):
+        self._deliver_batch = deliver_batch  # Callable taking a list of ChatMessage records
+        self.entrant_index = entrant_index   # Optional EntrantIndex used to drop non-entries/duplicates
+        self.deduplicator = MessageDeduplicator()  # Drops the second copy when EventSub and IRC both deliver
+        self.flush_interval = max(0.001, flush_interval_ms / 1000.0)
+        self.max_batch_size = max(1, int(max_batch_size))
+
+        self._lock = threading.Lock()
+        self._pending = []
+        self._flush_scheduled = False
+        self._loop = None
+
+        # Simple counters for debugging / load testing
+        self.messages_submitted = 0
+        self.batches_delivered = 0
+
+    def attach_loop(self, loop):
+        """Use the given asyncio loop (the bot thread loop) for timed flushes."""
+        self._loop = loop
+
+    def submit(self, record):
+        """Queue a ChatMessage. Safe to call from any thread."""
+        if self.deduplicator.is_duplicate(record):
+            return
+        if self.entrant_index is not None and not self.entrant_index.admit(record):
+            return
+        batch = None
+        schedule = False
+        with self._lock:
+            self._pending.append(record)
+            self.messages_submitted += 1
+            if len(self._pending) >= self.max_batch_size:
+                batch, self._pending = self._pending, []
+            elif not self._flush_scheduled:
+                self._flush_scheduled = True
+                schedule = True
+
+        if batch:
+            self._deliver(batch)
+        elif schedule:
+            self._schedule_flush()
+
+    def _schedule_flush(self):
+        loop = self._loop
+        if loop is None or loop.is_closed() or not loop.is_running():
+            # No bot loop to time the flush (e.g. simulated messages), deliver right away
+            self.flush()
+            return
+        try:
+            loop.call_soon_threadsafe(loop.call_later, self.flush_interval, self.flush)
+        except RuntimeError:
+            self.flush()
+
+    def flush(self):
+        """Deliver everything that is pending now."""
+        with self._lock:
+            batch, self._pending = self._pending, []
+            self._flush_scheduled = False
+        if batch:
+            self._deliver(batch)
+
+    def _deliver(self, batch):
+        self.batches_delivered += 1
+        try:
+            self._deliver_batch(batch)
+        except Exception as e:
+            log.error("❌ INGEST: Failed to deliver batch of %s messages: %s", len(batch), e)
+
+
+class EntrantIndex:
+    """Thread-safe entrant index shared between the GUI and the ingest stage.
+
+    While the draw is collecting, the ingest stage asks ``admit`` about every chat
+    line so non-entries and repeat entries are dropped before they reach Qt.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entrants = set()  # entrant keys (int user id, or lowercase login when no id is known)
+        self._collecting = False
+        self._entry_type = ENTRY_TYPE_PREDEFINED
+        self._entry_command = ""
+
+        # Counters for debugging / load testing
+        self.duplicates_dropped = 0
+        self.non_entries_dropped = 0
+
+    def set_rule(self, collecting, entry_type, entry_command):
+        """Update the entry rule. Called from the GUI thread on state/config changes."""
+        with self._lock:
+            self._collecting = bool(collecting)
+            self._entry_type = entry_type
+            self._entry_command = (entry_command or "").strip().lower()
+
+    def reset(self, keys):
+        with self._lock:
+            self._entrants = set(keys)
+
+    def add(self, key):
+        with self._lock:
+            self._entrants.add(key)
+
+    def discard(self, key):
+        with self._lock:
+            self._entrants.discard(key)
+
+    def clear(self):
+        with self._lock:
+            self._entrants.clear()
+
+    def __contains__(self, key):
+        return key in self._entrants
+
+    def __len__(self):
+        return len(self._entrants)
+
+    def admit(self, record):
+        """Return True if the message should be forwarded to the GUI thread.
+
+        Outside of collecting everything is forwarded. While collecting only new
+        entrants are forwarded (and claimed), plus '@' messages which the GUI may
+        need for the IGN mention flow.
+        """
+        if not self._collecting:
+            return True
+        message = record.text
+        always_forward = '@' in message
+
+        if self._entry_type == ENTRY_TYPE_ANYTHING:
+            is_entry = bool(message.strip())
+        else:
+            is_entry = message.strip().lower() == self._entry_command
+        if not is_entry:
+            if always_forward:
+                return True
+            self.non_entries_dropped += 1
+            return False
+
+        key = record.key
+        with self._lock:
+            if key in self._entrants:
+                if always_forward:
+                    return True
+                self.duplicates_dropped += 1
+                return False
+            self._entrants.add(key)
+        return True
+
+
+class MessageDeduplicator:
+    """Bounded LRU of Twitch message ids seen at the ingest boundary.
+
+    IRC and EventSub carry the same message id, so with both transports live the
+    second copy of every line is dropped here instead of being processed twice.
+    """
+
+    def __init__(self, capacity=DEDUP_CAPACITY):
+        self.capacity = max(1, int(capacity))
+        self._seen = OrderedDict()
+        self._lock = threading.Lock()
+        self.checks = 0
+        self.hits = 0
+
+    def is_duplicate(self, record):
+        """Return True if this message id was already seen (and remember it otherwise)."""
+        message_id = record.message_id
+        if not message_id:
+            return False  # Simulated/test messages carry no id
+        with self._lock:
+            self.checks += 1
+            if message_id in self._seen:
+                self._seen.move_to_end(message_id)
+                self.hits += 1
+                return True
+            self._seen[message_id] = None
+            if len(self._seen) > self.capacity:
+                self._seen.popitem(last=False)
+        return False
+
+    @property
+    def hit_rate(self):
+        return self.hits / self.checks if self.checks else 0.0
@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+"""
+Outbound Chat Queue
+Every chat message the app sends goes through one queue on the bot's asyncio
+loop. The queue:
+- keeps under Twitch's message rate limit;
+- sends winner prompts before informational text;
+- splits messages over the chat length limit;
+- replaces a still-queued status message with its newer version;
+- retries 429s with backoff;
+- tracks queue depth and send latency.
+"""
+
+import asyncio
+import heapq
+import itertools
+import time
+from collections import deque
+
+import logging_utils
+
+log = logging_utils.get_logger("bot")
+
+CHAT_MAX_LENGTH = 500            # Twitch chat message limit (characters)
+CHAT_RATE_LIMIT = 20             # Messages per window for a non-moderator bot account
+CHAT_RATE_WINDOW = 30.0          # Seconds
+CHAT_MAX_RETRIES = 3             # Extra attempts after a 429
+CHAT_RETRY_BASE = 1.0            # Seconds; doubles per retry when Twitch gives no reset time
+CHAT_RETRY_MAX = 30.0
+CHAT_LATENCY_HISTORY = 50
+
+# Lower sends first
+PRIORITY_WINNER = 0              # Winner prompts: confirm / IGN requests
+PRIORITY_NORMAL = 1              # Draw open/closed, poll announcements
+PRIORITY_INFO = 2                # Informational extras
+
+
+def split_message(text, limit=CHAT_MAX_LENGTH, separator=" | "):
+    """Split text into chat-sized messages, preferring separator boundaries, then spaces."""
+    if len(text) <= limit:
+        return [text]
+    pieces = []
+    for chunk in text.split(separator):
+        while len(chunk) > limit:
+            cut = chunk.rfind(' ', 0, limit + 1)
+            if cut <= 0:
+                cut = limit
+            pieces.append(chunk[:cut].rstrip())
+            chunk = chunk[cut:].lstrip()
+        pieces.append(chunk)
+    messages, current = [], ""
+    for piece in pieces:
+        if not piece:
+            continue
+        candidate = f"{current}{separator}{piece}" if current else piece
+        if len(candidate) <= limit:
+            current = candidate
+        else:
+            messages.append(current)
+            current = piece
+    if current:
+        messages.append(current)
+    return messages
+
+
+class _Outgoing:
+    __slots__ = ("text", "coalesce_key", "submitted", "attempts", "cancelled")
+
+    def __init__(self, text, coalesce_key, submitted):
+        self.text = text
+        self.coalesce_key = coalesce_key
+        self.submitted = submitted
+        self.attempts = 0
+        self.cancelled = False
+
+
+class OutboundChatQueue:
+    """Priority queue drained by one task on the bot loop. submit() may be called from any thread once started."""
+
+    def __init__(self, client, rate_limit=CHAT_RATE_LIMIT, window=CHAT_RATE_WINDOW, max_length=CHAT_MAX_LENGTH):
+        self.client = client          # HelixChatClient: async send(text) -> bool, last_status, last_retry_after
+        self.rate_limit = rate_limit
+        self.window = window
+        self.max_length = max_length
+        self._heap = []               # (priority, seq, _Outgoing)
+        self._seq = itertools.count()
+        self._by_key = {}             # coalesce key -> [_Outgoing] still queued
+        self._sent_at = deque()       # Monotonic send times inside the rate window
+        self._latencies = deque(maxlen=CHAT_LATENCY_HISTORY)
+        self._loop = None
+        self._wakeup = None
+        self._task = None
+        self.sent = 0
+        self.retries = 0
+        self.coalesced = 0
+        self.dropped = 0
+
+    def start(self):
+        """Start the sender task on the running loop (the bot's event loop)."""
+        if self._task is not None and not self._task.done():
+            return
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        self._task = self._loop.create_task(self._run())
+
+    def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def submit(self, message, priority=PRIORITY_NORMAL, coalesce_key=None):
+        """Queue a message (thread-safe). Returns False if the queue has not been started."""
+        if self._loop is None or self._loop.is_closed():
+            return False
+        self._loop.call_soon_threadsafe(self._push, message, priority, coalesce_key, time.monotonic())
+        return True
+
+    def _push(self, message, priority, coalesce_key, submitted):
+        if coalesce_key is not None:
+            for stale in self._by_key.pop(coalesce_key, ()):
+                if not stale.cancelled:
+                    stale.cancelled = True
+                    self.coalesced += 1
+        items = [_Outgoing(part, coalesce_key, submitted) for part in split_message(message, self.max_length)]
+        for item in items:
+            heapq.heappush(self._heap, (priority, next(self._seq), item))
+        if coalesce_key is not None:
+            self._by_key[coalesce_key] = items
+        self._wakeup.set()
+
+    @property
+    def depth(self):
+        return sum(1 for _, _, item in self._heap if not item.cancelled)
+
+    def _discard_cancelled(self):
+        while self._heap and self._heap[0][2].cancelled:
+            heapq.heappop(self._heap)
+
+    async def _wait_for_rate_slot(self):
+        while True:
+            now = time.monotonic()
+            while self._sent_at and now - self._sent_at[0] >= self.window:
+                self._sent_at.popleft()
+            if len(self._sent_at) < self.rate_limit:
+                return
+            await asyncio.sleep(self._sent_at[0] + self.window - now)
+
+    async def _run(self):
+        while True:
+            self._discard_cancelled()
+            if not self._heap:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+            await self._wait_for_rate_slot()
+            # Pick the head only now: anything more urgent queued during the wait goes first
+            self._discard_cancelled()
+            if not self._heap:
+                continue
+            priority, seq, item = heapq.heappop(self._heap)
+            item.cancelled = True  # No longer coalescable
+            self._sent_at.append(time.monotonic())
+            try:
+                ok = await self.client.send(item.text)
+            except Exception as e:
+                log.error("❌ Chat queue: Send failed: %s", e)
+                ok = False
+            if ok:
+                self.sent += 1
+                self._latencies.append(time.monotonic() - item.submitted)
+            elif self.client.last_status == 429 and item.attempts < CHAT_MAX_RETRIES:
+                item.attempts += 1
+                self.retries += 1
+                delay = self.client.last_retry_after or min(CHAT_RETRY_MAX, CHAT_RETRY_BASE * 2 ** (item.attempts - 1))
+                item.cancelled = False
+                heapq.heappush(self._heap, (priority, seq, item))  # Same seq: stays ahead of later messages
+                await asyncio.sleep(delay)
+            else:
+                self.dropped += 1
+                log.warning("⚠️ Chat queue: Dropped message after %s attempt(s): %.80s", item.attempts + 1, item.text)
+
+    def stats(self):
+        latencies = list(self._latencies)
+        return {"depth": self.depth, "sent": self.sent, "retries": self.retries,
+                "coalesced": self.coalesced, "dropped": self.dropped,
+                "avg_latency_ms": sum(latencies) / len(latencies) * 1000 if latencies else 0.0,
+                "max_latency_ms": max(latencies) * 1000 if latencies else 0.0}
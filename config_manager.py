@@ -79,6 +79,9 @@ PRIZE_MODE_STREAMER = "Streamer Choice"
 PRIZE_MODE_POLL = "Twitch Chat Poll"
 VALID_PRIZE_MODES = [PRIZE_MODE_STREAMER, PRIZE_MODE_POLL]
 
+# --- Multi-Draw ---
+MULTI_DRAW_MAX_WINNERS = 20
+
 # --- Max Common Prizes ---
 #MAX_COMMON_PRIZES = 5 # Commented out line
 
@@ -91,6 +94,13 @@ DEFAULT_CONFIG = {
     "window_geometry": None, # <<< Forcing to None for maximized startup
     "enable_test_entries": False,
     "multi_draw_enabled": False,
+    "multi_draw_count": 3,              # Winners sampled per draw when multi-draw is enabled
+    "multi_draw_combined_reveal": False, # One animation for all winners instead of back-to-back reveals
+    # Weighted entries: multipliers on an entrant's draw odds (1.0 = no bonus)
+    "weighted_entries_enabled": False,
+    "subscriber_entry_multiplier": 2.0,
+    "bits_entry_multiplier": 1.5,
+    "loyalty_entry_multiplier": 1.5,
     "target_channel": None,
     "font_size_multiplier": 1.0,
     "customisable_ui_enabled": True,
@@ -126,6 +136,8 @@ DEFAULT_CONFIG = {
     "poll_duration": 30,
     "prize_selection_mode": PRIZE_MODE_POLL,
     "debug_mode_enabled": False,
+    # Also connect the IRC fallback when EventSub works, as a hot standby (duplicates are dropped by message id)
+    "irc_hot_standby_enabled": False,
     # Customisable chat messages (use Python format placeholders: {winner}, {prize}, {timeout})
     "chat_msg_winner_confirmation_needed": "🎉 Congrats @{winner}! 🎉 You won: {prize}! Type anything (or !ign) in chat within {timeout}s to confirm!",
     "chat_msg_auto_lookup_attempt": "@{winner} confirmed! Congratulations! Attempting automatic EVE2Twitch lookup for your EVE IGN — please wait.",
@@ -137,6 +149,10 @@ DEFAULT_CONFIG = {
     "eve2twitch_lookup_timeout": 10,
     # Short watchdog timeout (seconds) used when fetching ESI data after auto-lookup
     "esi_short_timeout": 5,
+    # Resolve the winner's IGN/ESI card in the background while the winner animation plays
+    "ign_prefetch_enabled": True,
+    # Resolve every entrant's IGN/ESI card in the background while the draw is collecting entries
+    "ign_prewarm_enabled": False,
 }
 ENTRY_TYPE_PREDEFINED = "Predefined Command"
 ENTRY_TYPE_ANYTHING = "Type Anything"
@@ -218,6 +234,13 @@ def _validate_font_multiplier(val, default=1.0, min_val=0.7, max_val=2.5):
     except (ValueError, TypeError):
         return float(default)
 
+def _validate_entry_multiplier(val, default, min_val=1.0, max_val=10.0):
+    try:
+        v = float(val)
+        return max(min_val, min(max_val, v))
+    except (ValueError, TypeError):
+        return float(default)
+
 def _validate_geometry_string(geo_str):
     if not isinstance(geo_str, str):
         return False
@@ -371,6 +394,10 @@ def load_config():
         except (ValueError, TypeError): config["eve_response_timeout"] = DEFAULT_CONFIG["eve_response_timeout"]
         if config["eve_response_timeout"] <= 0: config["eve_response_timeout"] = DEFAULT_CONFIG["eve_response_timeout"]
 
+        mdc = config.get("multi_draw_count", DEFAULT_CONFIG["multi_draw_count"])
+        try: config["multi_draw_count"] = max(2, min(MULTI_DRAW_MAX_WINNERS, int(mdc)))
+        except (ValueError, TypeError): config["multi_draw_count"] = DEFAULT_CONFIG["multi_draw_count"]
+
         # --- String / Enum Validations ---
         ect = config.get("entry_condition_type", DEFAULT_CONFIG["entry_condition_type"])
         config["entry_condition_type"] = str(ect) if ect in VALID_ENTRY_TYPES else DEFAULT_CONFIG["entry_condition_type"]
@@ -398,11 +425,18 @@ def load_config():
         config["warning_sounds_volume"] = _validate_volume(config.get("warning_sounds_volume"), DEFAULT_CONFIG["warning_sounds_volume"])
         config["hacking_background_volume"] = _validate_volume(config.get("hacking_background_volume"), DEFAULT_CONFIG["hacking_background_volume"])
         config["countdown_volume"] = _validate_volume(config.get("countdown_volume"), DEFAULT_CONFIG["countdown_volume"])
+        for multiplier_key in ("subscriber_entry_multiplier", "bits_entry_multiplier", "loyalty_entry_multiplier"):
+            config[multiplier_key] = _validate_entry_multiplier(config.get(multiplier_key), DEFAULT_CONFIG[multiplier_key])
         
         # --- Boolean Validations ---
         config["enable_test_entries"] = bool(config.get("enable_test_entries", DEFAULT_CONFIG["enable_test_entries"]))
         config["multi_draw_enabled"] = bool(config.get("multi_draw_enabled", DEFAULT_CONFIG["multi_draw_enabled"]))
+        config["multi_draw_combined_reveal"] = bool(config.get("multi_draw_combined_reveal", DEFAULT_CONFIG["multi_draw_combined_reveal"]))
+        config["weighted_entries_enabled"] = bool(config.get("weighted_entries_enabled", DEFAULT_CONFIG["weighted_entries_enabled"]))
         config["ui_locked"] = bool(config.get("ui_locked", DEFAULT_CONFIG["ui_locked"]))
+        config["irc_hot_standby_enabled"] = bool(config.get("irc_hot_standby_enabled", DEFAULT_CONFIG["irc_hot_standby_enabled"]))
+        config["ign_prefetch_enabled"] = bool(config.get("ign_prefetch_enabled", DEFAULT_CONFIG["ign_prefetch_enabled"]))
+        config["ign_prewarm_enabled"] = bool(config.get("ign_prewarm_enabled", DEFAULT_CONFIG["ign_prewarm_enabled"]))
 
         # --- Geometry Validations ---
         geom_keys = [ "main_action_buttons_geometry", "top_controls_geometry", "entrants_panel_geometry", "main_stack_geometry"]
@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+"""
+Deadline Scheduler for the GUI thread
+Every app timer (confirmation/EVE-response/prize-poll countdowns, their cues
+and per-second ticks, and the lookup watchdogs) lives in one min-heap of deadlines
+served by a single single-shot QTimer. The QTimer is only armed for the
+earliest deadline, so nothing wakes up while no timer is active and no extra
+threads are started however many timers are running.
+"""
+
+import heapq
+import itertools
+import math
+import time
+
+from PyQt6.QtCore import QObject, QTimer, Qt
+
+import logging_utils
+
+log = logging_utils.get_logger("scheduler")
+
+# Heap entries whose token was cancelled are dropped lazily; compact once they dominate
+COMPACT_MIN_ENTRIES = 64
+
+
+class CancelToken:
+    """Cancellation handle shared by one or more scheduled calls."""
+
+    __slots__ = ("cancelled",)
+
+    def __init__(self):
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class _ScheduledCall:
+    __slots__ = ("callback", "token")
+
+    def __init__(self, callback, token):
+        self.callback = callback
+        self.token = token
+
+
+class DeadlineScheduler(QObject):
+    """Min-heap of (deadline, seq, call) driven by one QTimer. GUI thread only."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._heap = []
+        self._seq = itertools.count()
+        self._armed_deadline = None
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.timeout.connect(self._run_due)
+
+    # --- Scheduling ---
+    def call_later(self, delay, callback, token=None):
+        """Run callback once after `delay` seconds. Returns the CancelToken."""
+        return self._push(time.monotonic() + max(0.0, delay), _ScheduledCall(callback, token or CancelToken()))
+
+    def countdown(self, timeout, on_expire, cues=(), on_second=None, token=None):
+        """Schedule a countdown from a precomputed cue list.
+
+        `cues` are (elapsed_seconds, callback) pairs. `on_second(seconds_left)` runs
+        only when the displayed whole second changes, and `on_expire` runs at the end.
+        Everything shares one CancelToken, which is returned to the caller.
+        """
+        token = token or CancelToken()
+        for elapsed, callback in cues:
+            if 0 <= elapsed < timeout:
+                self.call_later(elapsed, callback, token)
+        if on_second:
+            whole = math.ceil(timeout)
+            self.call_later(0, lambda: on_second(whole), token)
+            for seconds_left in range(whole - 1, 0, -1):
+                self.call_later(timeout - seconds_left, lambda seconds_left=seconds_left: on_second(seconds_left), token)
+        self.call_later(timeout, lambda: (token.cancel(), on_expire()), token)
+        return token
+
+    @property
+    def pending(self):
+        """Number of live (not cancelled) scheduled calls."""
+        return sum(1 for _, _, call in self._heap if not call.token.cancelled)
+
+    # --- Internals ---
+    def _push(self, deadline, call):
+        heapq.heappush(self._heap, (deadline, next(self._seq), call))
+        if self._armed_deadline is None or deadline < self._armed_deadline:
+            self._arm()
+        return call.token
+
+    def _arm(self):
+        heap = self._heap
+        while heap and heap[0][2].token.cancelled:
+            heapq.heappop(heap)
+        if len(heap) >= COMPACT_MIN_ENTRIES:
+            live = [entry for entry in heap if not entry[2].token.cancelled]
+            if len(live) * 2 < len(heap):
+                heapq.heapify(live); self._heap = heap = live
+        if not heap:
+            self._armed_deadline = None
+            self._timer.stop()
+            return
+        self._armed_deadline = heap[0][0]
+        delay_ms = max(0, int((self._armed_deadline - time.monotonic()) * 1000 + 0.999))
+        self._timer.start(delay_ms)
+
+    def _run_due(self):
+        now = time.monotonic()
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            _, _, call = heapq.heappop(heap)
+            if call.token.cancelled:
+                continue
+            try:
+                call.callback()
+            except Exception:
+                log.exception("❌ SCHEDULER: Error in scheduled callback")
+            heap = self._heap
+        self._arm()
+
+    def clear(self):
+        """Cancel everything."""
+        for _, _, call in self._heap:
+            call.token.cancel()
+        self._heap = []
+        self._arm()
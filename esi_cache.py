@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+"""
+Persistent ESI Response Cache
+SQLite in the app data folder with an in-memory LRU in front. Entries are
+keyed by method, URL, params and JSON body. Fresh entries (per ESI's Expires /
+Cache-Control headers) are served without touching the network; stale entries
+keep their ETag so they can be revalidated with If-None-Match.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from email.utils import parsedate_to_datetime
+
+import logging_utils
+
+log = logging_utils.get_logger("esi")
+
+ESI_CACHE_FILE = "esi_cache.sqlite3"
+ESI_CACHE_MEMORY_ENTRIES = 512
+ESI_CACHE_MAX_STALE_DAYS = 30   # Stale entries older than this are purged on open
+
+
+class CacheEntry:
+    __slots__ = ("body", "content_type", "etag", "expires")
+
+    def __init__(self, body, content_type, etag, expires):
+        self.body = body                  # Raw response bytes
+        self.content_type = content_type
+        self.etag = etag
+        self.expires = expires            # Epoch seconds after which the entry must be revalidated
+
+    @property
+    def fresh(self):
+        return time.time() < self.expires
+
+
+def cache_key(method, url, params=None, json_data=None):
+    key = f"{method} {url}"
+    if params:
+        key += "?" + "&".join(f"{k}={params[k]}" for k in sorted(params))
+    if json_data is not None:
+        key += " " + json.dumps(json_data, sort_keys=True, separators=(',', ':'))
+    return key
+
+
+def expiry_from_headers(headers, now=None):
+    """Epoch expiry from Cache-Control max-age or Expires; `now` when the response must not be reused."""
+    now = time.time() if now is None else now
+    cache_control = headers.get("Cache-Control", "")
+    for directive in cache_control.split(','):
+        name, _, value = directive.strip().partition('=')
+        if name.lower() in ("no-store", "no-cache"):
+            return now
+        if name.lower() == "max-age" and value.isdigit():
+            return now + int(value)
+    expires = headers.get("Expires")
+    if expires:
+        try:
+            return parsedate_to_datetime(expires).timestamp()
+        except (TypeError, ValueError):
+            pass
+    return now
+
+
+class EsiResponseCache:
+    """Thread-safe two-level (memory LRU + SQLite) cache of ESI response bodies."""
+
+    def __init__(self, path, memory_entries=ESI_CACHE_MEMORY_ENTRIES):
+        self.path = str(path)
+        self.memory_entries = max(1, int(memory_entries))
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0           # Served fresh, no network
+        self.revalidated = 0    # Stale entry confirmed by a 304
+        self.misses = 0         # Not cached (or changed) and fetched in full
+        self._db = None
+        try:
+            self._db = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, body BLOB, content_type TEXT, etag TEXT, expires REAL)")
+            self._db.execute("DELETE FROM responses WHERE expires < ?", (time.time() - ESI_CACHE_MAX_STALE_DAYS * 86400,))
+        except sqlite3.Error as e:
+            log.warning("⚠️ ESI cache: Could not open %s, using memory only: %s", self.path, e)
+            self._db = None
+
+    def get(self, key):
+        """Cached entry for key (fresh or stale), or None."""
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                return entry
+            if self._db is None:
+                return None
+            try:
+                row = self._db.execute("SELECT body, content_type, etag, expires FROM responses WHERE key = ?", (key,)).fetchone()
+            except sqlite3.Error as e:
+                log.warning("⚠️ ESI cache: Read failed: %s", e)
+                return None
+            if row is None:
+                return None
+            entry = CacheEntry(*row)
+            self._remember(key, entry)
+            return entry
+
+    def put(self, key, body, content_type, etag, expires):
+        entry = CacheEntry(body, content_type, etag, expires)
+        with self._lock:
+            self._remember(key, entry)
+            self._write(key, entry)
+        return entry
+
+    def refresh(self, key, entry, expires, etag=None):
+        """A 304 confirmed the entry: extend its lifetime."""
+        with self._lock:
+            entry.expires = expires
+            entry.etag = etag or entry.etag
+            self._remember(key, entry)
+            self._write(key, entry)
+
+    def _remember(self, key, entry):
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _write(self, key, entry):
+        if self._db is None:
+            return
+        try:
+            self._db.execute("INSERT OR REPLACE INTO responses (key, body, content_type, etag, expires) VALUES (?, ?, ?, ?, ?)",
+                             (key, entry.body, entry.content_type, entry.etag, entry.expires))
+        except sqlite3.Error as e:
+            log.warning("⚠️ ESI cache: Write failed: %s", e)
+
+    def count(self, counter):
+        """Bump one of the hits/revalidated/misses counters."""
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def stats(self):
+        lookups = self.hits + self.revalidated + self.misses
+        return {"hits": self.hits, "revalidated": self.revalidated, "misses": self.misses,
+                "hit_rate": (self.hits + self.revalidated) / lookups if lookups else 0.0,
+                "memory_entries": len(self._memory)}
+
+    def close(self):
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
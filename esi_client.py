@@ -0,0 +1,443 @@
+# -*- coding: utf-8 -*-
+"""
+Shared ESI HTTP Client
+One long-lived, thread-safe requests Session for EVE ESI and the image server:
+keep-alive connection pooling, gzip, retries with backoff on transient errors
+a ceiling on concurrent connections, and a small fixed worker pool for running
+independent lookups side by side. An optional EsiResponseCache serves fresh
+responses without the network and revalidates stale ones by ETag. Identical
+in-flight requests are collapsed into one, and an error-limit governor delays or
+sheds non-essential calls when ESI's error budget runs low. Every request is timed (connection setup,
+time to first byte, total) for the debug panel. CharacterResolver turns
+an IGN into the character card (ids, corporation/alliance names, portrait) on
+top of the client, with no Qt dependency, so any thread can run a lookup.
+"""
+
+import json
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.util.retry import Retry
+
+from esi_cache import cache_key, expiry_from_headers
+from portrait_cache import PORTRAIT_EXTENSIONS
+import logging_utils
+
+log = logging_utils.get_logger("esi")
+
+# --- Client Configuration ---
+ESI_MAX_CONNECTIONS = 8          # Ceiling on concurrent connections per host
+ESI_RETRY_TOTAL = 3
+ESI_RETRY_BACKOFF = 0.5          # Seconds; doubles per retry
+ESI_RETRY_STATUSES = (502, 503, 504)  # 420 (error limited) is never retried
+ESI_TIMING_HISTORY = 50          # Recent request timings kept for the debug panel
+ESI_FANOUT_WORKERS = 4           # Threads for concurrent lookups (portrait alongside character/names)
+ESI_ERROR_LIMIT_SHED = 20        # Below this many errors left, non-essential calls are shed
+ESI_ERROR_LIMIT_PAUSE = 5        # Below this, essential calls wait for the error window to reset
+ESI_ERROR_LIMIT_MAX_WAIT = 60    # Seconds; ESI's error window is 60s
+
+
+class EsiRequestShed(requests.exceptions.RequestException):
+    """A non-essential request was dropped because the ESI error budget is low."""
+
+# Per-thread slot for the timing record of the request currently being sent
+_timing_local = threading.local()
+
+
+def _current_timing():
+    return getattr(_timing_local, "timing", None)
+
+
+class _TimedConnectionMixin:
+    """Counts new connections and times their setup (DNS + TCP + TLS). Only wraps connect(), so
+    address fallback, proxies and error handling stay urllib3's own."""
+
+    def connect(self):
+        timing = _current_timing()
+        start = time.perf_counter()
+        super().connect()
+        if timing is not None:
+            timing["connect_ms"] += (time.perf_counter() - start) * 1000
+            timing["new_connections"] += 1
+
+
+class _TimedHTTPConnection(_TimedConnectionMixin, HTTPConnection):
+    pass
+
+
+class _TimedHTTPSConnection(_TimedConnectionMixin, HTTPSConnection):
+    pass
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+def _use_timed_pools(manager):
+    """Point a PoolManager/ProxyManager's http and https pools at the timed connection classes."""
+    manager.pool_classes_by_scheme = dict(manager.pool_classes_by_scheme, http=_TimedHTTPConnectionPool, https=_TimedHTTPSConnectionPool)
+    return manager
+
+
+class _TimedHTTPAdapter(HTTPAdapter):
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        _use_timed_pools(self.poolmanager)
+
+    def proxy_manager_for(self, proxy, **proxy_kwargs):
+        return _use_timed_pools(super().proxy_manager_for(proxy, **proxy_kwargs))
+
+
+class ErrorLimitGovernor:
+    """Tracks X-ESI-Error-Limit-Remain/-Reset and throttles requests before ESI error-limits us."""
+
+    def __init__(self, shed_below=ESI_ERROR_LIMIT_SHED, pause_below=ESI_ERROR_LIMIT_PAUSE):
+        self.shed_below = shed_below
+        self.pause_below = pause_below
+        self.remain = None      # Errors left in the current window (None until ESI has told us)
+        self.reset_at = 0.0     # Monotonic time the current window resets
+        self.shed = 0
+        self.delayed = 0
+        self._lock = threading.Lock()
+
+    def update(self, status_code, headers):
+        remain, reset = headers.get("X-ESI-Error-Limit-Remain"), headers.get("X-ESI-Error-Limit-Reset")
+        with self._lock:
+            if remain is not None and remain.isdigit():
+                self.remain = int(remain)
+            if reset is not None and reset.isdigit():
+                self.reset_at = time.monotonic() + int(reset)
+            if status_code == 420:
+                self.remain = 0
+                if self.reset_at <= time.monotonic():
+                    self.reset_at = time.monotonic() + ESI_ERROR_LIMIT_MAX_WAIT
+        if self.remain is not None and self.remain < self.shed_below:
+            log.warning("⚠️ ESI: Error budget low (%s left, resets in %.0fs)", self.remain, self.reset_at - time.monotonic())
+
+    def budget(self):
+        """(errors left, seconds to reset), or (None, 0) when no window is active."""
+        with self._lock:
+            wait = self.reset_at - time.monotonic()
+            if self.remain is None or wait <= 0:
+                return None, 0.0
+            return self.remain, wait
+
+    @property
+    def low(self):
+        remain, _ = self.budget()
+        return remain is not None and remain < self.shed_below
+
+    def acquire(self, essential=True):
+        """Call before sending: sheds non-essential requests and delays essential ones when the budget is low."""
+        remain, wait = self.budget()
+        if remain is None or remain >= self.shed_below:
+            return
+        if not essential:
+            self.shed += 1
+            raise EsiRequestShed(f"ESI error budget low ({remain} left), skipping non-essential request")
+        if remain < self.pause_below:
+            self.delayed += 1
+            log.warning("⚠️ ESI: Error budget nearly exhausted, waiting %.0fs for reset", wait)
+            time.sleep(min(wait, ESI_ERROR_LIMIT_MAX_WAIT))
+
+
+class EsiClient:
+    """Thread-safe pooled HTTP client shared by every ESI lookup."""
+
+    def __init__(self, base_url, user_agent, default_params=None, timeout=10, max_connections=ESI_MAX_CONNECTIONS):
+        self.base_url = base_url.rstrip('/')
+        self.default_params = dict(default_params or {})
+        self.timeout = timeout
+        self._connection_slots = threading.BoundedSemaphore(max_connections)
+        self._timings = deque(maxlen=ESI_TIMING_HISTORY)
+        self._timings_lock = threading.Lock()
+        self.cache = None  # EsiResponseCache, attached once the app data folder is known
+        self.governor = ErrorLimitGovernor()
+        self._inflight = {}  # request key -> Future shared by identical concurrent requests
+        self._inflight_lock = threading.Lock()
+        self.collapsed = 0
+        self.executor = ThreadPoolExecutor(max_workers=ESI_FANOUT_WORKERS, thread_name_prefix="esi")
+
+        retry = Retry(
+            total=ESI_RETRY_TOTAL, connect=ESI_RETRY_TOTAL, read=ESI_RETRY_TOTAL,
+            backoff_factor=ESI_RETRY_BACKOFF, status_forcelist=ESI_RETRY_STATUSES,
+            allowed_methods=frozenset({"GET", "POST"}),  # ESI's POST /universe/* lookups are read-only
+            raise_on_status=False, respect_retry_after_header=True,
+        )
+        adapter = _TimedHTTPAdapter(pool_connections=4, pool_maxsize=max_connections, pool_block=True, max_retries=retry)
+        self.session = requests.Session()
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({
+            'User-Agent': user_agent,
+            'Accept': 'application/json',
+            'Accept-Encoding': 'gzip, deflate',
+        })
+
+    def attach_cache(self, cache):
+        self.cache = cache
+
+    def url(self, endpoint):
+        """Absolute URL for an ESI path; absolute URLs (e.g. the image server) pass through."""
+        return endpoint if endpoint.startswith(("http://", "https://")) else f"{self.base_url}{endpoint}"
+
+    def request(self, method, endpoint, params=None, json_data=None, timeout=None, esi_params=True, essential=True, use_cache=True):
+        """Send a request and return the requests.Response (already fully read).
+
+        Responses served from the response cache (fresh hit or 304) have `from_cache` set. use_cache=False
+        bypasses the cache, e.g. for image bytes that are stored elsewhere.
+
+        Identical requests already in flight on another thread share that request's response.
+        Raises requests.exceptions.RequestException on network failures, like requests.get/post,
+        and EsiRequestShed when a non-essential request is dropped by the error-limit governor.
+        """
+        url = self.url(endpoint)
+        request_params = dict(self.default_params) if esi_params else {}
+        if params:
+            request_params.update(params)
+        key = cache_key(method, url, request_params, json_data)
+        with self._inflight_lock:
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[key] = Future()
+        if not leader:
+            self.collapsed += 1
+            return flight.result()
+        try:
+            response = self._send(method, url, key, request_params, json_data, timeout, essential, use_cache)
+            flight.set_result(response)
+            return response
+        except BaseException as e:
+            flight.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+
+    def _send(self, method, url, key, request_params, json_data, timeout, essential, use_cache):
+        timing = {"method": method, "url": url, "status": None, "cache": None, "connect_ms": 0.0,
+                  "ttfb_ms": 0.0, "total_ms": 0.0, "new_connections": 0}
+        start = time.perf_counter()
+        _timing_local.timing = timing
+        try:
+            cache = self.cache if use_cache else None
+            entry = cache.get(key) if cache is not None else None
+            if entry is not None and entry.fresh:
+                cache.count("hits"); timing["cache"] = "hit"; timing["status"] = 200
+                return self._cached_response(url, entry)
+
+            self.governor.acquire(essential)
+            headers = {"If-None-Match": entry.etag} if entry is not None and entry.etag else None
+            with self._connection_slots:
+                response = self.session.request(method, url, params=request_params or None, json=json_data,
+                                                headers=headers, timeout=timeout or self.timeout, stream=True)
+                response.content  # Read the body while holding the slot so the connection is released
+            timing["status"] = response.status_code
+            self.governor.update(response.status_code, response.headers)
+            # elapsed runs from sending until the headers are parsed, including any new connection's setup
+            timing["ttfb_ms"] = max(0.0, response.elapsed.total_seconds() * 1000 - timing["connect_ms"])
+
+            if cache is not None:
+                if response.status_code == 304 and entry is not None:
+                    cache.refresh(key, entry, expiry_from_headers(response.headers), response.headers.get("ETag"))
+                    cache.count("revalidated"); timing["cache"] = "revalidated"
+                    return self._cached_response(url, entry)
+                cache.count("misses"); timing["cache"] = "miss"
+                if response.status_code == 200:
+                    etag, expires = response.headers.get("ETag"), expiry_from_headers(response.headers)
+                    if etag or expires > time.time():
+                        cache.put(key, response.content, response.headers.get("Content-Type"), etag, expires)
+            return response
+        finally:
+            _timing_local.timing = None
+            timing["total_ms"] = (time.perf_counter() - start) * 1000
+            with self._timings_lock:
+                self._timings.append(timing)
+            log.debug("🌐 ESI: %s %s -> %s in %.0f ms (connect %.0f, ttfb %.0f)",
+                      method, url, timing["status"], timing["total_ms"], timing["connect_ms"], timing["ttfb_ms"])
+
+    @staticmethod
+    def _cached_response(url, entry):
+        """Build a 200 requests.Response from a cache entry."""
+        response = requests.Response()
+        response.status_code, response.reason, response.url = 200, "OK", url
+        response._content = entry.body
+        response.headers = CaseInsensitiveDict({"Content-Type": entry.content_type or "application/json"})
+        response.encoding = "utf-8"
+        response.from_cache = True
+        return response
+
+    def get(self, endpoint, **kwargs):
+        return self.request("GET", endpoint, **kwargs)
+
+    def post(self, endpoint, json_data=None, **kwargs):
+        return self.request("POST", endpoint, json_data=json_data, **kwargs)
+
+    def recent_timings(self, count=None):
+        """Newest-last list of per-request timing dicts."""
+        with self._timings_lock:
+            timings = list(self._timings)
+        return timings[-count:] if count else timings
+
+    def timing_summary(self, count=6):
+        """One-line summary of the last `count` requests for the debug panel."""
+        timings = self.recent_timings(count)
+        if not timings:
+            return ""
+        total = sum(t["total_ms"] for t in timings)
+        new_conns = sum(t["new_connections"] for t in timings)
+        slowest = max(timings, key=lambda t: t["total_ms"])
+        cache_text = ""
+        if self.cache is not None:
+            stats = self.cache.stats()
+            cache_text = f"cache {stats['hits']}/{stats['revalidated']}/{stats['misses']} hit/304/miss, "
+        remain, _ = self.governor.budget()
+        if remain is not None:
+            cache_text += f"error budget {remain}, "
+        if self.collapsed or self.governor.shed:
+            cache_text += f"{self.collapsed} collapsed/{self.governor.shed} shed, "
+        return (f"ESI: last {len(timings)} req {total:.0f}ms, {new_conns} new conn, {cache_text}"
+                f"slowest {slowest['total_ms']:.0f}ms (conn {slowest['connect_ms']:.0f}/ttfb {slowest['ttfb_ms']:.0f})")
+
+    def close(self):
+        self.executor.shutdown(wait=False)
+        self.session.close()
+        if self.cache is not None:
+            self.cache.close()
+
+
+class CharacterResolver:
+    """IGN -> character card lookups over an EsiClient. Thread-safe; one instance is shared by
+    the ESI worker thread, the winner prefetch and the entrant pre-warmer."""
+
+    def __init__(self, esi, portrait_cache=None):
+        self.esi = esi
+        self.portrait_cache = portrait_cache
+
+    def _request_esi(self, endpoint, method="GET", params=None, json_data=None, is_image=False, essential=True, with_source=False):
+        """JSON (or image bytes) for an ESI call; with_source=True returns (data, served_from_cache)."""
+        url = self.esi.url(endpoint)
+        
+        try:
+            # Image bytes bypass the response cache: the portrait cache keeps them on disk
+            response = self.esi.request(method, endpoint, params=params, json_data=json_data, esi_params=not is_image,
+                                        essential=essential, use_cache=not is_image)
+            response.raise_for_status()
+            data = response.content if is_image else response.json()
+            return (data, getattr(response, 'from_cache', False)) if with_source else data
+        except requests.exceptions.HTTPError as http_err:
+            error_detail = ""
+            try:
+                if not is_image and response.content: 
+                    error_detail = response.json().get("error", "")
+            except json.JSONDecodeError: 
+                error_detail = response.text[:100] 
+            except Exception: pass
+            raise ValueError(f"ESI HTTP Error: {response.status_code} - {error_detail or response.reason} for URL: {url}")
+        except requests.exceptions.RequestException as req_err: 
+            raise ValueError(f"ESI Network Error: {req_err} for URL: {url}")
+        except ValueError as json_err: 
+            raise ValueError(f"ESI Error: Invalid JSON response from URL: {url}. Details: {json_err}")
+
+    def _resolve_names(self, ids):
+        """Batch-resolve corporation/alliance ids to names with one /universe/names/ call."""
+        if not ids:
+            return {}
+        return {entry['id']: entry.get('name') for entry in self._request_esi("/universe/names/", method="POST", json_data=ids)}
+
+    def _fetch_portrait(self, char_id):
+        """Portrait metadata then image bytes into the portrait cache. Returns (file URL, content type); failures give (None, None)."""
+        try:
+            portrait_url_data, metadata_unchanged = self._request_esi(f"/characters/{char_id}/portrait/", essential=False, with_source=True)
+        except ValueError as e:
+            log.debug("ESI portrait lookup error for %s: %s", char_id, e)
+            return None, None
+        portrait_size = 256
+        portrait_url_to_fetch = portrait_url_data.get('px256x256') 
+        if not portrait_url_to_fetch:
+            fallbacks = [('px128x128', 128), ('px512x512', 512), ('px64x64', 64)]
+            for fb_key, portrait_size in fallbacks:
+                portrait_url_to_fetch = portrait_url_data.get(fb_key)
+                if portrait_url_to_fetch:
+                    log.debug("Using fallback portrait URL (%s): %s", fb_key, portrait_url_to_fetch)
+                    break
+        else:
+             log.debug("Selected portrait URL (px256x256) for %s: %s", char_id, portrait_url_to_fetch)
+            
+        portrait_file_url, img_type = None, "image/png" 
+        # The metadata is revalidated through the ESI cache; while it is unchanged the file on disk is current
+        cached_path = self.portrait_cache.lookup(char_id, portrait_size) if self.portrait_cache is not None and metadata_unchanged else None
+        if portrait_url_to_fetch and self.portrait_cache is None:
+            log.debug("No portrait cache directory available, skipping portrait.")
+        elif portrait_url_to_fetch and cached_path is not None:
+            portrait_file_url = self.portrait_cache.file_url(cached_path)
+            img_type = next((ct for ct, ext in PORTRAIT_EXTENSIONS.items() if cached_path.suffix == f".{ext}"), img_type)
+            log.debug("Using cached portrait %s", cached_path)
+        elif portrait_url_to_fetch:
+            try:
+                log.debug("Fetching portrait image from %s", portrait_url_to_fetch)
+                img_bytes = self._request_esi(portrait_url_to_fetch, is_image=True, essential=False) 
+                
+                lower_url = portrait_url_to_fetch.lower()
+                if ".jpg" in lower_url or ".jpeg" in lower_url: img_type = "image/jpeg"
+                elif ".png" in lower_url: img_type = "image/png"
+                elif ".webp" in lower_url: img_type = "image/webp"
+                else: log.debug("Could not determine image type from URL extension for %s, defaulting to %s", portrait_url_to_fetch, img_type)
+
+                portrait_path = self.portrait_cache.store(char_id, portrait_size, img_bytes, img_type)
+                portrait_file_url = self.portrait_cache.file_url(portrait_path)
+                log.debug("Fetched portrait (%d bytes, %s), cached at %s", len(img_bytes), img_type, portrait_path)
+            except Exception as img_e:
+                log.warning("⚠️ ESI portrait fetch/store error for %s: %s", portrait_url_to_fetch, img_e, exc_info=True)
+                portrait_file_url = None 
+        else:
+            log.debug("No portrait URL was selected or available for char_id %s.", char_id)
+        return portrait_file_url, img_type
+
+    def resolve(self, ign):
+        """Run the full lookup for an IGN and return the character card dict. Raises ValueError on ESI errors."""
+        ids_data = self._request_esi(f"/universe/ids/", method="POST", json_data=[ign])
+        if not ids_data or 'characters' not in ids_data or not ids_data['characters']:
+            err_msg = ids_data.get('error', "Character not found or ESI error.") if isinstance(ids_data, dict) else "Character not found."
+            raise ValueError(f"ESI Error for '{ign}': {err_msg}")
+        char_info = ids_data['characters'][0]
+        char_id, resolved_name = char_info.get('id'), char_info.get('name', ign)
+        if not char_id: 
+            raise ValueError(f"No Character ID found for '{ign}'.")
+
+        # Only the ID lookup has to come first: the character -> names chain and the
+        # portrait chain run side by side on the shared ESI pool (3 round trips instead of 6)
+        portrait_future = self.esi.executor.submit(self._fetch_portrait, char_id)
+        char_details = self._request_esi(f"/characters/{char_id}/")
+        corp_id, alliance_id = char_details.get('corporation_id'), char_details.get('alliance_id')
+        # Alliance names are nice-to-have: skip them while the ESI error budget is low
+        name_ids = (corp_id,) if self.esi.governor.low else (corp_id, alliance_id)
+        names = self._resolve_names([entity_id for entity_id in name_ids if entity_id])
+        corp_name = names.get(corp_id, "N/A Corp") if corp_id else "N/A Corp"
+        alliance_name = names.get(alliance_id) if alliance_id else None
+        portrait_file_url, img_type = portrait_future.result()
+
+        card = {
+            'id': char_id, 
+            'name': resolved_name, 
+            'portrait_url': portrait_file_url, 
+            'portrait_content_type': img_type if portrait_file_url else None,    
+            'corporation_name': corp_name,
+            'corporation_id': corp_id, 
+            'alliance_name': alliance_name, 
+            'alliance_id': alliance_id
+        }
+        log.debug("Resolved %s: portrait_url is %s, content_type: %s", resolved_name, portrait_file_url or 'MISSING', img_type if portrait_file_url else 'N/A')
+        return card
@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+"""
+EVE2Twitch Lookup Client
+Resolves a twitch login to the pilot's IGN through the EVE2Twitch API with one
+pooled keep-alive session, polls with exponential backoff and jitter instead of
+a fixed one-second loop, and keeps a persistent login -> IGN cache (SQLite in
+the app data folder) so repeat winners resolve without any HTTP. 404s ("not
+registered") are cached too, for a shorter time.
+"""
+
+import json
+import random
+import re
+import sqlite3
+import threading
+import time
+from urllib.parse import quote_plus
+
+import requests
+from requests.adapters import HTTPAdapter
+
+import logging_utils
+
+log = logging_utils.get_logger("eve2twitch")
+
+EVE2TWITCH_CACHE_FILE = "eve2twitch_cache.sqlite3"
+EVE2TWITCH_TIMEOUT = 5           # Seconds per HTTP attempt
+EVE2TWITCH_FOUND_TTL = 7 * 86400  # Seconds a login -> IGN mapping is trusted
+EVE2TWITCH_MISSING_TTL = 600     # Seconds a 404 is trusted (the winner may register after being asked)
+EVE2TWITCH_BACKOFF_BASE = 0.5    # First retry delay; doubles per attempt
+EVE2TWITCH_BACKOFF_MAX = 8.0
+
+FOUND = "found"
+NOT_REGISTERED = "not_registered"
+ERROR = "error"
+
+
+class LookupResult:
+    __slots__ = ("status", "ign", "raw", "cached")
+
+    def __init__(self, status, ign=None, raw="", cached=False):
+        self.status = status    # FOUND, NOT_REGISTERED or ERROR
+        self.ign = ign
+        self.raw = raw          # Response body, shown in the debug panel
+        self.cached = cached
+
+
+def parse_ign(text):
+    """Pull the IGN out of an EVE2Twitch response body (JSON object/list, or a quoted name in the text)."""
+    try:
+        payload = json.loads(text)
+    except ValueError:
+        payload = None
+    ign = None
+    if isinstance(payload, dict):
+        ign = payload.get('ign') or payload.get('character') or payload.get('name')
+    elif isinstance(payload, list) and payload and isinstance(payload[0], dict):
+        ign = payload[0].get('ign') or payload[0].get('name')
+    if not ign and payload is None:
+        m = re.search(r'"([^"\n]{2,40})"', text)
+        if m: ign = m.group(1)
+    return ign
+
+
+def backoff_delay(attempt, base=EVE2TWITCH_BACKOFF_BASE, cap=EVE2TWITCH_BACKOFF_MAX):
+    """Full-jitter exponential backoff: uniform in [0, min(cap, base * 2**attempt)]."""
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+class Eve2TwitchClient:
+    """Thread-safe EVE2Twitch lookups with a pooled session and a persistent result cache."""
+
+    def __init__(self, url_template, user_agent=None, timeout=EVE2TWITCH_TIMEOUT):
+        self.url_template = url_template
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+        self.session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+        if user_agent:
+            self.session.headers["User-Agent"] = user_agent
+        self._lock = threading.Lock()
+        self._memory = {}   # login -> (LookupResult, expires)
+        self._db = None
+        self.requests_sent = 0
+        self.cache_hits = 0
+
+    def attach_cache(self, path):
+        """Persist results to an SQLite file (memory only if it cannot be opened)."""
+        try:
+            db = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+            db.execute("CREATE TABLE IF NOT EXISTS logins (login TEXT PRIMARY KEY, status TEXT, ign TEXT, raw TEXT, expires REAL)")
+            db.execute("DELETE FROM logins WHERE expires < ?", (time.time(),))
+        except sqlite3.Error as e:
+            log.warning("⚠️ EVE2Twitch cache: Could not open %s, using memory only: %s", path, e)
+            return
+        with self._lock:
+            self._db = db
+
+    def url(self, twitch_login):
+        """API URL for a twitch login (the template may contain '{twitch}', else it is passed as a query param)."""
+        safe_twitch = quote_plus(twitch_login)
+        if '{twitch}' in self.url_template:
+            return self.url_template.format(twitch=safe_twitch)
+        sep = '&' if '?' in self.url_template else '?'
+        return f"{self.url_template}{sep}twitch={safe_twitch}"
+
+    def _cached(self, login):
+        with self._lock:
+            hit = self._memory.get(login)
+            if hit is None and self._db is not None:
+                try:
+                    row = self._db.execute("SELECT status, ign, raw, expires FROM logins WHERE login = ?", (login,)).fetchone()
+                except sqlite3.Error as e:
+                    log.warning("⚠️ EVE2Twitch cache: Read failed: %s", e)
+                    row = None
+                if row is not None:
+                    hit = self._memory[login] = (LookupResult(row[0], row[1], row[2] or "", cached=True), row[3])
+            if hit is None or time.time() >= hit[1]:
+                return None
+            self.cache_hits += 1
+            return hit[0]
+
+    def _remember(self, login, result):
+        ttl = EVE2TWITCH_FOUND_TTL if result.status == FOUND else EVE2TWITCH_MISSING_TTL
+        expires = time.time() + ttl
+        with self._lock:
+            self._memory[login] = (LookupResult(result.status, result.ign, result.raw, cached=True), expires)
+            if self._db is not None:
+                try:
+                    self._db.execute("INSERT OR REPLACE INTO logins (login, status, ign, raw, expires) VALUES (?, ?, ?, ?, ?)",
+                                     (login, result.status, result.ign, result.raw, expires))
+                except sqlite3.Error as e:
+                    log.warning("⚠️ EVE2Twitch cache: Write failed: %s", e)
+
+    def lookup(self, twitch_login, use_cache=True):
+        """One cached-or-HTTP lookup. Network failures and unexpected statuses give an ERROR result."""
+        login = twitch_login.strip().lstrip('@').lower()
+        if use_cache:
+            cached = self._cached(login)
+            if cached is not None:
+                log.debug("EVE2Twitch: cache hit for @%s (%s)", login, cached.status)
+                return cached
+        url = self.url(login)
+        self.requests_sent += 1
+        try:
+            resp = self.session.get(url, timeout=self.timeout)
+        except requests.exceptions.RequestException as e:
+            log.debug("EVE2Twitch: request for @%s failed: %s", login, e)
+            return LookupResult(ERROR, raw=str(e))
+        if resp.status_code == 404:
+            result = LookupResult(NOT_REGISTERED, raw=resp.text)
+        elif resp.status_code == 200:
+            ign = parse_ign(resp.text)
+            result = LookupResult(FOUND if ign else ERROR, ign, resp.text)
+        else:
+            log.debug("EVE2Twitch: HTTP %s for %s", resp.status_code, url)
+            return LookupResult(ERROR, raw=resp.text)
+        if result.status != ERROR:
+            self._remember(login, result)
+        return result
+
+    def poll(self, twitch_login, stop_event, on_attempt=None):
+        """Retry lookup() with jittered exponential backoff until FOUND / NOT_REGISTERED or stop_event is set.
+        Returns the final LookupResult, or None if stopped first."""
+        attempt = 0
+        while not stop_event.is_set():
+            result = self.lookup(twitch_login)
+            if on_attempt:
+                on_attempt(attempt, result)
+            if result.status != ERROR:
+                return result
+            stop_event.wait(timeout=backoff_delay(attempt))
+            attempt += 1
+        return None
+
+    def stats(self):
+        return {"requests": self.requests_sent, "cache_hits": self.cache_hits}
+
+    def close(self):
+        self.session.close()
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+"""
+Helix Chat Client
+Sends chat messages through Twitch's Helix "Send Chat Message" endpoint from
+the bot's asyncio loop. One aiohttp session (keep-alive connections) lives for
+the whole bot session, and the broadcaster and sender user IDs are resolved
+once and cached, so each message costs a single round trip.
+"""
+
+import asyncio
+import time
+
+import aiohttp
+
+import logging_utils
+
+log = logging_utils.get_logger("bot")
+
+HELIX_BASE_URL = "https://api.twitch.tv/helix"
+HELIX_TIMEOUT = 10               # Seconds per request
+HELIX_MAX_CONNECTIONS = 4
+
+
+class HelixChatClient:
+    """Non-blocking Helix chat sender. Create and use it on the bot's event loop only."""
+
+    def __init__(self, token, client_id, channel, sender_id=None):
+        self.token = token.replace('oauth:', '') if token else token
+        self.client_id = client_id
+        self.channel = channel.strip().lstrip('#').lower()
+        self.broadcaster_id = None
+        self.sender_id = str(sender_id) if sender_id else None
+        self.last_status = None       # HTTP status of the last send (429 = rate limited)
+        self.last_retry_after = None  # Seconds until Twitch's rate-limit bucket refills, from the last 429
+        self._session = None
+        self._id_lock = None
+
+    def _headers(self):
+        return {"Authorization": f"Bearer {self.token}", "Client-Id": self.client_id}
+
+    def _get_session(self):
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers=self._headers(),
+                timeout=aiohttp.ClientTimeout(total=HELIX_TIMEOUT),
+                connector=aiohttp.TCPConnector(limit=HELIX_MAX_CONNECTIONS))
+        return self._session
+
+    async def _user_id(self, login=None):
+        """User ID for a login, or for the token's own user when login is None."""
+        params = {"login": login} if login else None
+        async with self._get_session().get(f"{HELIX_BASE_URL}/users", params=params) as resp:
+            if resp.status != 200:
+                log.error("❌ Helix: Could not fetch user %s: %s - %s", login or "(token user)", resp.status, await resp.text())
+                return None
+            data = (await resp.json()).get("data") or []
+            return data[0]["id"] if data else None
+
+    async def resolve_ids(self):
+        """Look up (once per session) the broadcaster and sender IDs. Returns True when both are known."""
+        if self.broadcaster_id and self.sender_id:
+            return True
+        if self._id_lock is None:
+            self._id_lock = asyncio.Lock()
+        async with self._id_lock:
+            try:
+                if not self.broadcaster_id:
+                    self.broadcaster_id = await self._user_id(self.channel)
+                if not self.sender_id:
+                    self.sender_id = await self._user_id()
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                log.error("❌ Helix: User ID lookup failed: %s", e)
+            if self.broadcaster_id and self.sender_id:
+                log.debug("🔗 Helix: broadcaster %s=%s, sender=%s", self.channel, self.broadcaster_id, self.sender_id)
+                return True
+            log.error("❌ Helix: Could not resolve broadcaster/sender IDs for %s", self.channel)
+            return False
+
+    async def send(self, message):
+        """Send one chat message. Returns True if Twitch accepted it."""
+        if not await self.resolve_ids():
+            return False
+        payload = {"broadcaster_id": self.broadcaster_id, "sender_id": self.sender_id, "message": message}
+        try:
+            async with self._get_session().post(f"{HELIX_BASE_URL}/chat/messages", json=payload) as resp:
+                self.last_status = resp.status
+                if resp.status == 429:
+                    reset = resp.headers.get("Ratelimit-Reset")
+                    self.last_retry_after = max(0.0, float(reset) - time.time()) if reset and reset.isdigit() else None
+                    log.warning("⚠️ Helix: Rate limited sending chat message (retry after %ss)", self.last_retry_after)
+                    return False
+                if resp.status != 200:
+                    log.error("❌ Helix API error: %s - %s", resp.status, await resp.text())
+                    return False
+                data = (await resp.json()).get("data") or [{}]
+                if data[0].get("is_sent") is False:
+                    log.warning("⚠️ Helix: Message dropped by Twitch: %s", data[0].get("drop_reason"))
+                    return False
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            self.last_status = None
+            log.error("❌ Error sending message via Helix API: %s", e)
+            return False
+        log.info("✅ Message sent successfully via Helix API: %s", message)
+        return True
+
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
@@ -1,218 +1,337 @@
 # -*- coding: utf-8 -*-
 """
 IRC Fallback Client for Twitch Chat
-Provides a fallback IRC connection when TwitchIO EventSub is not working
+Provides a fallback IRC connection when TwitchIO EventSub is not working.
+Runs on an asyncio event loop (the TwitchBotThread loop) over TLS.
 """
 
-import socket
-import threading
+import asyncio
+import ssl
 import time
-import re
 from PyQt6.QtCore import QObject, pyqtSignal
 from PyQt6.QtCore import QThread
 
+from chat_ingest import ChatMessage, parse_badges
+import logging_utils
+
+log = logging_utils.get_logger("irc")
+
+# --- IRC Server Details ---
+IRC_SERVER = "irc.chat.twitch.tv"
+IRC_TLS_PORT = 6697
+IRC_PLAIN_PORT = 6667
+IRC_CONNECT_TIMEOUT = 10
+IRC_READ_SIZE = 65536
+IRC_CAPABILITIES = "twitch.tv/tags twitch.tv/commands"
+
+
+class ThroughputCounter:
+    """Counts lines/messages/bytes for a chat transport so IRC and EventSub can be compared."""
+
+    def __init__(self, name):
+        self.name = name
+        self.reset()
+
+    def reset(self):
+        self.lines = 0
+        self.messages = 0
+        self.bytes = 0
+        self.started_at = time.monotonic()
+        self._window_start = self.started_at
+        self._window_messages = 0
+
+    def snapshot(self):
+        """Return totals plus the message rate since the previous snapshot."""
+        now = time.monotonic()
+        window = max(now - self._window_start, 1e-9)
+        window_rate = (self.messages - self._window_messages) / window
+        self._window_start, self._window_messages = now, self.messages
+        uptime = max(now - self.started_at, 1e-9)
+        return {
+            "transport": self.name,
+            "lines": self.lines,
+            "messages": self.messages,
+            "bytes": self.bytes,
+            "uptime_s": round(uptime, 1),
+            "messages_per_s": round(self.messages / uptime, 2),
+            "recent_messages_per_s": round(window_rate, 2),
+        }
+
+
+_TAG_ESCAPES = {':': ';', 's': ' ', '\\': '\\', 'r': '\r', 'n': '\n'}
+
+
+def unescape_tag_value(value):
+    """Undo IRCv3 tag value escaping (\\: \\s \\\\ \\r \\n); other escaped characters lose the backslash."""
+    if '\\' not in value:
+        return value
+    out, i, end = [], 0, len(value)
+    while i < end:
+        ch = value[i]
+        if ch == '\\':
+            i += 1
+            if i < end:  # A trailing lone backslash is dropped
+                out.append(_TAG_ESCAPES.get(value[i], value[i]))
+        else:
+            out.append(ch)
+        i += 1
+    return ''.join(out)
+
+
+def _parse_tags(raw_tags):
+    """Pull the tags we care about out of a raw IRCv3 tag block (bytes, without the leading '@')."""
+    user_id = display_name = message_id = None
+    badges = None
+    for item in raw_tags.split(b';'):
+        name, _, value = item.partition(b'=')
+        if name == b'user-id':
+            user_id = int(value) if value.isdigit() else None
+        elif name == b'display-name':
+            display_name = unescape_tag_value(value.decode('utf-8', 'replace')) or None
+        elif name == b'badges':
+            badges = parse_badges(value.decode('ascii', 'replace'))
+        elif name == b'id':
+            message_id = value.decode('ascii', 'replace') or None
+    return user_id, display_name, badges, message_id
+
+
+def parse_privmsg(line):
+    """Fast PRIVMSG parser for a raw IRC line (bytes, without CRLF).
+
+    Format: [@tags ]:nick!user@host PRIVMSG #channel :message
+    Returns a ChatMessage, or None if the line is not a PRIVMSG.
+    """
+    raw_tags = None
+    if line.startswith(b'@'):
+        tags_end = line.find(b' ')
+        if tags_end < 0:
+            return None
+        raw_tags = line[1:tags_end]
+        line = line[tags_end + 1:]
+    if not line.startswith(b':'):
+        return None
+    prefix_end = line.find(b' ')
+    if prefix_end < 0 or line[prefix_end + 1:prefix_end + 9] != b'PRIVMSG ':
+        return None
+    bang = line.find(b'!', 1, prefix_end)
+    nick = line[1:bang if bang > 0 else prefix_end]
+    channel_end = line.find(b' ', prefix_end + 9)
+    if channel_end < 0:
+        return None
+    text_start = channel_end + 1
+    if line[text_start:text_start + 1] == b':':
+        text_start += 1
+
+    record = ChatMessage(nick.decode('utf-8', 'replace'), line[text_start:].decode('utf-8', 'replace'))
+    if raw_tags:
+        user_id, display_name, badges, message_id = _parse_tags(raw_tags)
+        record.user_id = user_id
+        record.display_name = display_name or record.display_name
+        record.badges = badges or {}
+        record.message_id = message_id
+    return record
+
 
 class TwitchIRCClient(QObject):
-    """IRC fallback client for Twitch chat."""
-    
-    message_received = pyqtSignal(str, str)  # username, message
+    """Asyncio IRC fallback client for Twitch chat."""
+
+    message_received = pyqtSignal(str, str)  # login, message (only emitted when no callback is set)
     connection_status = pyqtSignal(bool)     # connected status
-    
-    def __init__(self, oauth_token, bot_nick, channel_name, message_callback=None):
+
+    def __init__(self, oauth_token, bot_nick, channel_name, message_callback=None, use_tls=True):
         super().__init__()
         self.oauth_token = oauth_token
         self.bot_nick = bot_nick
         self.channel_name = channel_name
-        self.message_callback = message_callback
-        
-        self.socket = None
+        self.message_callback = message_callback  # Called with a ChatMessage on the client loop
+        self._bot_nick_lower = (bot_nick or "").lower()
+
+        self.loop = None
+        self._reader = None
+        self._writer = None
+        self._listen_task = None
         self.connected = False
         self.running = False
-        self.thread = None
-        
+
         # IRC server details
-        self.server = "irc.chat.twitch.tv"
-        self.port = 6667
-        
-    def connect(self):
-        """Connect to Twitch IRC server."""
+        self.server = IRC_SERVER
+        self.use_tls = use_tls
+        self.port = IRC_TLS_PORT if use_tls else IRC_PLAIN_PORT
+
+        self.stats = ThroughputCounter("IRC")
+
+    async def connect(self):
+        """Connect to Twitch IRC server on the running event loop and start listening."""
         try:
-            print(f"🔌 IRC: Connecting to {self.server}:{self.port}")
-            
-            # Create socket
-            self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.socket.settimeout(10)  # 10 second timeout
-            
-            # Connect to server
-            self.socket.connect((self.server, self.port))
-            
-            # Authenticate
-            self.socket.send(f"PASS oauth:{self.oauth_token}\r\n".encode())
-            self.socket.send(f"NICK {self.bot_nick}\r\n".encode())
-            
-            # Join channel
-            self.socket.send(f"JOIN #{self.channel_name}\r\n".encode())
-            
-            # Start listening thread
+            log.info("🔌 IRC: Connecting to %s:%s (%s)", self.server, self.port, 'TLS' if self.use_tls else 'plaintext')
+            self.loop = asyncio.get_running_loop()
+            ssl_context = ssl.create_default_context() if self.use_tls else None
+            self._reader, self._writer = await asyncio.wait_for(
+                asyncio.open_connection(self.server, self.port, ssl=ssl_context),
+                timeout=IRC_CONNECT_TIMEOUT
+            )
+
+            # Request IRCv3 tags (user ids, badges, message ids), authenticate and join channel
+            self._writer.write(
+                f"CAP REQ :{IRC_CAPABILITIES}\r\n"
+                f"PASS oauth:{self.oauth_token}\r\n"
+                f"NICK {self.bot_nick}\r\n"
+                f"JOIN #{self.channel_name}\r\n".encode()
+            )
+            await self._writer.drain()
+
             self.running = True
-            self.thread = threading.Thread(target=self._listen_loop, daemon=True)
-            self.thread.start()
-            
-            print(f"✅ IRC: Connected to #{self.channel_name}")
             self.connected = True
+            self.stats.reset()
+            self._listen_task = self.loop.create_task(self._listen_loop())
+
+            log.info("✅ IRC: Connected to #%s", self.channel_name)
             self.connection_status.emit(True)
-            
             return True
-            
+
         except Exception as e:
-            print(f"❌ IRC: Connection failed: {e}")
+            log.error("❌ IRC: Connection failed: %s", e)
             self.connected = False
             self.connection_status.emit(False)
             return False
-    
-    def disconnect(self):
+
+    async def close(self):
         """Disconnect from IRC server."""
-        print("🔌 IRC: Disconnecting...")
+        log.info("🔌 IRC: Disconnecting...")
         self.running = False
         self.connected = False
-        
-        if self.socket:
+        if self._listen_task and not self._listen_task.done():
+            self._listen_task.cancel()
+        if self._writer:
             try:
-                self.socket.close()
-            except:
+                self._writer.close()
+                await self._writer.wait_closed()
+            except Exception:
                 pass
-            self.socket = None
-        
+            self._writer = None
         self.connection_status.emit(False)
-        print("✅ IRC: Disconnected")
-    
-    def _listen_loop(self):
-        """Main listening loop for IRC messages."""
-        buffer = ""
-        
+        log.info("✅ IRC: Disconnected")
+
+    def disconnect(self):
+        """Disconnect from any thread (schedules close() on the client loop)."""
+        if self.loop and not self.loop.is_closed():
+            asyncio.run_coroutine_threadsafe(self.close(), self.loop)
+
+    async def _listen_loop(self):
+        """Main listening loop for IRC messages. Lines are framed on a bytearray."""
+        buffer = bytearray()
         try:
-            while self.running and self.socket:
-                try:
-                    # Receive data
-                    data = self.socket.recv(2048).decode('utf-8', errors='ignore')
-                    if not data:
-                        break
-                    
-                    buffer += data
-                    
-                    # Process complete lines
-                    while '\r\n' in buffer:
-                        line, buffer = buffer.split('\r\n', 1)
-                        self._process_irc_line(line)
-                        
-                except socket.timeout:
-                    continue
-                except Exception as e:
-                    print(f"❌ IRC: Error in listen loop: {e}")
+            while self.running:
+                data = await self._reader.read(IRC_READ_SIZE)
+                if not data:
                     break
-                    
+                self.stats.bytes += len(data)
+                buffer += data
+
+                # Process every complete line, then drop them from the buffer in one go
+                start = 0
+                while True:
+                    end = buffer.find(b'\r\n', start)
+                    if end < 0:
+                        break
+                    if end > start:
+                        self._process_irc_line(bytes(buffer[start:end]))
+                    start = end + 2
+                if start:
+                    del buffer[:start]
+
+        except asyncio.CancelledError:
+            pass
         except Exception as e:
-            print(f"❌ IRC: Fatal error in listen loop: {e}")
+            log.error("❌ IRC: Error in listen loop: %s", e)
         finally:
             self.running = False
             self.connected = False
             self.connection_status.emit(False)
-    
+
     def _process_irc_line(self, line):
-        """Process a single IRC line."""
+        """Process a single raw IRC line (bytes)."""
         try:
-            if not line.strip():
-                return
-            
+            self.stats.lines += 1
+
             # Handle PING messages to stay connected
-            if line.startswith('PING'):
-                pong_response = line.replace('PING', 'PONG')
-                self.socket.send(f"{pong_response}\r\n".encode())
+            if line.startswith(b'PING'):
+                self._writer.write(b'PONG' + line[4:] + b'\r\n')
+                return
+
+            record = parse_privmsg(line)
+            if record is None:
                 return
-            
-            # Parse PRIVMSG (chat messages)
-            # Format: :username!username@username.tmi.twitch.tv PRIVMSG #channel :message
-            privmsg_match = re.match(r':(\w+)!\w+@\w+\.tmi\.twitch\.tv PRIVMSG #(\w+) :(.+)', line)
-            if privmsg_match:
-                username = privmsg_match.group(1)
-                channel = privmsg_match.group(2)
-                message = privmsg_match.group(3)
-                
-                # Ignore messages from self
-                if username.lower() == self.bot_nick.lower():
-                    return
-                
-                print(f"📨 IRC: {username}: {message}")
-                
-                # Emit signal
-                self.message_received.emit(username, message)
-                
-                # Call direct callback if provided
-                if self.message_callback:
-                    try:
-                        self.message_callback(username, message)
-                    except Exception as e:
-                        print(f"❌ IRC: Error in message callback: {e}")
-                
+
+            # Ignore messages from self
+            if record.login == self._bot_nick_lower:
+                return
+            self.stats.messages += 1
+
+            if self.message_callback:
+                try:
+                    self.message_callback(record)
+                except Exception as e:
+                    log.error("❌ IRC: Error in message callback: %s", e)
+            else:
+                self.message_received.emit(record.login, record.text)
+
         except Exception as e:
-            print(f"❌ IRC: Error processing line '{line}': {e}")
-    
+            log.error("❌ IRC: Error processing line %r: %s", line[:200], e)
+
     def send_message(self, message):
-        """Send a message to the channel."""
+        """Send a message to the channel. Safe to call from any thread."""
         try:
-            if self.connected and self.socket:
-                irc_message = f"PRIVMSG #{self.channel_name} :{message}\r\n"
-                self.socket.send(irc_message.encode())
-                print(f"✅ IRC: Sent message: {message}")
+            if self.connected and self._writer and self.loop:
+                irc_message = f"PRIVMSG #{self.channel_name} :{message}\r\n".encode()
+                self.loop.call_soon_threadsafe(self._writer.write, irc_message)
+                log.debug("✅ IRC: Sent message: %s", message)
                 return True
             else:
-                print("❌ IRC: Cannot send message - not connected")
+                log.error("❌ IRC: Cannot send message - not connected")
                 return False
         except Exception as e:
-            print(f"❌ IRC: Error sending message: {e}")
+            log.error("❌ IRC: Error sending message: %s", e)
             return False
 
 
 class TwitchIRCThread(QThread):
-    """Thread wrapper for IRC client."""
-    
-    message_received = pyqtSignal(str, str)
+    """Thread wrapper for IRC client (runs its own event loop)."""
+
+    message_received = pyqtSignal(str, str)  # login, message
     connection_status = pyqtSignal(bool)
-    
+
     def __init__(self, oauth_token, bot_nick, channel_name):
         super().__init__()
         self.oauth_token = oauth_token
         self.bot_nick = bot_nick
         self.channel_name = channel_name
         self.irc_client = None
-        
+
     def run(self):
         """Run IRC client in thread."""
         try:
-            # Create IRC client
-            self.irc_client = TwitchIRCClient(
-                oauth_token=self.oauth_token,
-                bot_nick=self.bot_nick,
-                channel_name=self.channel_name
-            )
-            
-            # Connect signals
-            self.irc_client.message_received.connect(self.message_received)
-            self.irc_client.connection_status.connect(self.connection_status)
-            
-            # Connect to IRC
-            success = self.irc_client.connect()
-            if success:
-                # Keep thread alive while connected
-                while self.irc_client.running:
-                    self.msleep(100)
-            
+            asyncio.run(self._run_client())
         except Exception as e:
-            print(f"❌ IRC Thread: Error: {e}")
+            log.error("❌ IRC Thread: Error: %s", e)
+
+    async def _run_client(self):
+        self.irc_client = TwitchIRCClient(
+            oauth_token=self.oauth_token,
+            bot_nick=self.bot_nick,
+            channel_name=self.channel_name,
+            message_callback=lambda record: self.message_received.emit(record.login, record.text)
+        )
+        self.irc_client.connection_status.connect(self.connection_status)
+        try:
+            if await self.irc_client.connect():
+                await self.irc_client._listen_task
+        except asyncio.CancelledError:
+            pass
         finally:
-            if self.irc_client:
-                self.irc_client.disconnect()
-    
+            if self.irc_client.running:
+                await self.irc_client.close()
+
     def stop(self):
         """Stop IRC client."""
         if self.irc_client:
@@ -4,6 +4,9 @@ import time
 import traceback
 import uuid
 import json
+import logging
+import logging.handlers
+from collections import deque
 from pathlib import Path
 from datetime import datetime
 
@@ -15,6 +18,11 @@ from PyQt6.QtCore import QStandardPaths, QTimer # QTimer for deferred GA sending
 APP_NAME_LOG = "RustyBotGiveaway" # Using a distinct name to avoid conflict if Main.py also defines it
 APP_VERSION_LOG = "1.2.4" # Ensure this matches the version in Main.py or is managed centrally
 ACTIVITY_LOG_FILE = "activity_log.txt"
+DEBUG_LOG_FILE = "debug_log.txt"
+DEBUG_LOG_MAX_BYTES = 2 * 1024 * 1024
+DEBUG_LOG_BACKUP_COUNT = 3
+LOG_RING_CAPACITY = 2000 # Recent records kept in memory for the debug info view
+APP_LOGGER_NAME = "rusty"
 
 # --- Google Analytics Client ID Management ---
 _ga_client_id_cache = None
@@ -55,18 +63,90 @@ def _ensure_ga_client_id():
     return new_client_id
 
 
+# --- Central Application Logger ---
+# Modules log through get_logger("<area>") with %-style arguments, so
+# a call below the active level returns before any string formatting happens.
+class RingBufferHandler(logging.Handler):
+    """Keeps the most recent log records in memory; formatting is deferred until read."""
+
+    def __init__(self, capacity=LOG_RING_CAPACITY):
+        super().__init__()
+        self.records = deque(maxlen=capacity)
+
+    def emit(self, record):
+        self.records.append(record)
+
+    def lines(self, count=None, min_level=logging.NOTSET):
+        records = [record for record in list(self.records) if record.levelno >= min_level]
+        if count is not None:
+            records = records[-count:]
+        return [self.format(record) for record in records]
+
+
+_app_logger = logging.getLogger(APP_LOGGER_NAME)
+_app_logger.propagate = False
+_app_logger.setLevel(logging.INFO)
+_console_handler = logging.StreamHandler()
+_console_handler.setFormatter(logging.Formatter("%(message)s"))
+_app_logger.addHandler(_console_handler)
+_ring_handler = RingBufferHandler()
+_ring_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s", "%H:%M:%S"))
+_app_logger.addHandler(_ring_handler)
+_debug_file_handler = None
+
+
+def get_logger(name):
+    """Return a child of the application logger, e.g. get_logger("chat")."""
+    return _app_logger.getChild(name)
+
+
+def _app_data_dir():
+    data_dir_str = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.AppDataLocation)
+    if not data_dir_str:
+        data_dir_str = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.GenericDataLocation)
+        if not data_dir_str:
+            return None
+    app_data_dir = Path(data_dir_str) / "RustyBit" / "RustyBotGiveaway"
+    app_data_dir.mkdir(parents=True, exist_ok=True)
+    return app_data_dir
+
+
+def configure_logging(debug_enabled):
+    """Apply the debug_mode_enabled setting: DEBUG level plus a rotating file, otherwise INFO only."""
+    global _debug_file_handler
+    _app_logger.setLevel(logging.DEBUG if debug_enabled else logging.INFO)
+    if debug_enabled and _debug_file_handler is None:
+        try:
+            app_data_dir = _app_data_dir()
+            if app_data_dir is None:
+                _app_logger.warning("Could not find writable application data directory for the debug log.")
+                return
+            _debug_file_handler = logging.handlers.RotatingFileHandler(
+                app_data_dir / DEBUG_LOG_FILE, maxBytes=DEBUG_LOG_MAX_BYTES,
+                backupCount=DEBUG_LOG_BACKUP_COUNT, encoding='utf-8')
+            _debug_file_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s [%(threadName)s]: %(message)s"))
+            _app_logger.addHandler(_debug_file_handler)
+        except Exception as e:
+            _debug_file_handler = None
+            _app_logger.error("Could not open debug log file: %s", e)
+    elif not debug_enabled and _debug_file_handler is not None:
+        _app_logger.removeHandler(_debug_file_handler)
+        _debug_file_handler.close()
+        _debug_file_handler = None
+
+
+def recent_log_lines(count=None, min_level=logging.NOTSET):
+    """Formatted lines from the in-memory ring buffer at or above min_level, oldest first."""
+    return _ring_handler.lines(count, min_level)
+
+
 # --- Local Activity Logging ---
 def log_activity(event_type: str, details: str = ""):
     try:
-        data_dir_str = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.AppDataLocation)
-        if not data_dir_str:
-            data_dir_str = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.GenericDataLocation)
-            if not data_dir_str: # Should ideally use ORG_NAME/APP_NAME here if available
-                print("ERROR (Local Activity Log): Could not find writable application data directory.")
-                return
-        # If ORG_NAME and APP_NAME are needed, they should be passed or imported
-        app_data_dir = Path(data_dir_str) / "RustyBit" / "RustyBotGiveaway" 
-        app_data_dir.mkdir(parents=True, exist_ok=True)
+        app_data_dir = _app_data_dir()
+        if app_data_dir is None:
+            print("ERROR (Local Activity Log): Could not find writable application data directory.")
+            return
         log_path = app_data_dir / ACTIVITY_LOG_FILE
         timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
         log_entry = f"{timestamp}\t{event_type}"
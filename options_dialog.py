@@ -10,7 +10,7 @@ from pathlib import Path
 # --- PyQt6 Imports ---
 from PyQt6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
-    QPushButton, QMessageBox, QDialog, QDialogButtonBox, QFormLayout, QSpinBox,
+    QPushButton, QMessageBox, QDialog, QDialogButtonBox, QFormLayout, QSpinBox, QDoubleSpinBox,
     QCheckBox, QTabWidget, QSlider, QComboBox, QFrame, QSpacerItem, QSizePolicy,
     QGroupBox, QListWidget, QListWidgetItem, QTextEdit, QFileDialog, QScrollArea
 )
@@ -163,8 +163,21 @@ class OptionsDialog(QDialog):
         # Multi-draw toggle
         self.multi_draw_check = QCheckBox("Enable Multi-Draw")
         self.multi_draw_check.setChecked(self.working_config_snapshot.get("multi_draw_enabled", False))
-        self.multi_draw_check.setToolTip("If enabled, a confirmed winner is NOT removed from the entry list.\nThis allows them to win again in the same session.\nUsers who time out are always removed.")
+        self.multi_draw_check.setToolTip("If enabled, each draw picks several different winners at once.\nEvery winner gets their own confirmation timer and they can all confirm at the same time.\nWinners are removed from the entry list once they confirm or time out.")
         layout.addRow(self.multi_draw_check)
+        self.multi_draw_count_spin = QSpinBox()
+        self.multi_draw_count_spin.setRange(2, config_manager.MULTI_DRAW_MAX_WINNERS)
+        self.multi_draw_count_spin.setValue(self.working_config_snapshot.get("multi_draw_count", config_manager.DEFAULT_CONFIG["multi_draw_count"]))
+        self.multi_draw_count_spin.setToolTip("How many winners each multi-draw picks (capped at the number of entrants).")
+        layout.addRow("Winners per Draw:", self.multi_draw_count_spin)
+        self.multi_draw_combined_check = QCheckBox("Reveal all winners in one animation")
+        self.multi_draw_combined_check.setChecked(self.working_config_snapshot.get("multi_draw_combined_reveal", False))
+        self.multi_draw_combined_check.setToolTip("If disabled, the winners are revealed back to back, one animation each.\nEach winner's confirmation timer starts as soon as they are revealed.")
+        layout.addRow(self.multi_draw_combined_check)
+        self.multi_draw_check.toggled.connect(self.multi_draw_count_spin.setEnabled)
+        self.multi_draw_check.toggled.connect(self.multi_draw_combined_check.setEnabled)
+        self.multi_draw_count_spin.setEnabled(self.multi_draw_check.isChecked())
+        self.multi_draw_combined_check.setEnabled(self.multi_draw_check.isChecked())
 
         # Entry type controls
         line = QFrame(); line.setFrameShape(QFrame.Shape.HLine); line.setFrameShadow(QFrame.Shadow.Sunken); layout.addRow(line)
@@ -185,6 +198,20 @@ class OptionsDialog(QDialog):
         layout.addRow(self.custom_command_label, self.custom_command_edit)
         self.entry_type_combo.currentTextChanged.connect(self._update_entry_control_visibility)
         self._update_entry_control_visibility()
+
+        # Weighted entries
+        self.weighted_entries_check = QCheckBox("Enable Weighted Entries")
+        self.weighted_entries_check.setChecked(self.working_config_snapshot.get("weighted_entries_enabled", False))
+        self.weighted_entries_check.setToolTip("If enabled, subscribers, cheerers and long-time subscribers get better odds in the draw.\nMultipliers stack (e.g. a 12+ month sub who has cheered gets all three).")
+        layout.addRow(self.weighted_entries_check)
+        self.subscriber_multiplier_spin = self._create_multiplier_spin("subscriber_entry_multiplier", "Odds multiplier for subscribers (and founders).")
+        layout.addRow("Subscriber Multiplier:", self.subscriber_multiplier_spin)
+        self.bits_multiplier_spin = self._create_multiplier_spin("bits_entry_multiplier", "Odds multiplier for chatters with a Bits badge.")
+        layout.addRow("Bits Multiplier:", self.bits_multiplier_spin)
+        self.loyalty_multiplier_spin = self._create_multiplier_spin("loyalty_entry_multiplier", "Extra odds multiplier for subscribers of 12 months or more.")
+        layout.addRow("Loyalty Multiplier:", self.loyalty_multiplier_spin)
+        self.weighted_entries_check.toggled.connect(self._update_weighted_entry_controls)
+        self._update_weighted_entry_controls(self.weighted_entries_check.isChecked())
         line1 = QFrame(); line1.setFrameShape(QFrame.Shape.HLine); line1.setFrameShadow(QFrame.Shadow.Sunken); layout.addRow(line1)
         
         # Target Channel - load from user_config.json
@@ -214,6 +241,14 @@ class OptionsDialog(QDialog):
         self.debug_mode_check.setChecked(self.working_config_snapshot.get("debug_mode_enabled", False))
         self.debug_mode_check.setToolTip("Show additional debugging information in confirmations and responses.\nUseful for troubleshooting but may clutter the interface.")
         layout.addRow(self.debug_mode_check)
+        self.irc_hot_standby_check = QCheckBox("Keep IRC Chat Connection as Hot Standby")
+        self.irc_hot_standby_check.setChecked(self.working_config_snapshot.get("irc_hot_standby_enabled", False))
+        self.irc_hot_standby_check.setToolTip("Also connect the IRC fallback while EventSub is working, so chat keeps flowing if one drops.\nDuplicate messages are filtered automatically. Takes effect on the next connection.")
+        layout.addRow(self.irc_hot_standby_check)
+        self.ign_prewarm_check = QCheckBox("Pre-load Entrant IGNs While Collecting")
+        self.ign_prewarm_check.setChecked(self.working_config_snapshot.get("ign_prewarm_enabled", False))
+        self.ign_prewarm_check.setToolTip("Look up each entrant's EVE2Twitch IGN and ESI card in the background while the draw is open,\nso the winner's details appear instantly. Rate limited, and paused once the draw closes.")
+        layout.addRow(self.ign_prewarm_check)
         # --- Configurable chat messages ---
         self.chat_msgs_label = QLabel("Chat Messages (use placeholders: {winner}, {prize}, {timeout})")
         self.chat_msgs_label.setWordWrap(True)
@@ -880,6 +915,21 @@ class OptionsDialog(QDialog):
          self.trig_code_char_set_label.setVisible(show_trig_code_options); self.trig_code_char_set_edit.setVisible(show_trig_code_options)
          self.trig_code_finalist_count_label.setVisible(show_trig_code_options); self.trig_code_finalist_count_spin.setVisible(show_trig_code_options)
 
+    def _create_multiplier_spin(self, config_key, tooltip):
+        spin = QDoubleSpinBox()
+        spin.setRange(1.0, 10.0)
+        spin.setSingleStep(0.25)
+        spin.setDecimals(2)
+        spin.setSuffix("x")
+        spin.setValue(self.working_config_snapshot.get(config_key, config_manager.DEFAULT_CONFIG[config_key]))
+        spin.setToolTip(tooltip)
+        return spin
+
+    @pyqtSlot(bool)
+    def _update_weighted_entry_controls(self, enabled):
+        for spin in (self.subscriber_multiplier_spin, self.bits_multiplier_spin, self.loyalty_multiplier_spin):
+            spin.setEnabled(enabled)
+
     def _create_volume_slider(self, label_text, initial_value, is_master=False):
         slider = QSlider(Qt.Orientation.Horizontal); slider.setRange(0, 100); slider.setValue(int(initial_value * 100)); slider.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
         value_label = QLabel(f"{slider.value()}%"); value_label.setMinimumWidth(40); value_label.setAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
@@ -1068,6 +1118,12 @@ class OptionsDialog(QDialog):
             temp_config_from_dialog["confirmation_timeout"] = self.confirm_timeout_spin.value()
             temp_config_from_dialog["eve_response_timeout"] = self.eve_timeout_spin.value()
             temp_config_from_dialog["multi_draw_enabled"] = self.multi_draw_check.isChecked()
+            temp_config_from_dialog["multi_draw_count"] = self.multi_draw_count_spin.value()
+            temp_config_from_dialog["multi_draw_combined_reveal"] = self.multi_draw_combined_check.isChecked()
+            temp_config_from_dialog["weighted_entries_enabled"] = self.weighted_entries_check.isChecked()
+            temp_config_from_dialog["subscriber_entry_multiplier"] = self.subscriber_multiplier_spin.value()
+            temp_config_from_dialog["bits_entry_multiplier"] = self.bits_multiplier_spin.value()
+            temp_config_from_dialog["loyalty_entry_multiplier"] = self.loyalty_multiplier_spin.value()
             temp_config_from_dialog["entry_condition_type"] = self.entry_type_combo.currentText()
             temp_config_from_dialog["join_command"] = self.predefined_command_combo.currentText()
             temp_config_from_dialog["custom_join_command"] = self.custom_command_edit.text()
@@ -1085,6 +1141,8 @@ class OptionsDialog(QDialog):
             temp_config_from_dialog["target_channel"] = validated_channel
             temp_config_from_dialog["enable_test_entries"] = self.enable_test_check.isChecked()
             temp_config_from_dialog["debug_mode_enabled"] = self.debug_mode_check.isChecked()
+            temp_config_from_dialog["irc_hot_standby_enabled"] = self.irc_hot_standby_check.isChecked()
+            temp_config_from_dialog["ign_prewarm_enabled"] = self.ign_prewarm_check.isChecked()
 
             temp_config_from_dialog["customisable_ui_enabled"] = True
             temp_config_from_dialog["ui_locked"] = self.lock_ui_check.isChecked()
@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+"""
+Participant List Model for the entrants panel
+A sorted, array-backed QAbstractListModel so entries are inserted/removed with
+a binary search instead of rebuilding every list item on each join.
+"""
+
+from bisect import bisect_left
+
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex, QSortFilterProxyModel
+
+# Above this many names in one call the model is reset instead of inserting row by row
+BULK_INSERT_THRESHOLD = 64
+
+
+class ParticipantListModel(QAbstractListModel):
+    """Case-insensitively sorted list of entrant names with checkable rows."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._keys = []        # Lowercase sort keys, kept sorted
+        self._names = []       # Display names, parallel to _keys
+        self._checked = set()  # Lowercase keys of checked rows
+
+    # --- Qt model interface ---
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._names)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or not (0 <= index.row() < len(self._names)):
+            return None
+        row = index.row()
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._names[row]
+        if role == Qt.ItemDataRole.CheckStateRole:
+            return Qt.CheckState.Checked if self._keys[row] in self._checked else Qt.CheckState.Unchecked
+        return None
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if role != Qt.ItemDataRole.CheckStateRole or not index.isValid():
+            return False
+        key = self._keys[index.row()]
+        if value == Qt.CheckState.Checked or value == Qt.CheckState.Checked.value:
+            self._checked.add(key)
+        else:
+            self._checked.discard(key)
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.CheckStateRole])
+        return True
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsUserCheckable
+
+    # --- Store operations ---
+    def add_name(self, name):
+        """Insert a name at its sorted position. Returns False if already present."""
+        key = name.lower()
+        row = bisect_left(self._keys, key)
+        if row < len(self._keys) and self._keys[row] == key:
+            return False
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._keys.insert(row, key)
+        self._names.insert(row, name)
+        self.endInsertRows()
+        return True
+
+    def add_names(self, names):
+        """Insert several names, falling back to a single model reset for large batches."""
+        new_entries = {}
+        for name in names:
+            key = name.lower()
+            if key not in new_entries:
+                new_entries[key] = name
+        if len(new_entries) <= BULK_INSERT_THRESHOLD:
+            return sum(1 for name in new_entries.values() if self.add_name(name))
+
+        existing = dict(zip(self._keys, self._names))
+        added = 0
+        for key, name in new_entries.items():
+            if key not in existing:
+                existing[key] = name
+                added += 1
+        if added:
+            self.beginResetModel()
+            self._keys = sorted(existing)
+            self._names = [existing[key] for key in self._keys]
+            self.endResetModel()
+        return added
+
+    def remove_name(self, name):
+        """Remove a name (case-insensitive). Returns False if it was not present."""
+        key = name.lower()
+        row = bisect_left(self._keys, key)
+        if row >= len(self._keys) or self._keys[row] != key:
+            return False
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._keys[row]
+        del self._names[row]
+        self._checked.discard(key)
+        self.endRemoveRows()
+        return True
+
+    def clear(self):
+        self.beginResetModel()
+        self._keys, self._names = [], []
+        self._checked.clear()
+        self.endResetModel()
+
+    def names(self):
+        """All names in display order."""
+        return list(self._names)
+
+    def checked_names(self):
+        return [name for key, name in zip(self._keys, self._names) if key in self._checked] if self._checked else []
+
+    def has_checked(self):
+        return bool(self._checked)
+
+    def __len__(self):
+        return len(self._names)
+
+
+class ParticipantFilterProxyModel(QSortFilterProxyModel):
+    """Case-insensitive substring filter over the participant model (keeps source order)."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setFilterCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        self.setFilterRole(Qt.ItemDataRole.DisplayRole)
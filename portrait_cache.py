@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+"""
+Portrait Cache
+Stores each winner portrait once on disk, content-addressed per character id
+and size, so the confirmation log and the animation page can reference it by
+file:// URL instead of passing base64 blobs around.
+"""
+
+import hashlib
+import os
+import threading
+from pathlib import Path
+
+import logging_utils
+
+log = logging_utils.get_logger("esi")
+
+PORTRAIT_CACHE_DIR = "portraits"
+PORTRAIT_EXTENSIONS = {"image/jpeg": "jpg", "image/png": "png", "image/webp": "webp"}
+
+
+class PortraitCache:
+    """Directory of <character id>_<size>_<digest>.<ext> files. Thread-safe."""
+
+    def __init__(self, directory):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def lookup(self, char_id, size):
+        """Path of the cached portrait for this character and size, or None."""
+        for path in self.directory.glob(f"{char_id}_{size}_*.*"):
+            if path.suffix != ".tmp":
+                return path
+        return None
+
+    def store(self, char_id, size, img_bytes, content_type="image/png"):
+        """Save portrait bytes (if not already cached) and return the file path."""
+        ext = PORTRAIT_EXTENSIONS.get(content_type, "png")
+        digest = hashlib.sha1(img_bytes).hexdigest()[:16]
+        path = self.directory / f"{char_id}_{size}_{digest}.{ext}"
+        with self._lock:
+            if path.exists():
+                return path
+            tmp_path = path.with_suffix(path.suffix + ".tmp")
+            tmp_path.write_bytes(img_bytes)
+            os.replace(tmp_path, path)
+            # A new digest means the pilot changed portrait: drop the superseded file(s)
+            for old in self.directory.glob(f"{char_id}_{size}_*.*"):
+                if old != path:
+                    try:
+                        old.unlink()
+                    except OSError as e:
+                        log.debug("ESI portrait cache: could not remove %s: %s", old, e)
+        return path
+
+    @staticmethod
+    def file_url(path):
+        return Path(path).resolve().as_uri()
@@ -3,7 +3,10 @@
 
 import os
 from pathlib import Path
-import traceback
+
+import logging_utils
+
+log = logging_utils.get_logger("sound")
 
 try:
     import pygame
@@ -47,7 +50,7 @@ class SoundManager:
         self.is_initialized = False
 
         if not pygame_available:
-            print("SOUND_DEBUG: Pygame not available. SoundManager will be disabled.")
+            log.warning("Pygame not available. SoundManager will be disabled.")
             return
 
         try:
@@ -56,41 +59,39 @@ class SoundManager:
             for num_c in num_channels_to_try:
                 try:
                     pygame.mixer.set_num_channels(num_c)
-                    print(f"SOUND_DEBUG: Pygame Mixer initialized with {pygame.mixer.get_num_channels()} channels.")
+                    log.debug("Pygame Mixer initialized with %s channels.", pygame.mixer.get_num_channels())
                     self.is_initialized = True
                     break
                 except pygame.error as e:
-                    print(f"SOUND_DEBUG: Failed to set {num_c} channels: {e}")
+                    log.debug("Failed to set %s channels: %s", num_c, e)
             if not self.is_initialized:
-                 print("SOUND_DEBUG: Pygame Mixer could not be initialized. Sound disabled.")
+                 log.warning("Pygame Mixer could not be initialized. Sound disabled.")
                  pygame.mixer.quit()
                  return
             self._load_sounds()
         except pygame.error as e:
-            print(f"SOUND_DEBUG: Pygame mixer initialization error: {e}")
-            traceback.print_exc()
+            log.exception("Pygame mixer initialization error: %s", e)
             self.is_initialized = False
         except Exception as e:
-            print(f"SOUND_DEBUG: Unexpected error during SoundManager init: {e}")
-            traceback.print_exc()
+            log.exception("Unexpected error during SoundManager init: %s", e)
             self.is_initialized = False
 
     def _load_sounds(self):
         if not self.is_initialized: return
-        print("SOUND_DEBUG: Loading sounds...")
+        log.debug("Loading sounds...")
         for key, (filename, _, _) in SOUND_FILES.items():
             path = self.base_path / filename
             if path.is_file():
                 try:
                     self.sounds[key] = pygame.mixer.Sound(str(path))
-                    print(f"SOUND_DEBUG: Loaded sound '{key}' from '{path}'")
+                    log.debug("Loaded sound '%s' from '%s'", key, path)
                 except pygame.error as e:
-                    print(f"SOUND_DEBUG: Error loading sound '{key}' from '{path}': {e}")
+                    log.error("Error loading sound '%s' from '%s': %s", key, path, e)
                     self.sounds[key] = None
             else:
-                print(f"SOUND_DEBUG: Sound file not found for '{key}': '{path}'")
+                log.warning("Sound file not found for '%s': '%s'", key, path)
                 self.sounds[key] = None
-        print("SOUND_DEBUG: Sound loading complete.")
+        log.debug("Sound loading complete.")
 
     def _calculate_volume(self, sound_key):
         if sound_key not in SOUND_FILES:
@@ -108,16 +109,16 @@ class SoundManager:
         final_volume = max(0.0, min(1.0, effective_volume))
 
         if sound_key == "countdown":
-            print(f"SOUND_DEBUG (countdown volume calc): Key='{sound_key}', DefMultiplier={default_vol_multiplier:.2f}, Category='{category}'")
-            print(f"SOUND_DEBUG (countdown volume calc): MasterVol={master_volume:.2f}, CatVolKey='{category_volume_key}', CatVolLevel={category_volume_level:.2f}")
-            print(f"SOUND_DEBUG (countdown volume calc): EffectiveVol(pre-clamp)={effective_volume:.2f}, FinalVol={final_volume:.2f}")
+            log.debug("(countdown volume calc) Key='%s', DefMultiplier=%.2f, Category='%s'", sound_key, default_vol_multiplier, category)
+            log.debug("(countdown volume calc) MasterVol=%.2f, CatVolKey='%s', CatVolLevel=%.2f", master_volume, category_volume_key, category_volume_level)
+            log.debug("(countdown volume calc) EffectiveVol(pre-clamp)=%.2f, FinalVol=%.2f", effective_volume, final_volume)
         return final_volume
 
     def play(self, key, loops=0, maxtime=0, fade_ms=0):
         if not self.is_initialized or key not in self.sounds or self.sounds[key] is None:
-            if not self.is_initialized: print(f"Warning: Sound system not initialized. Cannot play '{key}'.")
-            elif key not in self.sounds : print(f"Warning: Sound key '{key}' not found in sound_files config.")
-            elif self.sounds[key] is None: print(f"Warning: Sound '{key}' was not loaded (file missing or error). Cannot play.")
+            if not self.is_initialized: log.warning("Sound system not initialized. Cannot play '%s'.", key)
+            elif key not in self.sounds : log.warning("Sound key '%s' not found in sound_files config.", key)
+            elif self.sounds[key] is None: log.warning("Sound '%s' was not loaded (file missing or error). Cannot play.", key)
             return None
 
         sound_obj = self.sounds[key]
@@ -125,31 +126,29 @@ class SoundManager:
         sound_obj.set_volume(volume)
 
         if key == "countdown":
-            print(f"SOUND_DEBUG: Attempting to play 'countdown'. Volume set to {volume:.2f}, loops={loops}")
+            log.debug("Attempting to play 'countdown'. Volume set to %.2f, loops=%s", volume, loops)
 
         try:
             if key in self.playing_channels and self.playing_channels[key].get_sound() == sound_obj:
                 if self.playing_channels[key].get_busy():
-                    print(f"SOUND_DEBUG: Sound '{key}' is already playing on channel {self.playing_channels[key]}. Stopping before replay.")
+                    log.debug("Sound '%s' is already playing on channel %s. Stopping before replay.", key, self.playing_channels[key])
                     self.playing_channels[key].stop()
 
             channel = pygame.mixer.find_channel(True) 
             if channel:
                 if key == "countdown":
-                    print(f"SOUND_DEBUG: Playing '{key}' on channel {channel} with volume {volume:.2f}, loops={loops}")
+                    log.debug("Playing '%s' on channel %s with volume %.2f, loops=%s", key, channel, volume, loops)
                 self.playing_channels[key] = channel
                 channel.play(sound_obj, loops=loops, maxtime=maxtime, fade_ms=fade_ms)
                 return channel
             else:
-                print(f"SOUND_DEBUG: No available channels to play '{key}'.")
+                log.warning("No available channels to play '%s'.", key)
                 return None
         except pygame.error as e:
-            print(f"SOUND_DEBUG: Pygame error playing sound '{key}': {e}")
-            traceback.print_exc()
+            log.exception("Pygame error playing sound '%s': %s", key, e)
             return None
         except Exception as e:
-            print(f"SOUND_DEBUG: Unexpected error playing sound '{key}': {e}")
-            traceback.print_exc()
+            log.exception("Unexpected error playing sound '%s': %s", key, e)
             return None
 
     def stop(self, key):
@@ -158,13 +157,13 @@ class SoundManager:
 
         sound_obj = self.sounds[key]
         if key == "countdown":
-            print(f"SOUND_DEBUG: Stop requested for 'countdown'.")
+            log.debug("Stop requested for 'countdown'.")
 
         if key in self.playing_channels:
             channel = self.playing_channels[key]
             if channel.get_sound() == sound_obj and channel.get_busy():
                 channel.stop()
-                if key == "countdown": print(f"SOUND_DEBUG: Stopped '{key}' via tracked channel {channel}.")
+                if key == "countdown": log.debug("Stopped '%s' via tracked channel %s.", key, channel)
                 return 
 
         stopped_fallback = False
@@ -172,32 +171,32 @@ class SoundManager:
             channel = pygame.mixer.Channel(i)
             if channel.get_sound() == sound_obj and channel.get_busy():
                 channel.stop()
-                if key == "countdown": print(f"SOUND_DEBUG: Stopped '{key}' via fallback channel iteration on channel {i}.")
+                if key == "countdown": log.debug("Stopped '%s' via fallback channel iteration on channel %s.", key, i)
                 stopped_fallback = True
                 break
 
         if key == "countdown" and not stopped_fallback and key not in self.playing_channels:
-             print(f"SOUND_DEBUG: '{key}' stop called, but not found playing on tracked or iterated channels.")
+             log.debug("'%s' stop called, but not found playing on tracked or iterated channels.", key)
         
         if key in self.playing_channels:
             del self.playing_channels[key]
 
     def stop_all(self):
         if not self.is_initialized: return
-        print("SOUND_DEBUG: Stopping all sounds.")
+        log.debug("Stopping all sounds.")
         pygame.mixer.stop()
         self.playing_channels.clear() 
 
     def set_master_volume(self, volume):
         if not self.is_initialized: return
         self.config['master_volume'] = max(0.0, min(1.0, volume))
-        print(f"SOUND_DEBUG: Master volume in config set to {self.config['master_volume']:.2f}")
+        log.debug("Master volume in config set to %.2f", self.config['master_volume'])
         self.apply_volumes_to_playing_sounds()
 
     def apply_volumes(self, new_config):
         if not self.is_initialized: return
         self.config = new_config
-        print("SOUND_DEBUG: SoundManager config updated. Re-applying volumes.")
+        log.debug("SoundManager config updated. Re-applying volumes.")
         self.apply_volumes_to_playing_sounds()
 
     def apply_volumes_to_playing_sounds(self):
@@ -209,9 +208,9 @@ class SoundManager:
                     self.sounds[sound_key].set_volume(new_volume)
                     channel.set_volume(new_volume)
                     if sound_key == "countdown": 
-                        print(f"SOUND_DEBUG: Re-applied volume to playing 'countdown' on channel {channel}: {new_volume:.2f}")
+                        log.debug("Re-applied volume to playing 'countdown' on channel %s: %.2f", channel, new_volume)
                 else:
-                    print(f"SOUND_DEBUG: Warning - Sound key '{sound_key}' in playing_channels but not loaded.")
+                    log.warning("Sound key '%s' in playing_channels but not loaded.", sound_key)
             else:
                 del self.playing_channels[sound_key]
 
@@ -223,6 +222,6 @@ class SoundManager:
 
     def quit(self):
         if pygame_available and self.is_initialized:
-            print("SOUND_DEBUG: Quitting Pygame mixer.")
+            log.debug("Quitting Pygame mixer.")
             pygame.mixer.quit()
             self.is_initialized = False
\ No newline at end of file
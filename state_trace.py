@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+"""
+State Transition Tracer
+Records every AppState transition with monotonic timestamps and the time spent
+in each entry/exit hook, and exports them as Chrome trace JSON (chrome://tracing,
+ui.perfetto.dev) so the gap between "winner drawn" and "IGN verified" can be
+broken down per state and per hook.
+"""
+
+import json
+import os
+import time
+from collections import deque
+
+import logging_utils
+
+log = logging_utils.get_logger("state")
+
+STATE_TRACE_FILE = "state_trace.json"
+TRACE_CAPACITY = 1000  # Transitions kept in memory (oldest dropped first)
+TRACE_PID = 1
+TRACE_TID_TRANSITIONS = 1
+TRACE_TID_STATES = 2
+
+
+class TransitionRecord:
+    """One state transition and the hooks it ran."""
+
+    __slots__ = ("from_state", "to_state", "queued_ns", "start_ns", "end_ns", "hooks")
+
+    def __init__(self, from_state, to_state, queued_ns=None):
+        self.from_state = from_state
+        self.to_state = to_state
+        self.queued_ns = queued_ns  # When a hook requested this transition (None if it ran immediately)
+        self.start_ns = time.monotonic_ns()
+        self.end_ns = None
+        self.hooks = []             # (hook name, start ns, end ns)
+
+    def run_hook(self, name, hook, *args):
+        """Call hook(*args), recording how long it took."""
+        start = time.monotonic_ns()
+        try:
+            return hook(*args)
+        finally:
+            self.hooks.append((name, start, time.monotonic_ns()))
+
+    def finish(self):
+        self.end_ns = time.monotonic_ns()
+
+    @property
+    def duration_ms(self):
+        return ((self.end_ns or time.monotonic_ns()) - self.start_ns) / 1e6
+
+
+class TransitionTracer:
+    """Bounded history of TransitionRecords with Chrome trace export."""
+
+    def __init__(self, capacity=TRACE_CAPACITY):
+        self.records = deque(maxlen=capacity)
+        self._origin_ns = time.monotonic_ns()
+
+    def begin(self, from_state, to_state, queued_ns=None):
+        record = TransitionRecord(from_state, to_state, queued_ns)
+        self.records.append(record)
+        return record
+
+    def _us(self, ns):
+        return (ns - self._origin_ns) / 1000.0
+
+    def chrome_trace_events(self):
+        """Build the traceEvents list: transitions + hooks on one track, time spent per state on another."""
+        events = [
+            {"name": "process_name", "ph": "M", "pid": TRACE_PID, "args": {"name": "Rusty Giveaway"}},
+            {"name": "thread_name", "ph": "M", "pid": TRACE_PID, "tid": TRACE_TID_TRANSITIONS, "args": {"name": "Transitions"}},
+            {"name": "thread_name", "ph": "M", "pid": TRACE_PID, "tid": TRACE_TID_STATES, "args": {"name": "States"}},
+        ]
+        records = list(self.records)
+        now_ns = time.monotonic_ns()
+        for i, record in enumerate(records):
+            end_ns = record.end_ns or now_ns
+            args = {"from": record.from_state, "to": record.to_state}
+            if record.queued_ns is not None:
+                args["queued_ms"] = round((record.start_ns - record.queued_ns) / 1e6, 3)
+            events.append({"name": f"{record.from_state} -> {record.to_state}", "cat": "transition", "ph": "X",
+                           "pid": TRACE_PID, "tid": TRACE_TID_TRANSITIONS,
+                           "ts": self._us(record.start_ns), "dur": (end_ns - record.start_ns) / 1000.0, "args": args})
+            for name, start, end in record.hooks:
+                events.append({"name": name, "cat": "hook", "ph": "X", "pid": TRACE_PID, "tid": TRACE_TID_TRANSITIONS,
+                               "ts": self._us(start), "dur": (end - start) / 1000.0})
+            # Time spent in the entered state lasts until the next transition starts
+            left_ns = records[i + 1].start_ns if i + 1 < len(records) else now_ns
+            events.append({"name": record.to_state, "cat": "state", "ph": "X", "pid": TRACE_PID, "tid": TRACE_TID_STATES,
+                           "ts": self._us(record.start_ns), "dur": max(0, left_ns - record.start_ns) / 1000.0})
+        return events
+
+    def export_chrome_trace(self, path):
+        """Write the trace as Chrome trace JSON. Returns the path, or None on failure."""
+        try:
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"traceEvents": self.chrome_trace_events(), "displayTimeUnit": "ms"}, f)
+            os.replace(tmp_path, path)
+            log.info("📈 STATE: Wrote %s transitions to %s", len(self.records), path)
+            return path
+        except Exception as e:
+            log.error("❌ STATE: Failed to write state trace to %s: %s", path, e)
+            return None
@@ -0,0 +1,374 @@
+"""
+Chat Load Harness for RustyBot
+Replays recorded or synthetic chat through a fake TwitchBotThread (no network)
+and reports throughput, handling latency, GUI event-loop stalls and peak RSS.
+
+Exits with status 1 when p99 handling latency or the longest GUI stall is over
+its threshold, so it can gate a CI job.
+
+Examples:
+  python tests/chat_load_harness.py --rate 10000 --messages 100000 --repeat-ratio 0.6
+  python tests/chat_load_harness.py --replay chat_log.txt --rate 2000 --mode app
+  python tests/chat_load_harness.py --max-p99-ms 50 --max-stall-ms 100
+"""
+import os
+import sys
+import time
+import json
+import random
+import asyncio
+import argparse
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from PyQt6.QtCore import QCoreApplication, QObject, QThread, QTimer, Qt, pyqtSignal, pyqtSlot
+
+from chat_ingest import ChatIngest, ChatMessage, EntrantIndex
+from irc_fallback import parse_privmsg
+from participant_model import ParticipantListModel
+from config_manager import ENTRY_TYPE_PREDEFINED
+
+STALL_PROBE_INTERVAL_MS = 5   # How often the GUI loop is probed
+STALL_THRESHOLD_MS = 16       # Gaps longer than one 60 Hz frame count as a stall
+DEFAULT_JOIN_COMMAND = "!join"
+DEFAULT_MAX_P99_MS = 100.0    # Fail threshold for p99 handling latency
+DEFAULT_MAX_STALL_MS = 250.0  # Fail threshold for the longest single GUI event-loop stall
+
+
+# --- Chat Sources ---
+def synthetic_chat(count, repeat_ratio, entry_ratio, join_command, seed=None):
+    """Build `count` records; `repeat_ratio` of them come from users who already chatted."""
+    rng = random.Random(seed)
+    seen = []
+    records = []
+    for i in range(count):
+        if seen and rng.random() < repeat_ratio:
+            login = rng.choice(seen)
+        else:
+            login = f"loaduser_{len(seen):06d}"
+            seen.append(login)
+        text = join_command if rng.random() < entry_ratio else f"chatter line {i} kappa"
+        records.append(ChatMessage(login, text, user_id=100000 + int(login[9:])))
+    return records
+
+
+def replay_chat(path, count):
+    """Load raw IRC lines (':nick!... PRIVMSG #chan :text') or 'user<TAB>text' lines, looped up to `count`."""
+    lines = []
+    with open(path, 'rb') as f:
+        for raw in f:
+            raw = raw.rstrip(b'\r\n')
+            if not raw:
+                continue
+            if raw.startswith((b'@', b':')):
+                if parse_privmsg(raw) is not None:
+                    lines.append(raw)
+            elif b'\t' in raw:
+                lines.append(raw)
+    if not lines:
+        raise ValueError(f"No chat lines found in {path}")
+
+    records = []
+    for i in range(count or len(lines)):
+        raw = lines[i % len(lines)]
+        if raw.startswith((b'@', b':')):
+            records.append(parse_privmsg(raw))
+        else:
+            login, _, text = raw.decode('utf-8', 'replace').partition('\t')
+            records.append(ChatMessage(login, text))
+    return records
+
+
+# --- Fake Bot Thread ---
+class FakeTwitchBotThread(QThread):
+    """Stands in for TwitchBotThread: same signals and ingest stage, chat comes from a record list."""
+    message_received = pyqtSignal(str, str)
+    message_batch_received = pyqtSignal(list)
+    status_update = pyqtSignal(str)
+    error_occurred = pyqtSignal(str)
+    bot_ready_signal = pyqtSignal(bool)
+
+    def __init__(self, records, rate, parent=None, entrant_index=None):
+        super().__init__(parent)
+        self.records = records
+        self.rate = rate  # Messages per second, 0 = as fast as possible
+        self.channel = "loadtest"
+        self.bot = None
+        self.loop = None
+        self._is_running = True
+        self.ingest = ChatIngest(self.message_batch_received.emit, entrant_index=entrant_index)
+        self.sent_at = [0.0] * len(records)  # perf_counter() at submit, indexed by message id
+        self.replay_seconds = 0.0
+
+        # Message ids double as the index into sent_at (and keep the deduplicator honest)
+        for i, record in enumerate(records):
+            record.message_id = str(i)
+
+    def run(self):
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        self.loop = loop
+        self.ingest.attach_loop(loop)
+        try:
+            self.bot_ready_signal.emit(True)
+            loop.run_until_complete(self._replay())
+            loop.run_until_complete(asyncio.sleep(self.ingest.flush_interval * 2))
+            self.ingest.flush()
+        finally:
+            loop.close()
+            self.loop = None
+
+    async def _replay(self):
+        records, sent_at, submit = self.records, self.sent_at, self.ingest.submit
+        total = len(records)
+        started = time.perf_counter()
+        i = 0
+        while i < total and self._is_running:
+            if self.rate > 0:
+                due = min(total, int((time.perf_counter() - started) * self.rate) + 1)
+            else:
+                due = min(total, i + 1000)
+            while i < due:
+                sent_at[i] = time.perf_counter()
+                submit(records[i])
+                i += 1
+            await asyncio.sleep(0.001 if self.rate > 0 else 0)
+        self.replay_seconds = time.perf_counter() - started
+
+    def stop(self):
+        self._is_running = False
+        self.wait()
+
+
+# --- Measurement ---
+class StallMonitor(QObject):
+    """Probes the GUI event loop with a short timer and records how late each tick is."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.max_gap_ms = 0.0
+        self.stall_ms = 0.0
+        self.stalls = 0
+        self._last = None
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.setInterval(STALL_PROBE_INTERVAL_MS)
+        self._timer.timeout.connect(self._tick)
+
+    def start(self):
+        self._last = time.perf_counter()
+        self._timer.start()
+
+    def stop(self):
+        self._timer.stop()
+
+    def _tick(self):
+        now = time.perf_counter()
+        gap_ms = (now - self._last) * 1000.0
+        self._last = now
+        self.max_gap_ms = max(self.max_gap_ms, gap_ms)
+        if gap_ms > STALL_THRESHOLD_MS:
+            self.stalls += 1
+            self.stall_ms += gap_ms - STALL_PROBE_INTERVAL_MS
+
+
+class LatencyRecorder(QObject):
+    """Connected after the real batch handler, so its timestamp is taken once handling is done."""
+
+    def __init__(self, sent_at, parent=None):
+        super().__init__(parent)
+        self.sent_at = sent_at
+        self.latencies = []
+        self.handled = 0
+        self.batches = 0
+        self.last_handled_at = None
+
+    @pyqtSlot(list)
+    def record_batch(self, batch):
+        now = time.perf_counter()
+        sent_at = self.sent_at
+        self.latencies.extend(now - sent_at[int(record.message_id)] for record in batch)
+        self.handled += len(batch)
+        self.batches += 1
+        self.last_handled_at = now
+
+
+class IngestSink(QObject):
+    """GUI-side stand-in for GiveawayApp when only the ingest core is under test."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.model = ParticipantListModel(self)
+        self.entrants = set()
+
+    @pyqtSlot(list)
+    def handle_message_batch(self, batch):
+        new_names = []
+        for record in batch:
+            if record.key not in self.entrants:
+                self.entrants.add(record.key)
+                new_names.append(record.display_name)
+        if new_names:
+            self.model.add_names(new_names)
+
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))]
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MB, or None if it cannot be read."""
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / (1024.0 * 1024.0) if sys.platform == "darwin" else peak / 1024.0
+    except ImportError:
+        pass
+    try:
+        import psutil
+        info = psutil.Process().memory_info()
+        return getattr(info, 'peak_wset', info.rss) / (1024.0 * 1024.0)
+    except ImportError:
+        return None
+
+
+# --- Runners ---
+def run_ingest_mode(records, args):
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv)
+    entrant_index = EntrantIndex()
+    entrant_index.set_rule(True, ENTRY_TYPE_PREDEFINED, args.join_command)
+    thread = FakeTwitchBotThread(records, args.rate, entrant_index=entrant_index)
+    sink = IngestSink()
+    thread.message_batch_received.connect(sink.handle_message_batch)
+    return _run(app, thread, entrant_index, entrants=lambda: len(sink.model))
+
+
+def run_app_mode(records, args):
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt6.QtWidgets import QApplication
+    import Main
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    threads = []
+
+    class HarnessGiveawayApp(Main.GiveawayApp):
+        def auto_connect_twitch(self):
+            self._set_state(Main.AppState.BOT_CONNECTING)
+            self.config["join_command"] = args.join_command
+            self.config["entry_condition_type"] = ENTRY_TYPE_PREDEFINED
+            self.twitch_thread = FakeTwitchBotThread(records, args.rate, entrant_index=self.entrant_index)
+            self.twitch_thread.message_batch_received.connect(self.handle_message_batch)
+            self.twitch_thread.status_update.connect(self.handle_status_update)
+            self.twitch_thread.error_occurred.connect(self.handle_error)
+            self.twitch_thread.bot_ready_signal.connect(self.handle_bot_ready)
+            # Open the draw once the app has gone BOT_CONNECTING -> IDLE; queued ahead of the first chat batch
+            self.twitch_thread.bot_ready_signal.connect(self._harness_open_draw)
+            threads.append(self.twitch_thread)
+
+        def _harness_open_draw(self, is_ready):
+            if is_ready and self.current_state == Main.AppState.IDLE:
+                self._set_state(Main.AppState.COLLECTING)
+
+    window = HarnessGiveawayApp()
+    app.processEvents()  # Runs the deferred _delayed_finalize_setup -> auto_connect_twitch
+    if not threads:
+        raise RuntimeError("GiveawayApp did not call auto_connect_twitch during setup")
+    report = _run(app, threads[0], window.entrant_index, entrants=lambda: len(window.participants))
+    if report["entrants"] <= 0:
+        raise RuntimeError(f"App mode counted no entrants (final state {window.current_state.name})")
+    return report
+
+
+def _run(app, thread, entrant_index, entrants):
+    recorder = LatencyRecorder(thread.sent_at)
+    thread.message_batch_received.connect(recorder.record_batch)  # After the handler under test
+    monitor = StallMonitor()
+    thread.finished.connect(app.quit)
+
+    started = time.perf_counter()
+    monitor.start()
+    QTimer.singleShot(0, thread.start)
+    app.exec()
+    monitor.stop()
+    thread.wait()
+    finished = recorder.last_handled_at or time.perf_counter()
+
+    elapsed = max(finished - started, 1e-9)
+    latencies_ms = [latency * 1000.0 for latency in recorder.latencies]
+    peak_rss = peak_rss_mb()
+    return {
+        "messages_sent": len(thread.records),
+        "messages_delivered": recorder.handled,
+        "batches_delivered": recorder.batches,
+        "non_entries_dropped": entrant_index.non_entries_dropped,
+        "duplicates_dropped": entrant_index.duplicates_dropped,
+        "entrants": entrants(),
+        "replay_seconds": round(thread.replay_seconds, 3),
+        "elapsed_seconds": round(elapsed, 3),
+        "messages_per_s": round(len(thread.records) / elapsed, 1),
+        "latency_p50_ms": round(percentile(latencies_ms, 50), 3),
+        "latency_p99_ms": round(percentile(latencies_ms, 99), 3),
+        "latency_max_ms": round(max(latencies_ms), 3) if latencies_ms else 0.0,
+        "gui_max_gap_ms": round(monitor.max_gap_ms, 2),
+        "gui_stall_ms": round(monitor.stall_ms, 2),
+        "gui_stalls": monitor.stalls,
+        "peak_rss_mb": round(peak_rss, 1) if peak_rss is not None else None,
+    }
+
+
+def threshold_failures(report, max_p99_ms, max_stall_ms):
+    """Messages for every threshold the report exceeds (empty when it passes)."""
+    failures = []
+    if report["latency_p99_ms"] > max_p99_ms:
+        failures.append(f"p99 latency {report['latency_p99_ms']}ms > {max_p99_ms:g}ms")
+    if report["gui_max_gap_ms"] > max_stall_ms:
+        failures.append(f"GUI stall {report['gui_max_gap_ms']}ms > {max_stall_ms:g}ms")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay chat through the ingest pipeline and report throughput/latency.")
+    parser.add_argument("--mode", choices=["ingest", "app"], default="ingest", help="ingest: ingest core + entrants model only; app: full GiveawayApp (offscreen)")
+    parser.add_argument("--messages", type=int, default=100000, help="Number of messages to send (replay files are looped)")
+    parser.add_argument("--rate", type=float, default=10000, help="Messages per second, 0 = as fast as possible")
+    parser.add_argument("--repeat-ratio", type=float, default=0.5, help="Fraction of synthetic messages from users who already chatted")
+    parser.add_argument("--entry-ratio", type=float, default=0.5, help="Fraction of synthetic messages that are the join command")
+    parser.add_argument("--join-command", default=DEFAULT_JOIN_COMMAND)
+    parser.add_argument("--replay", help="Chat log to replay (raw IRC lines or 'user<TAB>text')")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    parser.add_argument("--max-p99-ms", type=float, default=DEFAULT_MAX_P99_MS, help="Exit 1 if p99 handling latency exceeds this")
+    parser.add_argument("--max-stall-ms", type=float, default=DEFAULT_MAX_STALL_MS, help="Exit 1 if the longest GUI event-loop stall exceeds this")
+    args = parser.parse_args()
+
+    if args.replay:
+        records = replay_chat(args.replay, args.messages)
+    else:
+        records = synthetic_chat(args.messages, args.repeat_ratio, args.entry_ratio, args.join_command, args.seed)
+
+    report = run_app_mode(records, args) if args.mode == "app" else run_ingest_mode(records, args)
+    failures = threshold_failures(report, args.max_p99_ms, args.max_stall_ms)
+
+    if args.json:
+        report["failures"] = failures
+        print(json.dumps(report, indent=2))
+        return 1 if failures else 0
+
+    print("=" * 60)
+    print(f"CHAT LOAD HARNESS - {args.mode} mode, target {args.rate:g} msg/s")
+    print("=" * 60)
+    for key, value in report.items():
+        print(f"{key:22} | {value}")
+    print("=" * 60)
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
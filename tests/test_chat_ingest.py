@@ -0,0 +1,29 @@
+from chat_ingest import ChatMessage, MessageDeduplicator
+
+
+def _message(message_id):
+    return ChatMessage("viewer", "!join", message_id=message_id)
+
+
+def test_second_copy_is_a_duplicate():
+    dedup = MessageDeduplicator()
+    assert not dedup.is_duplicate(_message("a"))
+    assert dedup.is_duplicate(_message("a"))
+    assert (dedup.checks, dedup.hits, dedup.hit_rate) == (2, 1, 0.5)
+
+
+def test_messages_without_id_are_never_duplicates():
+    dedup = MessageDeduplicator()
+    assert not dedup.is_duplicate(_message(None))
+    assert not dedup.is_duplicate(_message(None))
+    assert dedup.checks == 0
+
+
+def test_capacity_evicts_least_recently_seen():
+    dedup = MessageDeduplicator(capacity=2)
+    for message_id in ("a", "b"):
+        dedup.is_duplicate(_message(message_id))
+    assert dedup.is_duplicate(_message("a"))  # Refreshes "a"; "b" is now the oldest
+    dedup.is_duplicate(_message("c"))
+    assert not dedup.is_duplicate(_message("b"))
+    assert dedup.is_duplicate(_message("c"))
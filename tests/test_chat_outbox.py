@@ -0,0 +1,22 @@
+from chat_outbox import split_message
+
+
+def test_short_message_is_unchanged():
+    assert split_message("hello", limit=10) == ["hello"]
+
+
+def test_splits_on_separator_boundaries():
+    parts = split_message("aaaa | bbbb | cccc", limit=11)
+    assert parts == ["aaaa | bbbb", "cccc"]
+
+
+def test_long_piece_splits_on_spaces():
+    text = "word " * 30
+    parts = split_message(text.strip(), limit=22)
+    assert all(len(part) <= 22 for part in parts)
+    assert " ".join(parts).split() == text.split()
+
+
+def test_unbroken_text_is_cut_at_the_limit():
+    parts = split_message("x" * 25, limit=10)
+    assert parts == ["x" * 10, "x" * 10, "x" * 5]
@@ -0,0 +1,61 @@
+import time
+
+import pytest
+from PyQt6.QtCore import QCoreApplication, QEventLoop, QTimer
+
+from deadline_scheduler import DeadlineScheduler
+
+
+@pytest.fixture
+def app():
+    return QCoreApplication.instance() or QCoreApplication([])
+
+
+def _run_for(seconds):
+    loop = QEventLoop()
+    QTimer.singleShot(int(seconds * 1000), loop.quit)
+    loop.exec()
+
+
+def test_calls_run_in_deadline_order(app):
+    scheduler = DeadlineScheduler()
+    fired = []
+    scheduler.call_later(0.06, lambda: fired.append("late"))
+    scheduler.call_later(0.02, lambda: fired.append("early"))
+    scheduler.call_later(0.0, lambda: fired.append("now"))
+    _run_for(0.15)
+    assert fired == ["now", "early", "late"]
+    assert scheduler.pending == 0
+
+
+def test_cancelled_calls_do_not_run(app):
+    scheduler = DeadlineScheduler()
+    fired = []
+    token = scheduler.call_later(0.02, lambda: fired.append("cancelled"))
+    scheduler.call_later(0.03, lambda: fired.append("kept"))
+    token.cancel()
+    assert scheduler.pending == 1
+    _run_for(0.1)
+    assert fired == ["kept"]
+
+
+def test_countdown_runs_cues_seconds_and_expiry(app):
+    scheduler = DeadlineScheduler()
+    events = []
+    started = time.monotonic()
+    scheduler.countdown(0.05, lambda: events.append(("expired", time.monotonic() - started)),
+                        cues=[(0.01, lambda: events.append(("cue", None)))],
+                        on_second=lambda left: events.append(("second", left)))
+    _run_for(0.15)
+    assert [kind for kind, _ in events] == ["second", "cue", "expired"]
+    assert events[-1][1] >= 0.05
+
+
+def test_clear_cancels_everything(app):
+    scheduler = DeadlineScheduler()
+    fired = []
+    token = scheduler.countdown(0.02, lambda: fired.append("expired"))
+    scheduler.call_later(0.01, lambda: fired.append("call"))
+    scheduler.clear()
+    _run_for(0.05)
+    assert fired == [] and token.cancelled and scheduler.pending == 0
@@ -0,0 +1,23 @@
+from email.utils import formatdate
+
+from esi_cache import expiry_from_headers
+
+NOW = 1_700_000_000.0
+
+
+def test_max_age_wins():
+    assert expiry_from_headers({"Cache-Control": "public, max-age=300"}, now=NOW) == NOW + 300
+
+
+def test_no_cache_and_no_store_expire_now():
+    assert expiry_from_headers({"Cache-Control": "no-cache", "Expires": formatdate(NOW + 60, usegmt=True)}, now=NOW) == NOW
+    assert expiry_from_headers({"Cache-Control": "no-store"}, now=NOW) == NOW
+
+
+def test_expires_header():
+    assert expiry_from_headers({"Expires": formatdate(NOW + 120, usegmt=True)}, now=NOW) == NOW + 120
+
+
+def test_missing_or_invalid_headers_expire_now():
+    assert expiry_from_headers({}, now=NOW) == NOW
+    assert expiry_from_headers({"Expires": "not a date"}, now=NOW) == NOW
@@ -0,0 +1,38 @@
+from irc_fallback import parse_privmsg, unescape_tag_value
+
+
+def test_tagged_privmsg():
+    line = (b"@badges=subscriber/12,vip/1;display-name=Some\\sPilot;id=abc-123;user-id=4242 "
+            b":somepilot!somepilot@somepilot.tmi.twitch.tv PRIVMSG #channel :!join now")
+    record = parse_privmsg(line)
+    assert record.login == "somepilot"
+    assert record.display_name == "Some Pilot"
+    assert record.user_id == 4242
+    assert record.message_id == "abc-123"
+    assert record.badges == {"subscriber": "12", "vip": "1"}
+    assert record.text == "!join now"
+
+
+def test_untagged_privmsg():
+    record = parse_privmsg(b":viewer!viewer@viewer.tmi.twitch.tv PRIVMSG #channel :hello : world")
+    assert (record.login, record.display_name, record.text) == ("viewer", "viewer", "hello : world")
+    assert record.user_id is None and record.message_id is None
+
+
+def test_non_privmsg_lines_are_ignored():
+    assert parse_privmsg(b"PING :tmi.twitch.tv") is None
+    assert parse_privmsg(b":tmi.twitch.tv 001 bot :Welcome, GLHF!") is None
+    assert parse_privmsg(b"@badge-info= :tmi.twitch.tv USERSTATE #channel") is None
+    assert parse_privmsg(b"@no-space-after-tags") is None
+
+
+def test_tag_value_unescaping():
+    assert unescape_tag_value("plain") == "plain"
+    assert unescape_tag_value(r"a\sb\:c\\d\re\nf") == "a b;c\\d\re\nf"
+    assert unescape_tag_value(r"\xunknown") == "xunknown"
+    assert unescape_tag_value("trailing\\") == "trailing"
+
+
+def test_display_name_is_unescaped():
+    line = b"@display-name=Semi\\:colon\\sName :semi!semi@semi.tmi.twitch.tv PRIVMSG #channel :hi"
+    assert parse_privmsg(line).display_name == "Semi;colon Name"
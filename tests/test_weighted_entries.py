@@ -0,0 +1,59 @@
+import random
+
+from weighted_entries import WeightedEntrantPool
+
+
+def test_add_discard_and_total():
+    pool = WeightedEntrantPool()
+    pool.add("alice", 1.0)
+    pool.add("bob", 2.5)
+    assert len(pool) == 2 and pool.total == 350
+    pool.add("alice", 3.0)  # Re-adding updates the weight
+    assert pool.weight("alice") == 3.0 and pool.total == 550
+    assert pool.discard("bob") and not pool.discard("bob")
+    assert "bob" not in pool and pool.total == 300
+
+
+def test_grows_past_initial_capacity():
+    pool = WeightedEntrantPool()
+    for i in range(1000):
+        pool.add(f"user{i}")
+    assert len(pool) == 1000 and pool.total == 100000
+    assert pool.odds("user999") == 1 / 1000
+
+
+def test_sample_is_distinct_and_leaves_pool_unchanged():
+    pool = WeightedEntrantPool()
+    for i in range(50):
+        pool.add(f"user{i}", 1 + i % 3)
+    total = pool.total
+    winners = pool.sample(10, random.Random(7))
+    assert len(winners) == 10 and len(set(winners)) == 10
+    assert all(name in pool for name in winners)
+    assert pool.total == total
+
+
+def test_sample_caps_at_pool_size():
+    pool = WeightedEntrantPool()
+    pool.add("alice")
+    pool.add("bob")
+    assert sorted(pool.sample(5, random.Random(1))) == ["alice", "bob"]
+    assert WeightedEntrantPool().sample(3) == []
+
+
+def test_sample_follows_weights():
+    pool = WeightedEntrantPool()
+    pool.add("heavy", 9.0)
+    pool.add("light", 1.0)
+    rng = random.Random(42)
+    first = [pool.sample(1, rng)[0] for _ in range(2000)]
+    assert 0.85 < first.count("heavy") / len(first) < 0.95
+
+
+def test_pick_skips_discarded_entrants():
+    pool = WeightedEntrantPool()
+    for name in ("alice", "bob", "carol"):
+        pool.add(name)
+    pool.discard("bob")
+    rng = random.Random(3)
+    assert {pool.pick(rng) for _ in range(200)} == {"alice", "carol"}
@@ -6,7 +6,7 @@ import sys
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
-    QPushButton, QListWidget, QFrame, QSizePolicy,
+    QPushButton, QListView, QFrame, QSizePolicy,
     QStackedWidget, QGridLayout, QTextEdit, QComboBox, QApplication, QCheckBox
 )
 from PyQt6.QtCore import Qt, QRect, QTimer
@@ -252,9 +252,11 @@ class UIManager:
         # --- Entrants Panel ---
         self.app.entrants_panel_widget = QWidget(self.app); self.app.entrants_panel_widget.setObjectName(WIDGET_NAME_ENTRANTS); entrants_layout = QVBoxLayout(self.app.entrants_panel_widget); entrants_layout.setContentsMargins(5, 5, 5, 5); entrants_layout.setSpacing(4);
         self.app.entries_count_label = QLabel("ENTRIES: 0"); self.app.entries_count_label.setFont(self.app.fonts["entries_count"]);
-        self.app.participant_list = QListWidget(); self.app.participant_list.setFont(self.app.fonts["list"]); self.app.participant_list.setToolTip("List of users who have entered.");
+        self.app.participant_filter_input = QLineEdit(); self.app.participant_filter_input.setFont(self.app.fonts["list"]); self.app.participant_filter_input.setPlaceholderText("Filter entrants..."); self.app.participant_filter_input.setClearButtonEnabled(True);
+        self.app.participant_list = QListView(); self.app.participant_list.setFont(self.app.fonts["list"]); self.app.participant_list.setToolTip("List of users who have entered.");
+        self.app.participant_list.setUniformItemSizes(True); self.app.participant_list.setModel(self.app.participant_proxy);
         self.app.remove_selected_button = QPushButton("REMOVE SELECTED"); self.app.remove_selected_button.setFont(self.app.fonts["Shentox-SemiBold"]);
-        entrants_layout.addWidget(self.app.entries_count_label); entrants_layout.addWidget(self.app.participant_list, 1); entrants_layout.addWidget(self.app.remove_selected_button);
+        entrants_layout.addWidget(self.app.entries_count_label); entrants_layout.addWidget(self.app.participant_filter_input); entrants_layout.addWidget(self.app.participant_list, 1); entrants_layout.addWidget(self.app.remove_selected_button);
         self.app.entrants_panel_widget.setMinimumWidth(180); self.app.entrants_panel_widget.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Preferred);
 
         # --- Main Stacked Widget (Info Panel / Animation Panel) ---
@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+"""
+Weighted Entrant Pool for winner draws
+Entries live in a Fenwick (binary indexed) tree of integer weights, so adding,
+removing and drawing a weighted winner are all O(log n).
+"""
+
+import random
+
+WEIGHT_SCALE = 100            # Weights are stored as integer hundredths (exact sums, no float drift)
+LOYALTY_MIN_SUB_MONTHS = 12   # Subscriber badge months needed for the loyalty multiplier
+INITIAL_CAPACITY = 64
+
+
+def entry_weight(record, config):
+    """Entry weight (float) for a ChatMessage record under the current weighted-entry settings."""
+    if record is None or not config.get("weighted_entries_enabled", False):
+        return 1.0
+    weight = 1.0
+    badges = record.badges
+    if record.is_subscriber:
+        weight *= config.get("subscriber_entry_multiplier", 1.0)
+        # Subscriber badge versions are months, offset by 1000/2000 for tier 2/3 (e.g. "2012")
+        try:
+            months = int(badges.get("subscriber") or 0) % 1000
+        except ValueError:
+            months = 0
+        if months >= LOYALTY_MIN_SUB_MONTHS:
+            weight *= config.get("loyalty_entry_multiplier", 1.0)
+    if "bits" in badges:
+        weight *= config.get("bits_entry_multiplier", 1.0)
+    return weight
+
+
+class WeightedEntrantPool:
+    """Entrant name -> weight, with O(log n) add/discard/weighted pick."""
+
+    def __init__(self):
+        self._capacity = INITIAL_CAPACITY
+        self._tree = [0] * (self._capacity + 1)  # 1-based Fenwick tree over slot weights
+        self._weights = [0] * self._capacity     # Raw weight per slot
+        self._names = [None] * self._capacity    # Entrant name per slot
+        self._slot_by_name = {}
+        self._free_slots = []
+        self._next_slot = 0
+        self.total = 0
+
+    # --- Fenwick primitives ---
+    def _update(self, slot, delta):
+        i = slot + 1
+        tree, size = self._tree, self._capacity
+        while i <= size:
+            tree[i] += delta
+            i += i & -i
+
+    def _find(self, target):
+        """Smallest slot whose prefix sum exceeds target (0 <= target < total)."""
+        pos, step = 0, 1 << self._capacity.bit_length()
+        tree, size = self._tree, self._capacity
+        while step:
+            nxt = pos + step
+            if nxt <= size and tree[nxt] <= target:
+                pos = nxt
+                target -= tree[nxt]
+            step >>= 1
+        return pos  # 0-based slot index
+
+    def _grow(self):
+        """Double the capacity and rebuild the tree in O(n)."""
+        self._capacity *= 2
+        self._weights.extend([0] * (self._capacity - len(self._weights)))
+        self._names.extend([None] * (self._capacity - len(self._names)))
+        tree = [0] + list(self._weights)
+        for i in range(1, self._capacity + 1):
+            parent = i + (i & -i)
+            if parent <= self._capacity:
+                tree[parent] += tree[i]
+        self._tree = tree
+
+    # --- Pool operations ---
+    def add(self, name, weight=1.0):
+        """Add an entrant (or update their weight if already present)."""
+        scaled = max(1, int(round(weight * WEIGHT_SCALE)))
+        slot = self._slot_by_name.get(name)
+        if slot is not None:
+            self._set_slot_weight(slot, scaled)
+            return
+        if self._free_slots:
+            slot = self._free_slots.pop()
+        else:
+            if self._next_slot >= self._capacity:
+                self._grow()
+            slot = self._next_slot
+            self._next_slot += 1
+        self._slot_by_name[name] = slot
+        self._names[slot] = name
+        self._set_slot_weight(slot, scaled)
+
+    def _set_slot_weight(self, slot, scaled):
+        delta = scaled - self._weights[slot]
+        if delta:
+            self._weights[slot] = scaled
+            self._update(slot, delta)
+            self.total += delta
+
+    def discard(self, name):
+        """Remove an entrant. Returns False if they were not in the pool."""
+        slot = self._slot_by_name.pop(name, None)
+        if slot is None:
+            return False
+        self._set_slot_weight(slot, 0)
+        self._names[slot] = None
+        self._free_slots.append(slot)
+        return True
+
+    def pick(self, rng=random):
+        """Draw one entrant name with probability proportional to weight, or None if empty."""
+        if self.total <= 0:
+            return None
+        return self._names[self._find(rng.randrange(self.total))]
+
+    def sample(self, count, rng=random):
+        """Draw up to `count` distinct entrants in one pass (weighted, without replacement)."""
+        picked = []
+        for _ in range(min(count, len(self._slot_by_name))):
+            slot = self._find(rng.randrange(self.total))
+            picked.append((slot, self._weights[slot]))
+            self._set_slot_weight(slot, 0)
+        for slot, scaled in picked:  # Restore the pool; winners are removed later as they confirm/time out
+            self._set_slot_weight(slot, scaled)
+        return [self._names[slot] for slot, _ in picked]
+
+    def weight(self, name):
+        slot = self._slot_by_name.get(name)
+        return self._weights[slot] / WEIGHT_SCALE if slot is not None else 0.0
+
+    def odds(self, name):
+        """Chance (0..1) that the next pick is this entrant."""
+        slot = self._slot_by_name.get(name)
+        return self._weights[slot] / self.total if slot is not None and self.total else 0.0
+
+    def clear(self):
+        self.__init__()
+
+    def __contains__(self, name):
+        return name in self._slot_by_name
+
+    def __len__(self):
+        return len(self._slot_by_name)